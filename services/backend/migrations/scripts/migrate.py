@@ -6,6 +6,7 @@ from psycopg_pool import AsyncConnectionPool
 from psycopg import AsyncConnection
 from psycopg import sql
 
+from db.invalidation import notify_invalidation, InvalidationTopic
 from settings.logging_config import get_logger
 
 logger = get_logger(__name__, "migrations")
@@ -102,6 +103,7 @@ class DatabaseMigrator:
             for version in pending_migrations:
                 await self.apply_migration(connection, version)
 
+            await notify_invalidation(connection, InvalidationTopic.ALL)
             logger.info("All migrations applied successfully")
 
     async def get_migration_status(self) -> dict:
@@ -6,6 +6,7 @@ from psycopg_pool import AsyncConnectionPool
 from psycopg import AsyncConnection
 from psycopg import sql
 
+from db.invalidation import notify_invalidation, InvalidationTopic
 from settings.logging_config import get_logger
 
 logger = get_logger(__name__, "rollbacks")
@@ -101,6 +102,7 @@ class DatabaseRollbacker:
             logger.info(f"Rolling back latest migration: {latest_migration}")
 
             await self.rollback_migration(connection, latest_migration)
+            await notify_invalidation(connection, InvalidationTopic.ALL)
             logger.info("Latest migration rolled back successfully")
 
     async def rollback_to_version(self, target_version: str) -> None:
@@ -133,6 +135,7 @@ class DatabaseRollbacker:
             for version in migrations_to_rollback:
                 await self.rollback_migration(connection, version)
 
+            await notify_invalidation(connection, InvalidationTopic.ALL)
             logger.info(f"Successfully rolled back to version {target_version}")
 
     async def get_rollback_status(self) -> dict:
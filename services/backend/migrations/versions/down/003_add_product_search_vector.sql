@@ -0,0 +1,14 @@
+-- Migration: 003_add_product_search_vector
+-- Description: Rollback generated search_vector column from catalog_products table
+-- Created: 2026-10-17
+
+-- Restore expression index
+CREATE INDEX IF NOT EXISTS idx_catalog_products_display_tsv
+ON catalog_products USING GIN (to_tsvector('public.english_unaccent', product_display_name));
+
+-- Drop index
+DROP INDEX IF EXISTS idx_catalog_products_search_vector;
+
+-- Drop search_vector column
+ALTER TABLE catalog_products
+DROP COLUMN IF EXISTS search_vector;
@@ -0,0 +1,25 @@
+-- Migration: 004_add_product_category_keys
+-- Description: Rollback denormalized category keys from catalog_products table
+-- Created: 2026-10-17
+
+-- Drop indexes
+DROP INDEX IF EXISTS idx_catalog_products_article_type_id;
+DROP INDEX IF EXISTS idx_catalog_products_sub_category_year_id;
+DROP INDEX IF EXISTS idx_catalog_products_sub_category_id;
+DROP INDEX IF EXISTS idx_catalog_products_master_category_year_id;
+DROP INDEX IF EXISTS idx_catalog_products_master_category_id;
+
+-- Drop triggers
+DROP TRIGGER IF EXISTS trg_catalog_sub_category_category_keys ON catalog_sub_category;
+DROP TRIGGER IF EXISTS trg_catalog_article_type_category_keys ON catalog_article_type;
+DROP TRIGGER IF EXISTS trg_catalog_products_category_keys ON catalog_products;
+
+-- Drop trigger functions
+DROP FUNCTION IF EXISTS catalog_sub_category_sync_category_keys();
+DROP FUNCTION IF EXISTS catalog_article_type_sync_category_keys();
+DROP FUNCTION IF EXISTS catalog_products_set_category_keys();
+
+-- Drop category key columns
+ALTER TABLE catalog_products
+DROP COLUMN IF EXISTS sub_category_id,
+DROP COLUMN IF EXISTS master_category_id;
@@ -0,0 +1,16 @@
+-- Migration: 005_add_catalog_data_version
+-- Description: Rollback catalog data version tracking
+-- Created: 2026-10-17
+
+-- Drop triggers
+DROP TRIGGER IF EXISTS trg_catalog_article_type_data_version ON catalog_article_type;
+DROP TRIGGER IF EXISTS trg_catalog_sub_category_data_version ON catalog_sub_category;
+DROP TRIGGER IF EXISTS trg_catalog_master_category_data_version ON catalog_master_category;
+DROP TRIGGER IF EXISTS trg_catalog_products_data_version ON catalog_products;
+
+-- Drop functions
+DROP FUNCTION IF EXISTS catalog_bump_data_version_trigger();
+DROP FUNCTION IF EXISTS catalog_bump_data_version();
+
+-- Drop version table
+DROP TABLE IF EXISTS catalog_data_version;
@@ -0,0 +1,12 @@
+-- Migration: 006_add_product_change_notifications
+-- Description: Rollback product change notifications
+-- Created: 2026-10-17
+
+-- Drop triggers
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_truncate ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_delete ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_update ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_insert ON catalog_products;
+
+-- Drop function
+DROP FUNCTION IF EXISTS catalog_notify_product_changes();
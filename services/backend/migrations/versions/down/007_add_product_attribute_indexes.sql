@@ -0,0 +1,16 @@
+-- Migration: 007_add_product_attribute_indexes
+-- Description: Rollback base colour, season and usage type filter indexes
+-- Created: 2026-10-17
+
+-- Drop lookup name indexes
+DROP INDEX IF EXISTS idx_catalog_usage_type_lower_name;
+DROP INDEX IF EXISTS idx_catalog_season_lower_name;
+DROP INDEX IF EXISTS idx_catalog_base_colour_lower_name;
+
+-- Drop attribute indexes
+DROP INDEX IF EXISTS idx_catalog_products_article_type_base_colour_id;
+DROP INDEX IF EXISTS idx_catalog_products_usage_type_id;
+DROP INDEX IF EXISTS idx_catalog_products_season_year_id;
+DROP INDEX IF EXISTS idx_catalog_products_season_id;
+DROP INDEX IF EXISTS idx_catalog_products_base_colour_year_id;
+DROP INDEX IF EXISTS idx_catalog_products_base_colour_id;
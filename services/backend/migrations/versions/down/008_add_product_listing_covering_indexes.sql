@@ -0,0 +1,11 @@
+-- Migration: 008_add_product_listing_covering_indexes
+-- Description: Rollback covering indexes for gender and year listings
+-- Created: 2026-10-17
+
+-- Restore default autovacuum settings
+ALTER TABLE catalog_products RESET (autovacuum_vacuum_insert_scale_factor);
+
+-- Drop covering indexes
+DROP INDEX IF EXISTS idx_catalog_products_gender_year_id_covering;
+DROP INDEX IF EXISTS idx_catalog_products_gender_id_covering;
+DROP INDEX IF EXISTS idx_catalog_products_year_id_covering;
@@ -0,0 +1,6 @@
+-- Migration: 009_add_category_facets_view
+-- Description: Rollback precomputed category facet counts
+-- Created: 2026-10-17
+
+-- Drop materialized view with its indexes
+DROP MATERIALIZED VIEW IF EXISTS catalog_category_facets;
@@ -0,0 +1,80 @@
+-- Migration: 010_add_cache_invalidation_settings
+-- Description: Rollback cache invalidation settings, restoring the trigger arguments of migration 006
+-- Created: 2026-10-17
+
+-- Drop triggers reading the settings table
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_truncate ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_delete ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_update ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_insert ON catalog_products;
+
+-- Restore the function and triggers of migration 006
+CREATE OR REPLACE FUNCTION catalog_notify_product_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    channel TEXT := TG_ARGV[0];
+    max_keys INTEGER := TG_ARGV[1]::INTEGER;
+    changed_keys TEXT[];
+    changed_key TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM new_rows,
+             LATERAL (VALUES ('id:' || new_rows.product_id), ('slug:' || new_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM (
+            SELECT product_id, slug FROM old_rows
+            UNION ALL
+            SELECT product_id, slug FROM new_rows
+        ) AS changed_rows,
+             LATERAL (VALUES ('id:' || changed_rows.product_id), ('slug:' || changed_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM old_rows,
+             LATERAL (VALUES ('id:' || old_rows.product_id), ('slug:' || old_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    END IF;
+
+    IF TG_OP <> 'TRUNCATE' AND changed_keys IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'TRUNCATE' OR cardinality(changed_keys) > max_keys THEN
+        PERFORM pg_notify(channel, json_build_object('topic', 'products', 'key', NULL)::TEXT);
+        RETURN NULL;
+    END IF;
+
+    FOREACH changed_key IN ARRAY changed_keys LOOP
+        PERFORM pg_notify(channel, json_build_object('topic', 'product', 'key', changed_key)::TEXT);
+    END LOOP;
+    PERFORM pg_notify(channel, json_build_object('topic', 'facets', 'key', NULL)::TEXT);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables require one trigger per event
+CREATE TRIGGER trg_catalog_products_notify_insert
+AFTER INSERT ON catalog_products
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+CREATE TRIGGER trg_catalog_products_notify_update
+AFTER UPDATE ON catalog_products
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+CREATE TRIGGER trg_catalog_products_notify_delete
+AFTER DELETE ON catalog_products
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+CREATE TRIGGER trg_catalog_products_notify_truncate
+AFTER TRUNCATE ON catalog_products
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+-- Drop settings table
+DROP TABLE IF EXISTS cache_invalidation_settings;
@@ -0,0 +1,15 @@
+-- Migration: 003_add_product_search_vector
+-- Description: Store product full-text vector in a generated column so search and ranking do not recompute to_tsvector per row
+-- Created: 2026-10-17
+
+-- Add generated tsvector column
+ALTER TABLE catalog_products
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (to_tsvector('public.english_unaccent', COALESCE(product_display_name, ''))) STORED;
+
+-- Add GIN index on the stored vector
+CREATE INDEX IF NOT EXISTS idx_catalog_products_search_vector
+ON catalog_products USING GIN (search_vector);
+
+-- Drop expression index superseded by the stored vector
+DROP INDEX IF EXISTS idx_catalog_products_display_tsv;
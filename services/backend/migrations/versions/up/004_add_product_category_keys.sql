@@ -0,0 +1,89 @@
+-- Migration: 004_add_product_category_keys
+-- Description: Denormalize master/sub category ids onto catalog_products so category listings filter without joins
+-- Created: 2026-10-17
+
+-- Add category key columns
+ALTER TABLE catalog_products
+ADD COLUMN IF NOT EXISTS master_category_id INT REFERENCES catalog_master_category(master_category_id),
+ADD COLUMN IF NOT EXISTS sub_category_id INT REFERENCES catalog_sub_category(sub_category_id);
+
+-- Fill category keys for all existing records
+UPDATE catalog_products p
+SET master_category_id = sc.master_category_id,
+    sub_category_id = sc.sub_category_id
+FROM catalog_article_type at
+JOIN catalog_sub_category sc ON at.sub_category_id = sc.sub_category_id
+WHERE p.article_type_id = at.article_type_id;
+
+-- Keep product category keys in sync with article_type_id
+CREATE OR REPLACE FUNCTION catalog_products_set_category_keys()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT sc.master_category_id, sc.sub_category_id
+    INTO NEW.master_category_id, NEW.sub_category_id
+    FROM catalog_article_type at
+    JOIN catalog_sub_category sc ON at.sub_category_id = sc.sub_category_id
+    WHERE at.article_type_id = NEW.article_type_id;
+
+    IF NOT FOUND THEN
+        NEW.master_category_id := NULL;
+        NEW.sub_category_id := NULL;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_catalog_products_category_keys
+BEFORE INSERT OR UPDATE OF article_type_id, master_category_id, sub_category_id ON catalog_products
+FOR EACH ROW EXECUTE FUNCTION catalog_products_set_category_keys();
+
+-- Propagate article types moved to another sub category
+CREATE OR REPLACE FUNCTION catalog_article_type_sync_category_keys()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE catalog_products
+    SET article_type_id = article_type_id
+    WHERE article_type_id = NEW.article_type_id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_catalog_article_type_category_keys
+AFTER UPDATE OF sub_category_id ON catalog_article_type
+FOR EACH ROW WHEN (OLD.sub_category_id IS DISTINCT FROM NEW.sub_category_id)
+EXECUTE FUNCTION catalog_article_type_sync_category_keys();
+
+-- Propagate sub categories moved to another master category
+CREATE OR REPLACE FUNCTION catalog_sub_category_sync_category_keys()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE catalog_products
+    SET master_category_id = NEW.master_category_id
+    WHERE sub_category_id = NEW.sub_category_id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_catalog_sub_category_category_keys
+AFTER UPDATE OF master_category_id ON catalog_sub_category
+FOR EACH ROW WHEN (OLD.master_category_id IS DISTINCT FROM NEW.master_category_id)
+EXECUTE FUNCTION catalog_sub_category_sync_category_keys();
+
+-- Add composite indexes for category listings ordered by id or year
+CREATE INDEX IF NOT EXISTS idx_catalog_products_master_category_id
+ON catalog_products(master_category_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_master_category_year_id
+ON catalog_products(master_category_id, year, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_sub_category_id
+ON catalog_products(sub_category_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_sub_category_year_id
+ON catalog_products(sub_category_id, year, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_article_type_id
+ON catalog_products(article_type_id, id);
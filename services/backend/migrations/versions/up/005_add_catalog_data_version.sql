@@ -0,0 +1,48 @@
+-- Migration: 005_add_catalog_data_version
+-- Description: Track a catalog data version, bumped on every catalog write, to drive HTTP ETags
+-- Created: 2026-10-17
+
+-- Single-row version table
+CREATE TABLE IF NOT EXISTS catalog_data_version (
+    id         SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version    BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO catalog_data_version (id) VALUES (1)
+ON CONFLICT (id) DO NOTHING;
+
+-- Bump function, also called directly by jobs changing data outside catalog tables
+CREATE OR REPLACE FUNCTION catalog_bump_data_version()
+RETURNS BIGINT AS $$
+    UPDATE catalog_data_version
+    SET version = version + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = 1
+    RETURNING version;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION catalog_bump_data_version_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM catalog_bump_data_version();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Bump once per writing statement on catalog tables
+CREATE TRIGGER trg_catalog_products_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON catalog_products
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_bump_data_version_trigger();
+
+CREATE TRIGGER trg_catalog_master_category_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON catalog_master_category
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_bump_data_version_trigger();
+
+CREATE TRIGGER trg_catalog_sub_category_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON catalog_sub_category
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_bump_data_version_trigger();
+
+CREATE TRIGGER trg_catalog_article_type_data_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON catalog_article_type
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_bump_data_version_trigger();
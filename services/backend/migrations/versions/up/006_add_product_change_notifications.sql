@@ -0,0 +1,73 @@
+-- Migration: 006_add_product_change_notifications
+-- Description: Publish cache invalidations on the invalidation bus channel when products change
+-- Created: 2026-10-17
+
+-- Trigger arguments: notification channel and the maximum number of product keys
+-- published individually. Larger statements publish a single "products" message
+-- that drops every product cache instead.
+CREATE OR REPLACE FUNCTION catalog_notify_product_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    channel TEXT := TG_ARGV[0];
+    max_keys INTEGER := TG_ARGV[1]::INTEGER;
+    changed_keys TEXT[];
+    changed_key TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM new_rows,
+             LATERAL (VALUES ('id:' || new_rows.product_id), ('slug:' || new_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM (
+            SELECT product_id, slug FROM old_rows
+            UNION ALL
+            SELECT product_id, slug FROM new_rows
+        ) AS changed_rows,
+             LATERAL (VALUES ('id:' || changed_rows.product_id), ('slug:' || changed_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM old_rows,
+             LATERAL (VALUES ('id:' || old_rows.product_id), ('slug:' || old_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    END IF;
+
+    IF TG_OP <> 'TRUNCATE' AND changed_keys IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'TRUNCATE' OR cardinality(changed_keys) > max_keys THEN
+        PERFORM pg_notify(channel, json_build_object('topic', 'products', 'key', NULL)::TEXT);
+        RETURN NULL;
+    END IF;
+
+    FOREACH changed_key IN ARRAY changed_keys LOOP
+        PERFORM pg_notify(channel, json_build_object('topic', 'product', 'key', changed_key)::TEXT);
+    END LOOP;
+    PERFORM pg_notify(channel, json_build_object('topic', 'facets', 'key', NULL)::TEXT);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables require one trigger per event
+CREATE TRIGGER trg_catalog_products_notify_insert
+AFTER INSERT ON catalog_products
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+CREATE TRIGGER trg_catalog_products_notify_update
+AFTER UPDATE ON catalog_products
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+CREATE TRIGGER trg_catalog_products_notify_delete
+AFTER DELETE ON catalog_products
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
+
+CREATE TRIGGER trg_catalog_products_notify_truncate
+AFTER TRUNCATE ON catalog_products
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes('cache_invalidation', '200');
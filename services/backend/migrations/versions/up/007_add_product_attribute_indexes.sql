@@ -0,0 +1,33 @@
+-- Migration: 007_add_product_attribute_indexes
+-- Description: Index base colour, season and usage type filters for listings ordered by id or year
+-- Created: 2026-10-17
+
+-- Attribute filters ordered by id or year
+CREATE INDEX IF NOT EXISTS idx_catalog_products_base_colour_id
+ON catalog_products(base_colour_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_base_colour_year_id
+ON catalog_products(base_colour_id, year, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_season_id
+ON catalog_products(season_id, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_season_year_id
+ON catalog_products(season_id, year, id);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_products_usage_type_id
+ON catalog_products(usage_type_id, id);
+
+-- Category listings resolve to article_type_id = ANY(...), combined with a colour filter
+CREATE INDEX IF NOT EXISTS idx_catalog_products_article_type_base_colour_id
+ON catalog_products(article_type_id, base_colour_id, id);
+
+-- Filters match lookup names case-insensitively
+CREATE INDEX IF NOT EXISTS idx_catalog_base_colour_lower_name
+ON catalog_base_colour(lower(name));
+
+CREATE INDEX IF NOT EXISTS idx_catalog_season_lower_name
+ON catalog_season(lower(name));
+
+CREATE INDEX IF NOT EXISTS idx_catalog_usage_type_lower_name
+ON catalog_usage_type(lower(name));
@@ -0,0 +1,24 @@
+-- Migration: 008_add_product_listing_covering_indexes
+-- Description: Covering indexes for listings filtered by gender and year and ordered by id or year, so top-N pages are read in index order without sorting
+-- Created: 2026-10-17
+
+-- Listing queries select product_id, gender, year, product_display_name, image_url, slug, id
+-- and order by "id DESC" or "year DESC, id DESC" (id is always appended as tiebreaker)
+
+-- Year range filters and year ordering
+CREATE INDEX IF NOT EXISTS idx_catalog_products_year_id_covering
+ON catalog_products(year DESC, id DESC)
+INCLUDE (gender, product_id, product_display_name, image_url, slug);
+
+-- Gender filters ordered by id
+CREATE INDEX IF NOT EXISTS idx_catalog_products_gender_id_covering
+ON catalog_products(gender, id DESC)
+INCLUDE (year, product_id, product_display_name, image_url, slug);
+
+-- Gender filters combined with year range filters or year ordering
+CREATE INDEX IF NOT EXISTS idx_catalog_products_gender_year_id_covering
+ON catalog_products(gender, year DESC, id DESC)
+INCLUDE (product_id, product_display_name, image_url, slug);
+
+-- Keep the visibility map current so covering indexes are read without heap visits
+ALTER TABLE catalog_products SET (autovacuum_vacuum_insert_scale_factor = 0.05);
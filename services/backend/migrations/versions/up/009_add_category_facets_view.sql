@@ -0,0 +1,39 @@
+-- Migration: 009_add_category_facets_view
+-- Description: Precompute facet counts per article type so category filters without a selection are a single indexed lookup
+-- Created: 2026-10-17
+
+-- Facet counts per article type (with its master and sub category), one row per facet value
+-- plus a total row per article type; facet_grouping has the bit of every facet the row is not grouped by set,
+-- in the same layout as the live facets query, so category counts are sums over article types
+CREATE MATERIALIZED VIEW IF NOT EXISTS catalog_category_facets AS
+SELECT
+    p.master_category_id,
+    p.sub_category_id,
+    p.article_type_id,
+    GROUPING(p.gender, p.year, bc.name, s.name, u.name) AS facet_grouping,
+    p.gender,
+    p.year,
+    bc.name AS colour,
+    s.name AS season,
+    u.name AS usage,
+    COUNT(*) AS product_count
+FROM catalog_products p
+LEFT JOIN catalog_base_colour bc ON bc.base_colour_id = p.base_colour_id
+LEFT JOIN catalog_season s ON s.season_id = p.season_id
+LEFT JOIN catalog_usage_type u ON u.usage_type_id = p.usage_type_id
+WHERE p.article_type_id IS NOT NULL
+GROUP BY
+    p.master_category_id,
+    p.sub_category_id,
+    p.article_type_id,
+    GROUPING SETS ((), (p.gender), (p.year), (bc.name), (s.name), (u.name))
+WITH DATA;
+
+-- Unique index required by REFRESH MATERIALIZED VIEW CONCURRENTLY, also serving article type lookups
+CREATE UNIQUE INDEX IF NOT EXISTS idx_catalog_category_facets_unique
+ON catalog_category_facets(article_type_id, facet_grouping, gender, year, colour, season, usage)
+NULLS NOT DISTINCT;
+
+-- Lookups by category keys when article type ids are not resolved
+CREATE INDEX IF NOT EXISTS idx_catalog_category_facets_category
+ON catalog_category_facets(master_category_id, sub_category_id);
@@ -0,0 +1,92 @@
+-- Migration: 010_add_cache_invalidation_settings
+-- Description: Keep the invalidation channel and the per-key notification limit in one settings row read by triggers and listeners
+-- Created: 2026-10-17
+
+-- Single-row settings table, the only source of the channel name for product triggers,
+-- application listeners and publishers; listeners pick up a changed channel when they reconnect
+CREATE TABLE IF NOT EXISTS cache_invalidation_settings (
+    id               SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    channel          TEXT NOT NULL DEFAULT 'cache_invalidation' CHECK (channel <> ''),
+    max_product_keys INTEGER NOT NULL DEFAULT 200 CHECK (max_product_keys > 0)
+);
+
+INSERT INTO cache_invalidation_settings (id) VALUES (1)
+ON CONFLICT (id) DO NOTHING;
+
+-- Statements changing more than max_product_keys product keys publish a single "products"
+-- message that drops every product cache instead of one message per key
+CREATE OR REPLACE FUNCTION catalog_notify_product_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    notify_channel TEXT;
+    max_keys INTEGER;
+    changed_keys TEXT[];
+    changed_key TEXT;
+BEGIN
+    SELECT settings.channel, settings.max_product_keys INTO notify_channel, max_keys
+    FROM cache_invalidation_settings AS settings
+    WHERE settings.id = 1;
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM new_rows,
+             LATERAL (VALUES ('id:' || new_rows.product_id), ('slug:' || new_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    ELSIF TG_OP = 'UPDATE' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM (
+            SELECT product_id, slug FROM old_rows
+            UNION ALL
+            SELECT product_id, slug FROM new_rows
+        ) AS changed_rows,
+             LATERAL (VALUES ('id:' || changed_rows.product_id), ('slug:' || changed_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT product_key) INTO changed_keys
+        FROM old_rows,
+             LATERAL (VALUES ('id:' || old_rows.product_id), ('slug:' || old_rows.slug)) AS keys(product_key)
+        WHERE product_key IS NOT NULL;
+    END IF;
+
+    IF TG_OP <> 'TRUNCATE' AND changed_keys IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'TRUNCATE' OR cardinality(changed_keys) > max_keys THEN
+        PERFORM pg_notify(notify_channel, json_build_object('topic', 'products', 'key', NULL)::TEXT);
+        RETURN NULL;
+    END IF;
+
+    FOREACH changed_key IN ARRAY changed_keys LOOP
+        PERFORM pg_notify(notify_channel, json_build_object('topic', 'product', 'key', changed_key)::TEXT);
+    END LOOP;
+    PERFORM pg_notify(notify_channel, json_build_object('topic', 'facets', 'key', NULL)::TEXT);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recreate triggers without the channel and limit arguments of migration 006
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_insert ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_update ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_delete ON catalog_products;
+DROP TRIGGER IF EXISTS trg_catalog_products_notify_truncate ON catalog_products;
+
+CREATE TRIGGER trg_catalog_products_notify_insert
+AFTER INSERT ON catalog_products
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes();
+
+CREATE TRIGGER trg_catalog_products_notify_update
+AFTER UPDATE ON catalog_products
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes();
+
+CREATE TRIGGER trg_catalog_products_notify_delete
+AFTER DELETE ON catalog_products
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes();
+
+CREATE TRIGGER trg_catalog_products_notify_truncate
+AFTER TRUNCATE ON catalog_products
+FOR EACH STATEMENT EXECUTE FUNCTION catalog_notify_product_changes();
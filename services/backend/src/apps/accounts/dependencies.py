@@ -1,5 +1,8 @@
-from fastapi import Depends
+from typing import Any, Dict
 
+from fastapi import Depends, HTTPException, status
+
+from apps.accounts.enums.user_groups import UserGroupEnum
 from apps.accounts.interfaces.repositories import (
     UserRepositoryInterface,
     UserGroupRepositoryInterface,
@@ -17,6 +20,8 @@ from db.interfaces import DAOInterface, SQLQueryBuilderInterface
 from notifications.dependencies import get_email_sender_dependency
 from notifications.email.interfaces import EmailSenderInterface
 from security.dependencies import get_password_manager, get_jwt_manager
+from security.exceptions import TokenError
+from security.http import JWTTokenDependency
 from security.interfaces import PasswordManagerInterface, JWTManagerInterface
 
 
@@ -118,3 +123,37 @@ async def get_account_service(
         jwt_manager=jwt_manager,
         email_sender=email_sender
     )
+
+
+async def require_admin(
+        token: JWTTokenDependency,
+        jwt_manager: JWTManagerInterface = Depends(get_jwt_manager)
+) -> Dict[str, Any]:
+    """
+    Dependency guarding internal endpoints: requires the access token of an admin.
+
+    Args:
+        token: Bearer access token from the Authorization header
+        jwt_manager: Manager for JWT token operations
+
+    Returns:
+        Payload of the verified access token
+
+    Raises:
+        HTTPException: 401 if the token is invalid or expired, 403 if the user is not an admin
+    """
+    try:
+        payload = jwt_manager.verify_access_token(token)
+    except TokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e)
+        )
+
+    if payload.get("group_name") != UserGroupEnum.ADMIN.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    return payload
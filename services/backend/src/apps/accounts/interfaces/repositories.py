@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from apps.accounts.dto.users import (
     UserDTO,
@@ -58,6 +58,19 @@ class UserRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_user_and_hashed_password_by_email(self, email: str) -> Tuple[Optional[UserDTO], Optional[str]]:
+        """
+        Get a user and their hashed password by email in a single query
+
+        Args:
+            email: The email of the user
+
+        Returns:
+            Tuple of (UserDTO, hashed password), each None if not found
+        """
+        pass
+
     @abstractmethod
     async def get_user_with_profile_by_id(self, user_id: int) -> Optional[UserWithProfileDTO]:
         """
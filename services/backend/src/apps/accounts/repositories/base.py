@@ -1,9 +1,10 @@
-from typing import Optional, List
+from typing import Any, Optional, List
 
 import psycopg
 
 from apps.accounts.repositories.exceptions import DatabaseQueryError
 from apps.accounts.repositories.mixins import AccountsRepositoryMixin
+from db.dto import BatchQueryDTO
 from db.interfaces import DAOInterface, SQLQueryBuilderInterface
 from settings.logging_config import get_logger
 
@@ -121,6 +122,21 @@ class BaseRepository(AccountsRepositoryMixin):
         else:
             return True
 
+    async def _execute_batch_queries(self, queries: List[BatchQueryDTO], log_prefix: str) -> List[Any]:
+        """Execute independent queries in one pipelined round trip and return their results in order"""
+        for batch_query in queries:
+            logger.info(f"{log_prefix} query: {batch_query.query}")
+            logger.info(f"{log_prefix} params: {batch_query.params}")
+
+        try:
+            return await self._dao.execute_batch(queries)
+        except (psycopg.Error, psycopg.DatabaseError) as e:
+            logger.error(f"Database error in batch query: {e}")
+            raise DatabaseQueryError(f"{log_prefix} failed", e)
+        except Exception as e:
+            logger.error(f"Unexpected error in batch query: {e}")
+            raise DatabaseQueryError(f"{log_prefix} failed with unexpected error", e)
+
     def _build_delete_query(self, table_name: str) -> tuple[str, list]:
         """Build DELETE query using current WHERE conditions"""
         where_conditions = self._query_builder.get_where_conditions()
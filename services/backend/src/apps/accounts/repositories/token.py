@@ -14,6 +14,7 @@ from apps.accounts.repositories.exceptions import (
     TokenDeletionError
 )
 from apps.accounts.repositories.base import BaseRepository
+from db.dto import BatchQueryDTO
 from db.interfaces import DAOInterface, SQLQueryBuilderInterface
 from settings.logging_config import get_logger
 
@@ -225,25 +226,25 @@ class TokenRepository(BaseRepository, TokenRepositoryInterface):
         return result is not None
 
     async def delete_expired_tokens(self) -> int:
-        """Delete all expired tokens"""
+        """Delete all expired tokens in one round trip and return the number of deleted tokens"""
         queries = [
-            f"DELETE FROM {self.APP_NAME}_activation_tokens WHERE expires_at <= CURRENT_TIMESTAMP",
-            f"DELETE FROM {self.APP_NAME}_password_reset_tokens WHERE expires_at <= CURRENT_TIMESTAMP",
-            f"DELETE FROM {self.APP_NAME}_refresh_tokens WHERE expires_at <= CURRENT_TIMESTAMP"
+            BatchQueryDTO(
+                f"WITH deleted AS (DELETE FROM {self.APP_NAME}_{table} WHERE expires_at <= CURRENT_TIMESTAMP "
+                f"RETURNING 1) SELECT COUNT(*) FROM deleted",
+                fetch_one=True
+            )
+            for table in ("activation_tokens", "password_reset_tokens", "refresh_tokens")
         ]
 
-        total_deleted = 0
-        for query in queries:
-            try:
-                result = await self._execute_custom_query_single(query, [], "Delete expired tokens")
-                if result:
-                    total_deleted += 1
-            except Exception as e:
-                if isinstance(e, (psycopg.Error, psycopg.DatabaseError)):
-                    raise TokenDeletionError("Failed to delete expired tokens", e)
-                raise TokenDeletionError("Unexpected error deleting expired tokens", e)
-
-        logger.info(f"Total expired token types deleted: {total_deleted}")
+        try:
+            results = await self._execute_batch_queries(queries, "Delete expired tokens")
+        except Exception as e:
+            if isinstance(e, (psycopg.Error, psycopg.DatabaseError)):
+                raise TokenDeletionError("Failed to delete expired tokens", e)
+            raise TokenDeletionError("Unexpected error deleting expired tokens", e)
+
+        total_deleted = sum(result[0] for result in results if result)
+        logger.info(f"Total expired tokens deleted: {total_deleted}")
         return total_deleted
 
     async def delete_user_refresh_tokens(self, user_id: int) -> int:
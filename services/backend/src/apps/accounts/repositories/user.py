@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import psycopg
 
@@ -46,6 +46,17 @@ class UserRepository(BaseRepository, UserRepositoryInterface):
         result = await self._execute_query_single("Get hashed password by email")
         return result[0] if result else None
 
+    async def get_user_and_hashed_password_by_email(self, email: str) -> Tuple[Optional[UserDTO], Optional[str]]:
+        """Get a user and their hashed password by email in one query"""
+        self._build_user_query()
+        self._query_builder.select("u.hashed_password")
+        self._query_builder.where("u.email = %s", email)
+
+        result = await self._execute_query_single("Get user and hashed password by email")
+        if not result:
+            return None, None
+        return self.map_to_user_dto(result), result[7]
+
     async def get_user_with_profile_by_id(self, user_id: int) -> Optional[UserWithProfileDTO]:
         """Get a user with profile information by ID"""
         self._build_user_query(with_profile=True)
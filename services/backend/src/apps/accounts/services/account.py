@@ -284,7 +284,9 @@ class AccountService(AccountServiceInterface):
         """
         logger.info(f"Starting login process for email: {login_data.email}")
 
-        user = await self._user_repository.get_user_by_email(login_data.email)
+        user, hashed_password = await self._user_repository.get_user_and_hashed_password_by_email(
+            login_data.email
+        )
         if not user:
             logger.warning(f"Login failed: User with email {login_data.email} not found")
             raise UserNotFoundError(f"User with email '{login_data.email}' not found")
@@ -293,7 +295,6 @@ class AccountService(AccountServiceInterface):
             logger.warning(f"Login failed: User with email {login_data.email} is not activated")
             raise UserInactiveError(f"User account with email '{login_data.email}' is not activated")
 
-        hashed_password = await self._user_repository.get_hashed_password_by_email(login_data.email)
         if not hashed_password:
             logger.error(f"Login failed: Could not retrieve password for email {login_data.email}")
             raise InvalidCredentialsError("Invalid email or password")
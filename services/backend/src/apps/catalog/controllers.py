@@ -2,18 +2,22 @@ from dataclasses import asdict
 from typing import Optional
 from urllib.parse import urlencode
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
+from fastapi.responses import StreamingResponse
 
+from apps.catalog.dto.filters import FiltersDTO, CheckboxFilterDTO
+from apps.catalog.enums.export_format import ExportFormatEnum
+from apps.catalog.export import encode_products, gzip_chunks, accepts_gzip
 from apps.catalog.interfaces.services import CatalogServiceInterface
 from apps.catalog.schemas.filters import FiltersResponseSchema, CheckboxFilterSchema, RangeFilterSchema
 from apps.catalog.schemas.responses import (
     ProductListResponseSchema,
     ProductSchema,
-    CategoryMenuResponseSchema,
-    MasterCategorySchema,
-    SubCategorySchema,
-    ArticleTypeSchema
+    ProductBatchResponseSchema,
+    ProductBatchBySlugResponseSchema
 )
+from apps.catalog.services.exceptions import CategoryNotFoundError
+from apps.catalog.specifications.exceptions import InvalidCursorError
 
 
 async def get_product_list_controller(
@@ -23,27 +27,40 @@ async def get_product_list_controller(
         min_year: Optional[int],
         max_year: Optional[int],
         gender: Optional[str],
+        colour: Optional[str],
+        season: Optional[str],
+        usage: Optional[str],
         q: Optional[str],
         catalog_service: CatalogServiceInterface,
+        cursor: Optional[str] = None,
 ) -> ProductListResponseSchema:
-    catalog_dto = await catalog_service.get_products(
-        page=page,
-        per_page=per_page,
-        ordering=ordering,
-        min_year=min_year,
-        max_year=max_year,
-        gender=gender,
-        q=q
-    )
+    try:
+        catalog_dto = await catalog_service.get_products(
+            page=page,
+            per_page=per_page,
+            ordering=ordering,
+            min_year=min_year,
+            max_year=max_year,
+            gender=gender,
+            colour=colour,
+            season=season,
+            usage=usage,
+            q=q,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
 
     products = [ProductSchema(**asdict(product)) for product in catalog_dto.products]
 
-    total_pages = catalog_dto.pagination.total_pages
-
     base_url = "/api/v1.0/catalog/products"
 
-    def build_url_with_params(page_num: int) -> str:
-        params = {'page': page_num, 'per_page': per_page}
+    def build_url_with_params(page_num: Optional[int] = None, next_cursor: Optional[str] = None) -> str:
+        params = {'cursor': next_cursor} if next_cursor else {'page': page_num}
+        params['per_page'] = per_page
         if ordering:
             params['ordering'] = ordering
         if min_year is not None:
@@ -52,22 +69,119 @@ async def get_product_list_controller(
             params['max_year'] = max_year
         if gender:
             params['gender'] = gender
+        if colour:
+            params['colour'] = colour
+        if season:
+            params['season'] = season
+        if usage:
+            params['usage'] = usage
         if q:
             params['q'] = q
         return f"{base_url}?{urlencode(params)}"
 
-    prev_page = build_url_with_params(page - 1) if page > 1 else None
-    next_page = build_url_with_params(page + 1) if page < total_pages else None
+    next_cursor = catalog_dto.pagination.next_cursor
+
+    if cursor:
+        prev_page = None
+        next_page = build_url_with_params(next_cursor=next_cursor) if next_cursor else None
+    else:
+        prev_page = build_url_with_params(page - 1) if page > 1 else None
+        next_page = build_url_with_params(page + 1) if next_cursor else None
 
     return ProductListResponseSchema(
         products=products,
         prev_page=None if not products else prev_page,
         next_page=None if not products else next_page,
+        next_cursor=next_cursor,
         total_pages=catalog_dto.pagination.total_pages,
         total_items=catalog_dto.pagination.total_items,
+        count_mode=catalog_dto.pagination.count_mode,
     )
 
 
+async def export_products_controller(
+        export_format: ExportFormatEnum,
+        ordering: Optional[str],
+        min_year: Optional[int],
+        max_year: Optional[int],
+        gender: Optional[str],
+        colour: Optional[str],
+        season: Optional[str],
+        usage: Optional[str],
+        q: Optional[str],
+        master_category_id: Optional[int],
+        sub_category_id: Optional[int],
+        article_type_id: Optional[int],
+        accept_encoding: Optional[str],
+        batch_size: int,
+        catalog_service: CatalogServiceInterface,
+) -> StreamingResponse:
+    """
+    Controller for streaming every matching product as NDJSON or CSV
+
+    Args:
+        export_format: Output format
+        ordering: Ordering string
+        min_year: Minimum year filter
+        max_year: Maximum year filter
+        gender: Gender filter
+        colour: Base colour filter
+        season: Season filter
+        usage: Usage type filter
+        q: Search query
+        master_category_id: ID of the master category (optional)
+        sub_category_id: ID of the sub-category (optional)
+        article_type_id: ID of the article type (optional)
+        accept_encoding: Value of the Accept-Encoding request header
+        batch_size: Number of rows fetched from the database per round trip
+        catalog_service: Catalog service for data access
+
+    Returns:
+        Streaming response with the serialized products, gzip-compressed if the client accepts it
+
+    Raises:
+        HTTPException: If category filters lack their master category (400) or a category is not found (404)
+    """
+    if master_category_id is None and (sub_category_id is not None or article_type_id is not None):
+        raise HTTPException(
+            status_code=400,
+            detail="master_category_id is required when filtering by subcategory or article type"
+        )
+
+    try:
+        products = await catalog_service.export_products(
+            ordering=ordering,
+            min_year=min_year,
+            max_year=max_year,
+            gender=gender,
+            colour=colour,
+            season=season,
+            usage=usage,
+            q=q,
+            master_category_id=master_category_id,
+            sub_category_id=sub_category_id,
+            article_type_id=article_type_id,
+            batch_size=batch_size
+        )
+    except CategoryNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
+
+    content = encode_products(products, export_format)
+    headers = {
+        "Content-Disposition": f'attachment; filename="catalog.{export_format.value}"',
+        "Vary": "Accept-Encoding"
+    }
+
+    if accepts_gzip(accept_encoding):
+        content = gzip_chunks(content)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(content, media_type=export_format.media_type, headers=headers)
+
+
 async def get_product_by_id_controller(
         product_id: int,
         catalog_service: CatalogServiceInterface,
@@ -96,6 +210,50 @@ async def get_product_by_id_controller(
     return ProductSchema(**asdict(product_dto))
 
 
+async def get_products_by_ids_controller(
+        product_ids: list[int],
+        catalog_service: CatalogServiceInterface,
+) -> ProductBatchResponseSchema:
+    """
+    Controller for getting several products by their IDs
+
+    Args:
+        product_ids: IDs of the products to retrieve
+        catalog_service: Catalog service for data access
+
+    Returns:
+        ProductBatchResponseSchema with found products in requested order and the missing IDs
+    """
+    batch_dto = await catalog_service.get_products_by_ids(product_ids)
+
+    return ProductBatchResponseSchema(
+        products=[ProductSchema(**asdict(product)) for product in batch_dto.products],
+        missing_ids=batch_dto.missing
+    )
+
+
+async def get_products_by_slugs_controller(
+        slugs: list[str],
+        catalog_service: CatalogServiceInterface,
+) -> ProductBatchBySlugResponseSchema:
+    """
+    Controller for getting several products by their slugs
+
+    Args:
+        slugs: Slugs of the products to retrieve
+        catalog_service: Catalog service for data access
+
+    Returns:
+        ProductBatchBySlugResponseSchema with found products in requested order and the missing slugs
+    """
+    batch_dto = await catalog_service.get_products_by_slugs(slugs)
+
+    return ProductBatchBySlugResponseSchema(
+        products=[ProductSchema(**asdict(product)) for product in batch_dto.products],
+        missing_slugs=batch_dto.missing
+    )
+
+
 async def get_product_by_slug_controller(
         slug: str,
         catalog_service: CatalogServiceInterface,
@@ -126,7 +284,13 @@ async def get_product_by_slug_controller(
 
 async def get_filters_controller(
         catalog_service: CatalogServiceInterface,
-        q: Optional[str] = None
+        q: Optional[str] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+        gender: Optional[str] = None,
+        colour: Optional[str] = None,
+        season: Optional[str] = None,
+        usage: Optional[str] = None
 ) -> FiltersResponseSchema:
     """
     Get available filters for products
@@ -134,6 +298,12 @@ async def get_filters_controller(
     Args:
         catalog_service: Catalog service for data access
         q: Optional search query to limit filters to relevant options
+        min_year: Selected minimum year
+        max_year: Selected maximum year
+        gender: Selected gender(s)
+        colour: Selected base colour(s)
+        season: Selected season(s)
+        usage: Selected usage type(s)
 
     Returns:
         Filters response schema
@@ -141,7 +311,7 @@ async def get_filters_controller(
     Raises:
         HTTPException: If the catalog is empty
     """
-    filters_dto = await catalog_service.get_available_filters(q)
+    filters_dto = await catalog_service.get_available_filters(q, min_year, max_year, gender, colour, season, usage)
 
     if filters_dto is None:
         raise HTTPException(
@@ -149,64 +319,43 @@ async def get_filters_controller(
             detail="Catalog is empty. No filters available."
         )
 
-    return FiltersResponseSchema(
-        gender=CheckboxFilterSchema(
-            values=filters_dto.gender.values
-        ) if filters_dto.gender else None,
-        year=RangeFilterSchema(
-            min=filters_dto.year.min,
-            max=filters_dto.year.max
-        ) if filters_dto.year else None
-    )
+    return _filters_to_schema(filters_dto)
 
 
 async def get_category_menu_controller(
-        catalog_service: CatalogServiceInterface
-) -> CategoryMenuResponseSchema:
+        catalog_service: CatalogServiceInterface,
+        if_none_match: Optional[str] = None
+) -> Response:
     """
     Controller for retrieving the category menu
 
+    The menu is served from pre-encoded JSON bytes, so no models are built or
+    serialized per request.
+
     Args:
         catalog_service: Service for accessing catalog data
+        if_none_match: Value of the If-None-Match request header
 
     Returns:
-        Response schema with category hierarchy
+        JSON response with category hierarchy, or 304 if the client copy is current
 
     Raises:
         HTTPException: If no categories are available
     """
-    category_menu = await catalog_service.get_category_menu()
+    payload = await catalog_service.get_category_menu_payload()
 
-    if not category_menu or not category_menu.categories:
+    if not payload.categories_count:
         raise HTTPException(
             status_code=404,
             detail="No categories available in the catalog."
         )
 
-    response_categories = []
-
-    for master_category in category_menu.categories:
-        response_sub_categories = []
-
-        for sub_category in master_category.sub_categories:
-            response_article_types = [
-                ArticleTypeSchema(id=art_type.id, name=art_type.name)
-                for art_type in sub_category.article_types
-            ]
+    headers = {"ETag": payload.etag}
 
-            response_sub_categories.append(SubCategorySchema(
-                id=sub_category.id,
-                name=sub_category.name,
-                article_types=response_article_types
-            ))
+    if if_none_match and payload.etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
 
-        response_categories.append(MasterCategorySchema(
-            id=master_category.id,
-            name=master_category.name,
-            sub_categories=response_sub_categories
-        ))
-
-    return CategoryMenuResponseSchema(categories=response_categories)
+    return Response(content=payload.content, media_type="application/json", headers=headers)
 
 
 async def get_products_by_category_controller(
@@ -219,8 +368,12 @@ async def get_products_by_category_controller(
         min_year: Optional[int] = None,
         max_year: Optional[int] = None,
         gender: Optional[str] = None,
+        colour: Optional[str] = None,
+        season: Optional[str] = None,
+        usage: Optional[str] = None,
         q: Optional[str] = None,
         catalog_service: CatalogServiceInterface = None,
+        cursor: Optional[str] = None,
 ) -> ProductListResponseSchema:
     """
     Controller for retrieving products filtered by category
@@ -235,30 +388,50 @@ async def get_products_by_category_controller(
         min_year: Minimum year filter
         max_year: Maximum year filter
         gender: Gender filter
+        colour: Base colour filter
+        season: Season filter
+        usage: Usage type filter
         q: Search query
         catalog_service: Catalog service instance
+        cursor: Opaque keyset cursor from a previous response
 
     Returns:
         Response with products filtered by category
+
+    Raises:
+        HTTPException: If the cursor is invalid (400) or the category is not found (404)
     """
-    catalog_dto = await catalog_service.get_products_by_category(
-        master_category_id=master_category_id,
-        sub_category_id=sub_category_id,
-        article_type_id=article_type_id,
-        page=page,
-        per_page=per_page,
-        ordering=ordering,
-        min_year=min_year,
-        max_year=max_year,
-        gender=gender,
-        q=q
-    )
+    try:
+        catalog_dto = await catalog_service.get_products_by_category(
+            master_category_id=master_category_id,
+            sub_category_id=sub_category_id,
+            article_type_id=article_type_id,
+            page=page,
+            per_page=per_page,
+            ordering=ordering,
+            min_year=min_year,
+            max_year=max_year,
+            gender=gender,
+            colour=colour,
+            season=season,
+            usage=usage,
+            q=q,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except CategoryNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
 
     products = [ProductSchema(**asdict(product)) for product in catalog_dto.products]
 
-    total_pages = catalog_dto.pagination.total_pages
-
-    def build_url_with_params(page_num: int) -> str:
+    def build_url_with_params(page_num: Optional[int] = None, next_cursor: Optional[str] = None) -> str:
         base_path_parts = ["/api/v1/catalog/categories", str(master_category_id)]
 
         if sub_category_id:
@@ -269,7 +442,8 @@ async def get_products_by_category_controller(
         base_path_parts.append("products")
         base_url = "/".join(base_path_parts)
 
-        params = {'page': page_num, 'per_page': per_page}
+        params = {'cursor': next_cursor} if next_cursor else {'page': page_num}
+        params['per_page'] = per_page
         if ordering:
             params['ordering'] = ordering
         if min_year is not None:
@@ -278,19 +452,33 @@ async def get_products_by_category_controller(
             params['max_year'] = max_year
         if gender:
             params['gender'] = gender
+        if colour:
+            params['colour'] = colour
+        if season:
+            params['season'] = season
+        if usage:
+            params['usage'] = usage
         if q:
             params['q'] = q
         return f"{base_url}?{urlencode(params)}"
 
-    prev_page = build_url_with_params(page - 1) if page > 1 else None
-    next_page = build_url_with_params(page + 1) if page < total_pages else None
+    next_cursor = catalog_dto.pagination.next_cursor
+
+    if cursor:
+        prev_page = None
+        next_page = build_url_with_params(next_cursor=next_cursor) if next_cursor else None
+    else:
+        prev_page = build_url_with_params(page - 1) if page > 1 else None
+        next_page = build_url_with_params(page + 1) if next_cursor else None
 
     return ProductListResponseSchema(
         products=products,
         prev_page=None if not products else prev_page,
         next_page=None if not products else next_page,
+        next_cursor=next_cursor,
         total_pages=catalog_dto.pagination.total_pages,
         total_items=catalog_dto.pagination.total_items,
+        count_mode=catalog_dto.pagination.count_mode,
     )
 
 
@@ -298,6 +486,12 @@ async def get_filters_by_categories_controller(
         master_category_id: int,
         sub_category_id: Optional[int] = None,
         article_type_id: Optional[int] = None,
+        min_year: Optional[int] = None,
+        max_year: Optional[int] = None,
+        gender: Optional[str] = None,
+        colour: Optional[str] = None,
+        season: Optional[str] = None,
+        usage: Optional[str] = None,
         catalog_service: CatalogServiceInterface = None,
 ) -> FiltersResponseSchema:
     """
@@ -307,19 +501,37 @@ async def get_filters_by_categories_controller(
         master_category_id: ID of the master category (required)
         sub_category_id: ID of the sub-category (optional)
         article_type_id: ID of the article type (optional)
+        min_year: Selected minimum year
+        max_year: Selected maximum year
+        gender: Selected gender(s)
+        colour: Selected base colour(s)
+        season: Selected season(s)
+        usage: Selected usage type(s)
         catalog_service: Catalog service for data access
 
     Returns:
         Filters response schema
 
     Raises:
-        HTTPException: If no products found in the specified categories
+        HTTPException: If the category is not found or no products found in the specified categories
     """
-    filters_dto = await catalog_service.get_available_filters_by_categories(
-        master_category_id=master_category_id,
-        sub_category_id=sub_category_id,
-        article_type_id=article_type_id
-    )
+    try:
+        filters_dto = await catalog_service.get_available_filters_by_categories(
+            master_category_id=master_category_id,
+            sub_category_id=sub_category_id,
+            article_type_id=article_type_id,
+            min_year=min_year,
+            max_year=max_year,
+            gender=gender,
+            colour=colour,
+            season=season,
+            usage=usage
+        )
+    except CategoryNotFoundError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
 
     if filters_dto is None:
         raise HTTPException(
@@ -327,15 +539,7 @@ async def get_filters_by_categories_controller(
             detail="No products found in the specified categories. No filters available."
         )
 
-    return FiltersResponseSchema(
-        gender=CheckboxFilterSchema(
-            values=filters_dto.gender.values
-        ) if filters_dto.gender else None,
-        year=RangeFilterSchema(
-            min=filters_dto.year.min,
-            max=filters_dto.year.max
-        ) if filters_dto.year else None
-    )
+    return _filters_to_schema(filters_dto)
 
 
 async def get_product_suggestions_controller(
@@ -364,3 +568,34 @@ async def get_product_suggestions_controller(
         )
 
     return await catalog_service.get_product_suggestions(query.strip(), limit)
+
+
+def _checkbox_filter_to_schema(checkbox_filter: Optional[CheckboxFilterDTO]) -> Optional[CheckboxFilterSchema]:
+    """Convert an optional checkbox filter DTO to its response schema"""
+    if checkbox_filter is None:
+        return None
+    return CheckboxFilterSchema(values=checkbox_filter.values, counts=checkbox_filter.counts)
+
+
+def _filters_to_schema(filters_dto: FiltersDTO) -> FiltersResponseSchema:
+    """
+    Convert filters DTO to response schema
+
+    Args:
+        filters_dto: Available filters
+
+    Returns:
+        Filters response schema
+    """
+    return FiltersResponseSchema(
+        gender=_checkbox_filter_to_schema(filters_dto.gender),
+        year=RangeFilterSchema(
+            min=filters_dto.year.min,
+            max=filters_dto.year.max,
+            counts=filters_dto.year.counts
+        ) if filters_dto.year else None,
+        colour=_checkbox_filter_to_schema(filters_dto.colour),
+        season=_checkbox_filter_to_schema(filters_dto.season),
+        usage=_checkbox_filter_to_schema(filters_dto.usage),
+        total_items=filters_dto.total_items
+    )
@@ -1,5 +1,9 @@
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends
 
+from apps.catalog.enums.count_strategy import CountStrategyEnum
 from apps.catalog.factories import (
     create_pagination_specification,
     create_ordering_specification,
@@ -9,21 +13,78 @@ from apps.catalog.factories import (
 )
 from apps.catalog.interfaces.repositories import (
     ProductRepositoryInterface,
-    CategoryRepositoryInterface
+    CategoryRepositoryInterface,
+    CatalogVersionRepositoryInterface
 )
 from apps.catalog.interfaces.services import CatalogServiceInterface
+from apps.catalog.interfaces.snapshot import CatalogSnapshotManagerInterface
 from apps.catalog.repositories.category import CategoryRepository
 from apps.catalog.repositories.product import ProductRepository
+from apps.catalog.repositories.version import CatalogVersionRepository
 from apps.catalog.services.catalog import CatalogService
+from apps.catalog.snapshot import CatalogSnapshotManager
+from cache.dependencies import get_cache
+from cache.interfaces import CacheInterface
 from db.dependencies import get_database_dao, get_query_builder
-from db.interfaces import DAOInterface, SQLQueryBuilderInterface
+from db.interfaces import DAOInterface, SQLQueryBuilderInterface, InvalidationBusInterface
+from db.invalidation import get_invalidation_bus, InvalidationTopic
+from db.query_cache import QueryShapeCache
 from search.dependencies import get_autocomplete_client
 from search.interfaces import AutocompleteClientInterface
+from settings.config import config
+
+FILTERS_CACHE_NAMESPACE = "catalog_filters"
+VERSION_CACHE_NAMESPACE = "catalog_version"
+PRODUCT_CACHE_NAMESPACE = "catalog_products"
+
+_snapshot_manager: Optional[CatalogSnapshotManagerInterface] = None
+
+
+async def get_catalog_snapshot_manager(
+        dao: DAOInterface = Depends(get_database_dao),
+        invalidation_bus: InvalidationBusInterface = Depends(get_invalidation_bus),
+) -> Optional[CatalogSnapshotManagerInterface]:
+    """
+    Dependency for getting the process-wide catalog snapshot manager.
+
+    Args:
+        dao: Data Access Object for database operations
+        invalidation_bus: Bus rebuilding the snapshot when products or categories change
+
+    Returns:
+        Snapshot manager, or None if CATALOG_SNAPSHOT_ENABLED is off
+    """
+    global _snapshot_manager
+
+    if not config.CATALOG_SNAPSHOT_ENABLED:
+        return None
+
+    if _snapshot_manager is None:
+        _snapshot_manager = CatalogSnapshotManager(dao, reload_delay=config.CATALOG_SNAPSHOT_RELOAD_DELAY)
+        # Product writes publish FACETS once per statement next to a PRODUCT message per changed key,
+        # so the snapshot listens to FACETS rather than reloading once per key
+        for topic in (InvalidationTopic.FACETS, InvalidationTopic.PRODUCTS, InvalidationTopic.CATEGORIES):
+            invalidation_bus.register(topic, _snapshot_manager.invalidate)
+
+    return _snapshot_manager
+
+
+@lru_cache()
+def get_listing_query_cache() -> QueryShapeCache:
+    """
+    Dependency for getting the process-wide cache of compiled product listing queries.
+
+    Returns:
+        Query shape cache keeping CATALOG_QUERY_SHAPE_CACHE_SIZE shapes
+    """
+    return QueryShapeCache(config.CATALOG_QUERY_SHAPE_CACHE_SIZE)
 
 
 async def get_product_repository(
         dao: DAOInterface = Depends(get_database_dao),
-        query_builder: SQLQueryBuilderInterface = Depends(lambda: get_query_builder("catalog_products"))
+        query_builder: SQLQueryBuilderInterface = Depends(lambda: get_query_builder("catalog_products")),
+        snapshot_manager: Optional[CatalogSnapshotManagerInterface] = Depends(get_catalog_snapshot_manager),
+        query_cache: QueryShapeCache = Depends(get_listing_query_cache)
 ) -> ProductRepositoryInterface:
     """
     Dependency for getting product repository.
@@ -31,26 +92,120 @@ async def get_product_repository(
     Args:
         dao: Data Access Object for database operations
         query_builder: SQL query builder for product table
+        snapshot_manager: Optional in-memory catalog snapshot for counts and facets
+        query_cache: Compiled listing queries shared by every request of the process
 
     Returns:
         Initialized product repository
     """
-    return ProductRepository(dao, query_builder)
+    return ProductRepository(
+        dao,
+        query_builder,
+        count_strategy=CountStrategyEnum(config.CATALOG_COUNT_STRATEGY),
+        count_limit=config.CATALOG_COUNT_LIMIT,
+        snapshot_manager=snapshot_manager,
+        query_cache=query_cache
+    )
 
 
 async def get_category_repository(
         dao: DAOInterface = Depends(get_database_dao),
+        invalidation_bus: InvalidationBusInterface = Depends(get_invalidation_bus),
 ) -> CategoryRepositoryInterface:
     """
     Dependency for getting category repository.
 
     Args:
         dao: Data Access Object for database operations
+        invalidation_bus: Bus dropping the cached category data when categories change,
+            and the cached menu product counts when products change
 
     Returns:
         Initialized category repository
     """
-    return CategoryRepository.get_instance(dao)
+    repository = CategoryRepository.get_instance(dao)
+    invalidation_bus.register(InvalidationTopic.CATEGORIES, repository.invalidate_cache)
+    for topic in (InvalidationTopic.FACETS, InvalidationTopic.PRODUCTS):
+        invalidation_bus.register(topic, repository.invalidate_products_count)
+    return repository
+
+
+def get_filters_cache(
+        invalidation_bus: InvalidationBusInterface = Depends(get_invalidation_bus),
+) -> CacheInterface:
+    """
+    Dependency for getting the cache of available filters (facets).
+
+    Args:
+        invalidation_bus: Bus dropping cached filters when products or categories change
+
+    Returns:
+        Namespaced filters cache
+    """
+    cache = get_cache(FILTERS_CACHE_NAMESPACE)
+    for topic in (InvalidationTopic.FACETS, InvalidationTopic.PRODUCTS, InvalidationTopic.CATEGORIES):
+        invalidation_bus.register(topic, cache.invalidate)
+    return cache
+
+
+def get_product_cache(
+        invalidation_bus: InvalidationBusInterface = Depends(get_invalidation_bus),
+) -> CacheInterface:
+    """
+    Dependency for getting the cache of product details.
+
+    Single product changes drop their id and slug keys, bulk product changes drop the whole cache.
+
+    Args:
+        invalidation_bus: Bus dropping cached products when products change
+
+    Returns:
+        Namespaced product detail cache
+    """
+    cache = get_cache(
+        PRODUCT_CACHE_NAMESPACE,
+        max_size=config.CATALOG_PRODUCT_CACHE_SIZE,
+        ttl=config.CATALOG_PRODUCT_CACHE_TTL
+    )
+    for topic in (InvalidationTopic.PRODUCT, InvalidationTopic.PRODUCTS):
+        invalidation_bus.register(topic, cache.invalidate)
+    return cache
+
+
+async def get_catalog_version_repository(
+        dao: DAOInterface = Depends(get_database_dao),
+) -> CatalogVersionRepositoryInterface:
+    """
+    Dependency for getting catalog data version repository.
+
+    Args:
+        dao: Data Access Object for database operations
+
+    Returns:
+        Initialized catalog version repository
+    """
+    return CatalogVersionRepository(dao)
+
+
+def get_catalog_version_cache(
+        invalidation_bus: InvalidationBusInterface = Depends(get_invalidation_bus),
+) -> CacheInterface:
+    """
+    Dependency for getting the cache of the catalog data version.
+
+    Entries live for CATALOG_VERSION_TTL seconds so writes that don't publish an
+    invalidation are still picked up quickly.
+
+    Args:
+        invalidation_bus: Bus dropping the cached version when catalog data changes
+
+    Returns:
+        Namespaced version cache
+    """
+    cache = get_cache(VERSION_CACHE_NAMESPACE, max_size=1, ttl=config.CATALOG_VERSION_TTL)
+    for topic in (InvalidationTopic.FACETS, InvalidationTopic.PRODUCTS, InvalidationTopic.CATEGORIES):
+        invalidation_bus.register(topic, cache.invalidate)
+    return cache
 
 
 def get_pagination_specification_factory() -> callable:
@@ -112,6 +267,8 @@ async def get_catalog_service(
         search_specification_factory: callable = Depends(get_search_specification_factory),
         category_specification_factory: callable = Depends(get_category_specification_factory),
         autocomplete_client: AutocompleteClientInterface = Depends(get_autocomplete_client),
+        filters_cache: CacheInterface = Depends(get_filters_cache),
+        product_cache: CacheInterface = Depends(get_product_cache),
 ) -> CatalogServiceInterface:
     """
     Dependency for getting catalog service.
@@ -125,6 +282,8 @@ async def get_catalog_service(
         search_specification_factory: Factory for creating search specifications
         category_specification_factory: Factory for creating category specifications
         autocomplete_client: Autocomplete client for product suggestions
+        filters_cache: Cache for available filters
+        product_cache: Cache for product details
 
     Returns:
         Initialized catalog service
@@ -138,4 +297,7 @@ async def get_catalog_service(
         search_specification_factory=search_specification_factory,
         category_specification_factory=category_specification_factory,
         autocomplete_client=autocomplete_client,
+        filters_cache=filters_cache,
+        product_cache=product_cache,
+        product_not_found_ttl=config.CATALOG_PRODUCT_NOT_FOUND_TTL,
     )
@@ -1,9 +1,26 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Union
 
 from apps.catalog.dto.products import ProductDTO
 
 
+@dataclass
+class CursorDTO:
+    """Data transfer object for keyset pagination cursor"""
+    ordering: List[str]
+    values: List[Optional[Union[int, float]]]
+    scope: str = ""
+
+
+@dataclass
+class ProductPageDTO:
+    """Data transfer object for a single page of products"""
+    products: List[ProductDTO]
+    next_cursor: Optional[str] = None
+    total_items: Optional[int] = None
+    count_mode: Optional[str] = None
+
+
 @dataclass
 class PaginationDTO:
     """Data transfer object for pagination information"""
@@ -11,6 +28,8 @@ class PaginationDTO:
     per_page: int
     total_items: int
     total_pages: int
+    next_cursor: Optional[str] = None
+    count_mode: str = "exact"
 
 
 @dataclass
@@ -1,17 +1,19 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Dict, FrozenSet, Optional
 
 
 class ArticleTypeInfoDTO(BaseModel):
     """DTO for article type basic information"""
     id: int = Field(..., alias="article_type_id")
     name: str
+    products_count: int = 0
 
 
 class SubCategoryInfoDTO(BaseModel):
     """DTO for subcategory with its article types"""
     id: int = Field(..., alias="sub_category_id")
     name: str
+    products_count: int = 0
     article_types: List[ArticleTypeInfoDTO] = []
 
 
@@ -19,9 +21,62 @@ class MasterCategoryInfoDTO(BaseModel):
     """DTO for master category with its subcategories"""
     id: int = Field(..., alias="master_category_id")
     name: str
+    products_count: int = 0
     sub_categories: List[SubCategoryInfoDTO] = []
 
 
 class CategoryMenuDTO(BaseModel):
     """DTO for the entire category menu structure"""
     categories: List[MasterCategoryInfoDTO] = []
+
+
+class CategoryMenuPayloadDTO(BaseModel, frozen=True):
+    """DTO for the category menu pre-serialized to JSON with its ETag"""
+    content: bytes
+    etag: str
+    categories_count: int
+
+
+class CategoryHierarchyDTO(BaseModel, frozen=True):
+    """Immutable index of the category tree mapping category ids to their article type ids"""
+    master_article_types: Dict[int, FrozenSet[int]] = {}
+    sub_article_types: Dict[int, FrozenSet[int]] = {}
+    sub_to_master: Dict[int, int] = {}
+    article_to_sub: Dict[int, int] = {}
+
+    def resolve_article_type_ids(
+            self,
+            master_category_id: int,
+            sub_category_id: Optional[int] = None,
+            article_type_id: Optional[int] = None
+    ) -> Optional[FrozenSet[int]]:
+        """
+        Resolve a category path to the article type ids it covers
+
+        Args:
+            master_category_id: Master category ID
+            sub_category_id: Optional subcategory ID
+            article_type_id: Optional article type ID
+
+        Returns:
+            Article type ids of the deepest given level, or None if any id is unknown
+            or does not belong to its parent
+        """
+        if master_category_id not in self.master_article_types:
+            return None
+
+        if sub_category_id is not None and self.sub_to_master.get(sub_category_id) != master_category_id:
+            return None
+
+        if article_type_id is not None:
+            parent_sub_id = self.article_to_sub.get(article_type_id)
+            if parent_sub_id is None or self.sub_to_master.get(parent_sub_id) != master_category_id:
+                return None
+            if sub_category_id is not None and parent_sub_id != sub_category_id:
+                return None
+            return frozenset((article_type_id,))
+
+        if sub_category_id is not None:
+            return self.sub_article_types[sub_category_id]
+
+        return self.master_article_types[master_category_id]
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Mapping
+
+from apps.catalog.enums.facet import FacetEnum
 
 
 @dataclass
@@ -7,6 +9,7 @@ class RangeFilterDTO:
     """DTO for range filter data"""
     min: int
     max: int
+    counts: Dict[int, int] = field(default_factory=dict)
     type: str = "range"
 
 
@@ -14,6 +17,7 @@ class RangeFilterDTO:
 class CheckboxFilterDTO:
     """DTO for checkbox filter data"""
     values: List[str]
+    counts: Dict[str, int] = field(default_factory=dict)
     type: str = "checkbox"
 
 
@@ -22,3 +26,33 @@ class FiltersDTO:
     """DTO containing all available filters"""
     gender: Optional[CheckboxFilterDTO] = None
     year: Optional[RangeFilterDTO] = None
+    colour: Optional[CheckboxFilterDTO] = None
+    season: Optional[CheckboxFilterDTO] = None
+    usage: Optional[CheckboxFilterDTO] = None
+    total_items: int = 0
+
+    @classmethod
+    def from_facet_counts(cls, facet_counts: Mapping[FacetEnum, Mapping], total_items: int) -> 'FiltersDTO':
+        """
+        Build filters from per-value counts of every facet
+
+        Args:
+            facet_counts: Count per value, per facet; facets without values are omitted
+            total_items: Number of products matching the whole selection
+
+        Returns:
+            FiltersDTO with values in ascending order
+        """
+        filters = {}
+
+        for facet, counts in facet_counts.items():
+            if not counts:
+                continue
+
+            counts = dict(sorted(counts.items()))
+            if facet == FacetEnum.YEAR:
+                filters[facet.value] = RangeFilterDTO(min=min(counts), max=max(counts), counts=counts)
+            else:
+                filters[facet.value] = CheckboxFilterDTO(values=list(counts), counts=counts)
+
+        return cls(**filters, total_items=total_items)
@@ -1,11 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional, Union
 
 
 @dataclass
 class ProductDTO:
     product_id: int
     gender: str
-    year: int
+    year: Optional[int]
     product_display_name: str
     image_url: str
     slug: str
+
+
+@dataclass
+class ProductBatchDTO:
+    products: list[ProductDTO]
+    missing: list[Union[int, str]] = field(default_factory=list)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class CatalogVersionDTO:
+    """DTO for the catalog data version bumped on every catalog change"""
+    version: int
+    updated_at: datetime
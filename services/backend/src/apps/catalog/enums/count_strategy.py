@@ -0,0 +1,20 @@
+"""Count strategy enumerations"""
+
+from enum import Enum
+
+
+class CountStrategyEnum(str, Enum):
+    """Enumeration for the ways total item counts of product listings are computed"""
+
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATED = "estimated"
+
+    def __str__(self) -> str:
+        """Return string representation of the enum value"""
+        return self.value
+
+    @classmethod
+    def get_all_strategies(cls) -> list[str]:
+        """Get list of all available strategies"""
+        return [strategy.value for strategy in cls]
@@ -0,0 +1,22 @@
+"""Export format enumerations"""
+
+from enum import Enum
+
+
+class ExportFormatEnum(str, Enum):
+    """Enumeration for the serialization formats of the catalog export"""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    def __str__(self) -> str:
+        """Return string representation of the enum value"""
+        return self.value
+
+    @property
+    def media_type(self) -> str:
+        """Get the response media type of the format"""
+        return {
+            ExportFormatEnum.NDJSON: "application/x-ndjson",
+            ExportFormatEnum.CSV: "text/csv; charset=utf-8",
+        }[self]
@@ -0,0 +1,43 @@
+"""Facet enumerations"""
+
+from enum import Enum
+from typing import List, Optional
+
+
+class FacetEnum(str, Enum):
+    """Enumeration for the product attributes a filter specification can restrict"""
+
+    GENDER = "gender"
+    YEAR = "year"
+    COLOUR = "colour"
+    SEASON = "season"
+    USAGE = "usage"
+
+    def __str__(self) -> str:
+        """Return string representation of the enum value"""
+        return self.value
+
+    @property
+    def column(self) -> str:
+        """Get the catalog_products column holding the attribute"""
+        return {
+            FacetEnum.GENDER: "gender",
+            FacetEnum.YEAR: "year",
+            FacetEnum.COLOUR: "base_colour_id",
+            FacetEnum.SEASON: "season_id",
+            FacetEnum.USAGE: "usage_type_id",
+        }[self]
+
+    @property
+    def lookup_table(self) -> Optional[str]:
+        """Get the suffix of the catalog table naming the attribute ids, None for plain value columns"""
+        return {
+            FacetEnum.COLOUR: "base_colour",
+            FacetEnum.SEASON: "season",
+            FacetEnum.USAGE: "usage_type",
+        }.get(self)
+
+    @classmethod
+    def lookup_facets(cls) -> List['FacetEnum']:
+        """Get the facets whose values are names in a lookup table"""
+        return [facet for facet in cls if facet.lookup_table is not None]
@@ -0,0 +1,115 @@
+import csv
+import io
+import json
+import zlib
+from dataclasses import astuple, asdict, fields
+from typing import AsyncIterator, Optional
+
+from apps.catalog.dto.products import ProductDTO
+from apps.catalog.enums.export_format import ExportFormatEnum
+
+CHUNK_SIZE = 64 * 1024
+GZIP_LEVEL = 6
+
+
+def encode_products(products: AsyncIterator[ProductDTO], export_format: ExportFormatEnum) -> AsyncIterator[bytes]:
+    """
+    Serialize a product stream in the given export format
+
+    Args:
+        products: Async iterator over product DTOs
+        export_format: Output format
+
+    Returns:
+        Async iterator over encoded chunks of about CHUNK_SIZE bytes
+    """
+    if export_format == ExportFormatEnum.CSV:
+        return _buffer_chunks(_encode_csv(products))
+    return _buffer_chunks(_encode_ndjson(products))
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Compress a byte stream into a single gzip member, chunk by chunk
+
+    Args:
+        chunks: Async iterator over uncompressed chunks
+
+    Returns:
+        Async iterator over compressed chunks
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Check whether an Accept-Encoding header allows gzip
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header
+
+    Returns:
+        True if gzip is listed without a zero quality value
+    """
+    if not accept_encoding:
+        return False
+
+    for coding in accept_encoding.split(","):
+        name, _, parameters = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+
+        quality = parameters.strip().removeprefix("q=")
+        try:
+            return not parameters or float(quality) > 0
+        except ValueError:
+            return False
+
+    return False
+
+
+async def _encode_ndjson(products: AsyncIterator[ProductDTO]) -> AsyncIterator[str]:
+    """Serialize products as one JSON object per line"""
+    async for product in products:
+        yield json.dumps(asdict(product), ensure_ascii=False) + "\n"
+
+
+async def _encode_csv(products: AsyncIterator[ProductDTO]) -> AsyncIterator[str]:
+    """Serialize products as CSV rows preceded by a header row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([field.name for field in fields(ProductDTO)])
+
+    async for product in products:
+        writer.writerow(astuple(product))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+async def _buffer_chunks(lines: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Join small encoded rows into chunks of about CHUNK_SIZE bytes to limit write calls"""
+    parts = []
+    size = 0
+
+    async for line in lines:
+        encoded = line.encode()
+        parts.append(encoded)
+        size += len(encoded)
+
+        if size >= CHUNK_SIZE:
+            yield b"".join(parts)
+            parts = []
+            size = 0
+
+    if parts:
+        yield b"".join(parts)
@@ -0,0 +1,221 @@
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional
+
+from apps.catalog.dto.filters import FiltersDTO
+from apps.catalog.enums.facet import FacetEnum
+from apps.catalog.interfaces.specifications import (
+    FilterSpecificationInterface,
+    CategorySpecificationInterface
+)
+
+
+class BitmapFacetIndex:
+    """
+    Bitmap index over the products of a catalog snapshot
+
+    Every value of an indexed attribute maps to a bitset, a Python int whose bit i is
+    set when product i of the snapshot has that value. Predicates combine with AND/OR
+    on the bitsets and counts are popcounts, so facet counts for any combination of
+    filter and category predicates cost a few big-int operations per facet value.
+    Category bitsets are keyed by id, facet bitsets by the value shown to clients
+    (gender, year, or colour, season and usage type name).
+    """
+
+    CATEGORY_COLUMNS = ("master_category_id", "sub_category_id", "article_type_id")
+
+    def __init__(self, size: int, bitmaps: Dict[str, Dict[Hashable, int]]):
+        """
+        Initialize index from bitsets
+
+        Args:
+            size: Number of indexed products
+            bitmaps: Bitset of every value, per attribute
+        """
+        self._size = size
+        self._all = (1 << size) - 1
+        self._bitmaps = bitmaps
+
+    @classmethod
+    def from_columns(cls, size: int, columns: Mapping[str, Iterable[Optional[Hashable]]]) -> 'BitmapFacetIndex':
+        """
+        Build index from attribute columns
+
+        Unknown values (None) get no bitset, as SQL facets skip them.
+
+        Args:
+            size: Number of products
+            columns: Value of every product, per attribute (facets and CATEGORY_COLUMNS)
+
+        Returns:
+            BitmapFacetIndex
+        """
+        return cls(size, {attribute: cls._build_bitmaps(size, values) for attribute, values in columns.items()})
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bitsets, without Python object overhead"""
+        return sum(
+            (bitmap.bit_length() + 7) // 8 for bitmaps in self._bitmaps.values() for bitmap in bitmaps.values()
+        )
+
+    def match(
+            self,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None
+    ) -> int:
+        """
+        Evaluate filter and category specifications into a bitset
+
+        Args:
+            filter_spec: Optional specification for filtering results
+            category_spec: Optional specification for category filtering
+
+        Returns:
+            Bitset of matching products
+        """
+        return self._category_bits(category_spec) & self._filter_bits(filter_spec)
+
+    def count(
+            self,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None
+    ) -> int:
+        """
+        Count products matching the specifications
+
+        Args:
+            filter_spec: Optional specification for filtering results
+            category_spec: Optional specification for category filtering
+
+        Returns:
+            Number of matching products
+        """
+        return self.match(filter_spec, category_spec).bit_count()
+
+    def value_counts(self, column: str, bits: int, scope: Optional[int] = None) -> Dict[Hashable, int]:
+        """
+        Count matching products per value of an attribute
+
+        Args:
+            column: Indexed attribute
+            bits: Bitset of matching products
+            scope: Bitset limiting which values are listed, defaults to bits
+
+        Returns:
+            Count per value present in scope, ordered by value
+        """
+        scope = bits if scope is None else scope
+        return {
+            value: (bits & bitmap).bit_count()
+            for value, bitmap in sorted(self._bitmaps[column].items())
+            if scope & bitmap
+        }
+
+    def get_facets(
+            self,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None
+    ) -> Optional[FiltersDTO]:
+        """
+        Get available filters with per-value counts of matching products
+
+        Every facet lists the values present in the category and counts, for each value,
+        the products that would match if it were ticked: the predicates of all other
+        facets apply, the facet's own selection is ignored.
+
+        Args:
+            filter_spec: Optional specification for filtering results
+            category_spec: Optional specification for category filtering
+
+        Returns:
+            FiltersDTO with available filters or None if no products are in the category
+        """
+        scope = self._category_bits(category_spec)
+        if not scope:
+            return None
+
+        facet_counts = {
+            facet: self.value_counts(facet, scope & self._other_facets_bits(filter_spec, facet), scope)
+            for facet in FacetEnum
+        }
+
+        return FiltersDTO.from_facet_counts(facet_counts, (scope & self._filter_bits(filter_spec)).bit_count())
+
+    def _category_bits(self, category_spec: Optional[CategorySpecificationInterface]) -> int:
+        """Bitset of products in the categories of a specification"""
+        if category_spec is None or category_spec.is_empty():
+            return self._all
+
+        if category_spec.article_type_ids is not None:
+            return self._union("article_type_id", category_spec.article_type_ids)
+
+        bits = self._bitmaps["master_category_id"].get(category_spec.master_category_id, 0)
+        if category_spec.sub_category_id is not None:
+            bits &= self._bitmaps["sub_category_id"].get(category_spec.sub_category_id, 0)
+        if category_spec.article_type_id is not None:
+            bits &= self._bitmaps["article_type_id"].get(category_spec.article_type_id, 0)
+        return bits
+
+    def _filter_bits(self, filter_spec: Optional[FilterSpecificationInterface]) -> int:
+        """Bitset of products matching the predicates of a filter specification"""
+        bits = self._all
+        if filter_spec is None or filter_spec.is_empty():
+            return bits
+
+        if filter_spec.min_year is not None or filter_spec.max_year is not None:
+            min_year = filter_spec.min_year if filter_spec.min_year is not None else float("-inf")
+            max_year = filter_spec.max_year if filter_spec.max_year is not None else float("inf")
+            bits &= self._union(
+                FacetEnum.YEAR, [year for year in self._bitmaps[FacetEnum.YEAR] if min_year <= year <= max_year]
+            )
+        if filter_spec.genders:
+            bits &= self._union(FacetEnum.GENDER, filter_spec.genders)
+        for facet in FacetEnum.lookup_facets():
+            names = filter_spec.get_names(facet)
+            if names:
+                bits &= self._union(facet, [name for name in self._bitmaps[facet] if name.lower() in names])
+
+        return bits
+
+    def _other_facets_bits(self, filter_spec: Optional[FilterSpecificationInterface], facet: FacetEnum) -> int:
+        """Bitset of products matching every predicate of a filter specification except one facet's"""
+        if filter_spec is None:
+            return self._all
+        return self._filter_bits(filter_spec.without(facet))
+
+    def _union(self, column: str, values: Iterable[Any]) -> int:
+        """Bitset of products having any of the values"""
+        bitmaps = self._bitmaps[column]
+        bits = 0
+        for value in values:
+            bits |= bitmaps.get(value, 0)
+        return bits
+
+    @staticmethod
+    def _build_bitmaps(size: int, values: Iterable[Optional[Hashable]]) -> Dict[Hashable, int]:
+        """
+        Build a bitset per distinct value of a column
+
+        Bits are set in a byte array per value and converted to an int once, since
+        setting them on ints directly would copy the whole bitset for every product.
+
+        Args:
+            size: Number of products
+            values: Value of every product, None if unknown
+
+        Returns:
+            Bitset per value
+        """
+        buffers: Dict[Hashable, bytearray] = {}
+
+        for position, value in enumerate(values):
+            if value is None:
+                continue
+            buffer = buffers.get(value)
+            if buffer is None:
+                buffer = buffers[value] = bytearray((size + 7) // 8)
+            buffer[position >> 3] |= 1 << (position & 7)
+
+        return {value: int.from_bytes(buffer, "little") for value, buffer in buffers.items()}
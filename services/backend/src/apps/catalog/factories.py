@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Optional, Collection
 
+from apps.catalog.enums.facet import FacetEnum
 from apps.catalog.interfaces.specifications import (
     PaginationSpecificationInterface,
     OrderingSpecificationInterface,
@@ -7,13 +8,33 @@ from apps.catalog.interfaces.specifications import (
     SearchSpecificationInterface, CategorySpecificationInterface
 )
 from apps.catalog.specifications.filtering import ProductFilterSpecification
-from apps.catalog.specifications.pagination import PaginationSpecification
+from apps.catalog.specifications.pagination import PaginationSpecification, CursorPaginationSpecification
 from apps.catalog.specifications.ordering import OrderingSpecification
 from apps.catalog.specifications.search import ProductSearchSpecification
 
 
-def create_pagination_specification(page: int, per_page: int) -> PaginationSpecificationInterface:
-    """Factory function to create pagination specification"""
+def create_pagination_specification(
+        page: int,
+        per_page: int,
+        cursor: Optional[str] = None
+) -> PaginationSpecificationInterface:
+    """
+    Factory function to create pagination specification
+
+    Args:
+        page: Page number (1-based), ignored when cursor is provided
+        per_page: Number of items per page
+        cursor: Optional opaque cursor switching to keyset pagination
+
+    Returns:
+        Offset or keyset pagination specification
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    if cursor:
+        return CursorPaginationSpecification(cursor, per_page)
+
     return PaginationSpecification(page, per_page)
 
 
@@ -25,7 +46,10 @@ def create_ordering_specification(ordering: Optional[str] = None) -> OrderingSpe
 def create_product_filter_specification(
         min_year: Optional[int] = None,
         max_year: Optional[int] = None,
-        gender: Optional[str] = None
+        gender: Optional[str] = None,
+        colour: Optional[str] = None,
+        season: Optional[str] = None,
+        usage: Optional[str] = None
 ) -> FilterSpecificationInterface:
     """
     Create a product filter specification
@@ -34,6 +58,9 @@ def create_product_filter_specification(
         min_year: Minimum year (inclusive)
         max_year: Maximum year (inclusive)
         gender: Gender(s) to filter by (comma-separated list)
+        colour: Base colour name(s) to filter by (comma-separated list)
+        season: Season name(s) to filter by (comma-separated list)
+        usage: Usage type name(s) to filter by (comma-separated list)
 
     Returns:
         Initialized filter specification
@@ -46,6 +73,15 @@ def create_product_filter_specification(
     if gender:
         spec.set_genders(gender)
 
+    if colour:
+        spec.set_names(FacetEnum.COLOUR, colour)
+
+    if season:
+        spec.set_names(FacetEnum.SEASON, season)
+
+    if usage:
+        spec.set_names(FacetEnum.USAGE, usage)
+
     return spec
 
 
@@ -65,7 +101,8 @@ def create_search_specification(query: Optional[str] = None) -> SearchSpecificat
 def create_category_specification(
         master_category_id: int,
         sub_category_id: Optional[int] = None,
-        article_type_id: Optional[int] = None
+        article_type_id: Optional[int] = None,
+        article_type_ids: Optional[Collection[int]] = None
 ) -> CategorySpecificationInterface:
     """
     Create a category specification for filtering products by category hierarchy
@@ -74,6 +111,7 @@ def create_category_specification(
         master_category_id: Master category ID
         sub_category_id: Optional subcategory ID
         article_type_id: Optional article type ID
+        article_type_ids: Optional article type ids resolved from the category hierarchy
 
     Returns:
         Initialized category specification
@@ -83,5 +121,6 @@ def create_category_specification(
     return CategorySpecification(
         master_category_id=master_category_id,
         sub_category_id=sub_category_id,
-        article_type_id=article_type_id
+        article_type_id=article_type_id,
+        article_type_ids=article_type_ids
     )
@@ -0,0 +1,133 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from apps.catalog.dependencies import get_catalog_version_repository, get_catalog_version_cache
+from apps.catalog.dto.version import CatalogVersionDTO
+from apps.catalog.interfaces.repositories import CatalogVersionRepositoryInterface
+from cache.interfaces import CacheInterface
+from settings.config import config
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "catalog")
+
+VERSION_CACHE_KEY = "data_version"
+
+
+def build_etag(version: int, request: Request) -> str:
+    """
+    Build a weak ETag for a catalog GET request
+
+    The tag combines the catalog data version with a digest of the path and the
+    query string, so every URL gets its own tag and all tags change together
+    whenever catalog data is written. The query is not normalized because the
+    order of repeated parameters, such as batch ids, shapes the response.
+
+    Args:
+        version: Catalog data version
+        request: Incoming request
+
+    Returns:
+        Weak entity tag
+    """
+    digest = hashlib.blake2b(f"{request.url.path}?{request.url.query}".encode(), digest_size=8).hexdigest()
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Check If-None-Match against an ETag using weak comparison
+
+    Args:
+        etag: Current entity tag
+        if_none_match: Value of the If-None-Match request header
+
+    Returns:
+        True if any listed tag matches or the header is "*"
+    """
+    opaque_tag = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def not_modified_since(updated_at: datetime, if_modified_since: str) -> bool:
+    """
+    Check If-Modified-Since against the last catalog write
+
+    Args:
+        updated_at: Time of the last catalog write
+        if_modified_since: Value of the If-Modified-Since request header
+
+    Returns:
+        True if the catalog has not changed since the given date, False for malformed dates
+    """
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return updated_at.replace(microsecond=0) <= since
+
+
+async def check_catalog_not_modified(
+        request: Request,
+        response: Response,
+        version_repository: CatalogVersionRepositoryInterface = Depends(get_catalog_version_repository),
+        version_cache: CacheInterface = Depends(get_catalog_version_cache)
+) -> None:
+    """
+    Answer conditional catalog GET requests before the route handler runs
+
+    Revalidation costs a cached version lookup instead of running the catalog
+    queries and serializing the response. Responses handled by the route get
+    validators and a Cache-Control header; routes returning their own Response
+    keep their own headers.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers are merged into the route result
+        version_repository: Repository for reading the catalog data version
+        version_cache: Cache holding the catalog data version
+
+    Raises:
+        HTTPException: 304 Not Modified if the client copy is current
+    """
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    data_version: Optional[CatalogVersionDTO] = await version_cache.get_or_set(
+        VERSION_CACHE_KEY, version_repository.get_data_version
+    )
+    if data_version is None:
+        return
+
+    etag = build_etag(data_version.version, request)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(data_version.updated_at.astimezone(timezone.utc), usegmt=True),
+        "Cache-Control": f"public, max-age={config.CATALOG_HTTP_MAX_AGE}"
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_none_match is not None:
+        not_modified = etag_matches(etag, if_none_match)
+    elif if_modified_since is not None:
+        not_modified = not_modified_since(data_version.updated_at, if_modified_since)
+    else:
+        not_modified = False
+
+    if not_modified:
+        logger.debug(f"Catalog request {request.url.path} not modified at version {data_version.version}")
+        raise HTTPException(status_code=304, headers=headers)
+
+    response.headers.update(headers)
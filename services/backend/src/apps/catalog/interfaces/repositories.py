@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Optional
-
-from apps.catalog.dto.category import CategoryMenuDTO, MasterCategoryInfoDTO
+from typing import Optional, Sequence, AsyncIterator
+
+from apps.catalog.dto.catalog import ProductPageDTO
+from apps.catalog.dto.category import (
+    CategoryHierarchyDTO,
+    CategoryMenuDTO,
+    CategoryMenuPayloadDTO,
+    MasterCategoryInfoDTO
+)
 from apps.catalog.dto.filters import FiltersDTO
-from apps.catalog.dto.products import ProductDTO
+from apps.catalog.dto.products import ProductDTO, ProductBatchDTO
+from apps.catalog.dto.version import CatalogVersionDTO
 from apps.catalog.interfaces.specifications import (
     PaginationSpecificationInterface,
     OrderingSpecificationInterface,
@@ -40,6 +47,56 @@ class ProductRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_products_by_ids(self, product_ids: Sequence[int]) -> ProductBatchDTO:
+        """
+        Get products by their IDs in a single query
+
+        Args:
+            product_ids: Unique IDs of the products to retrieve
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing IDs
+        """
+        pass
+
+    @abstractmethod
+    async def get_products_by_slugs(self, slugs: Sequence[str]) -> ProductBatchDTO:
+        """
+        Get products by their slugs in a single query
+
+        Args:
+            slugs: Unique slugs of the products to retrieve
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing slugs
+        """
+        pass
+
+    @abstractmethod
+    def stream_products(
+            self,
+            ordering_spec: Optional[OrderingSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[ProductDTO]:
+        """
+        Stream every product matching the specifications through a server-side cursor
+
+        Args:
+            ordering_spec: Optional specification for ordering results
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+            category_spec: Optional specification for category filtering
+            batch_size: Number of rows fetched from the cursor per round trip
+
+        Returns:
+            Async iterator over product DTOs
+        """
+        pass
+
     @abstractmethod
     async def get_products_with_specifications(
             self,
@@ -47,7 +104,7 @@ class ProductRepositoryInterface(ABC):
             ordering_spec: Optional[OrderingSpecificationInterface] = None,
             filter_spec: Optional[FilterSpecificationInterface] = None,
             search_spec: Optional[SearchSpecificationInterface] = None
-    ) -> list[ProductDTO]:
+    ) -> ProductPageDTO:
         """
         Get products using pagination, ordering, and filtering specifications
 
@@ -58,7 +115,7 @@ class ProductRepositoryInterface(ABC):
             search_spec: Optional specification for search
 
         Returns:
-            List of product DTOs
+            Page of product DTOs with cursor for the next page
         """
         pass
 
@@ -70,7 +127,7 @@ class ProductRepositoryInterface(ABC):
             ordering_spec: Optional[OrderingSpecificationInterface] = None,
             filter_spec: Optional[FilterSpecificationInterface] = None,
             search_spec: Optional[SearchSpecificationInterface] = None
-    ) -> list[ProductDTO]:
+    ) -> ProductPageDTO:
         """
         Get products filtered by category and other specifications
 
@@ -82,7 +139,53 @@ class ProductRepositoryInterface(ABC):
             search_spec: Optional specification for search
 
         Returns:
-            List of product DTOs
+            Page of product DTOs with cursor for the next page
+        """
+        pass
+
+    @abstractmethod
+    async def get_products_with_total(
+            self,
+            pagination_spec: PaginationSpecificationInterface,
+            ordering_spec: Optional[OrderingSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None
+    ) -> ProductPageDTO:
+        """
+        Get a page of products together with the total count in a single query
+
+        Args:
+            pagination_spec: Specification for pagination
+            ordering_spec: Optional specification for ordering results
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+
+        Returns:
+            Page of product DTOs with cursor for the next page and total count
+        """
+        pass
+
+    @abstractmethod
+    async def get_products_with_total_by_categories(
+            self,
+            category_spec: CategorySpecificationInterface,
+            pagination_spec: PaginationSpecificationInterface,
+            ordering_spec: Optional[OrderingSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None
+    ) -> ProductPageDTO:
+        """
+        Get a page of products in categories together with the total count in a single query
+
+        Args:
+            category_spec: Specification for category filtering
+            pagination_spec: Specification for pagination
+            ordering_spec: Optional specification for ordering results
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+
+        Returns:
+            Page of product DTOs with cursor for the next page and total count
         """
         pass
 
@@ -127,13 +230,15 @@ class ProductRepositoryInterface(ABC):
     @abstractmethod
     async def get_available_filters(
             self,
-            search_spec: Optional[SearchSpecificationInterface] = None
+            search_spec: Optional[SearchSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None
     ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on the actual data
 
         Args:
             search_spec: Optional search specification to limit filters to relevant options
+            filter_spec: Optional current filter selection, counts show what ticking each value would match
 
         Returns:
             FiltersDTO object containing all available filters or None if catalog is empty
@@ -144,13 +249,14 @@ class ProductRepositoryInterface(ABC):
     async def get_available_filters_by_categories(
             self,
             category_spec: CategorySpecificationInterface,
+            filter_spec: Optional[FilterSpecificationInterface] = None
     ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on products in specific categories
 
         Args:
             category_spec: Specification for category filtering
-            search_spec: Optional search specification to limit filters to relevant options
+            filter_spec: Optional current filter selection, counts show what ticking each value would match
 
         Returns:
             FiltersDTO object containing all available filters for the specified categories or None if no products found
@@ -165,13 +271,23 @@ class CategoryRepositoryInterface(ABC):
     async def get_category_menu(self) -> CategoryMenuDTO:
         """
         Get the complete category menu structure with all master categories,
-        subcategories and article types.
+        subcategories and article types, and the number of products in each.
 
         Returns:
             CategoryMenuDTO: The complete category hierarchy
         """
         pass
 
+    @abstractmethod
+    async def get_category_menu_payload(self) -> CategoryMenuPayloadDTO:
+        """
+        Get the category menu pre-serialized to JSON bytes with its ETag
+
+        Returns:
+            CategoryMenuPayloadDTO: Encoded menu, ETag and number of master categories
+        """
+        pass
+
     @abstractmethod
     async def get_master_category_by_id(self, master_category_id: int) -> Optional[MasterCategoryInfoDTO]:
         """
@@ -184,3 +300,47 @@ class CategoryRepositoryInterface(ABC):
             Optional[MasterCategoryInfoDTO]: The master category with its hierarchy or None if not found
         """
         pass
+
+    @abstractmethod
+    async def get_category_hierarchy(self) -> CategoryHierarchyDTO:
+        """
+        Get the immutable category hierarchy index
+
+        Returns:
+            CategoryHierarchyDTO: Mapping of master and sub category ids to their article type ids
+        """
+        pass
+
+    @abstractmethod
+    def invalidate_cache(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached category data so it is rebuilt on next access
+
+        Args:
+            key: Invalidated key, None means all category data
+        """
+        pass
+
+    @abstractmethod
+    def invalidate_products_count(self, key: Optional[str] = None) -> None:
+        """
+        Drop the cached category menu so its product counts are recomputed on next access
+
+        Args:
+            key: Invalidated key, ignored because product counts are cached with the whole menu
+        """
+        pass
+
+
+class CatalogVersionRepositoryInterface(ABC):
+    """Interface for catalog data version operations"""
+
+    @abstractmethod
+    async def get_data_version(self) -> Optional[CatalogVersionDTO]:
+        """
+        Get the current catalog data version
+
+        Returns:
+            CatalogVersionDTO or None if version tracking is not set up
+        """
+        pass
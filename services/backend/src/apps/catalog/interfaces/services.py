@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence, AsyncIterator
 
 from apps.catalog.dto.catalog import CatalogDTO
-from apps.catalog.dto.category import CategoryMenuDTO
+from apps.catalog.dto.category import CategoryMenuDTO, CategoryMenuPayloadDTO
 from apps.catalog.dto.filters import FiltersDTO
-from apps.catalog.dto.products import ProductDTO
+from apps.catalog.dto.products import ProductDTO, ProductBatchDTO
 
 
 class CatalogServiceInterface(ABC):
@@ -19,7 +19,11 @@ class CatalogServiceInterface(ABC):
             min_year: Optional[int] = None,
             max_year: Optional[int] = None,
             gender: Optional[str] = None,
-            q: Optional[str] = None
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None,
+            q: Optional[str] = None,
+            cursor: Optional[str] = None
     ) -> CatalogDTO:
         """
         Get paginated, sorted and filtered products
@@ -31,10 +35,17 @@ class CatalogServiceInterface(ABC):
             min_year: Minimum year filter
             max_year: Maximum year filter
             gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
             q: Search query string
+            cursor: Opaque keyset cursor from a previous page, replaces page-based offset
 
         Returns:
             CatalogDTO with products and pagination info
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or doesn't match the ordering, search or filters
         """
         pass
 
@@ -50,7 +61,11 @@ class CatalogServiceInterface(ABC):
             min_year: Optional[int] = None,
             max_year: Optional[int] = None,
             gender: Optional[str] = None,
-            q: Optional[str] = None
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None,
+            q: Optional[str] = None,
+            cursor: Optional[str] = None
     ) -> CatalogDTO:
         """
         Get products filtered by category with pagination, sorting and filtering
@@ -65,10 +80,59 @@ class CatalogServiceInterface(ABC):
             min_year: Minimum year filter
             max_year: Maximum year filter
             gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
             q: Search query string
+            cursor: Opaque keyset cursor from a previous page, replaces page-based offset
 
         Returns:
             CatalogDTO with products and pagination info
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or doesn't match the ordering, search or filters
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
+        """
+        pass
+
+    @abstractmethod
+    async def export_products(
+            self,
+            ordering: Optional[str] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None,
+            q: Optional[str] = None,
+            master_category_id: Optional[int] = None,
+            sub_category_id: Optional[int] = None,
+            article_type_id: Optional[int] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[ProductDTO]:
+        """
+        Get every product matching the filters as a stream for export
+
+        Args:
+            ordering: Ordering string (comma-separated fields with optional "-" prefix for descending)
+            min_year: Minimum year filter
+            max_year: Maximum year filter
+            gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
+            q: Search query string
+            master_category_id: ID of the master category (optional)
+            sub_category_id: ID of the sub-category (optional, requires master_category_id)
+            article_type_id: ID of the article type (optional, requires sub_category_id)
+            batch_size: Number of rows fetched from the database per round trip
+
+        Returns:
+            Async iterator over product DTOs
+
+        Raises:
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
         """
         pass
 
@@ -85,6 +149,32 @@ class CatalogServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_products_by_ids(self, product_ids: Sequence[int]) -> ProductBatchDTO:
+        """
+        Get several products by their IDs at once
+
+        Args:
+            product_ids: IDs of the products to retrieve, duplicates are ignored
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing IDs
+        """
+        pass
+
+    @abstractmethod
+    async def get_products_by_slugs(self, slugs: Sequence[str]) -> ProductBatchDTO:
+        """
+        Get several products by their slugs at once
+
+        Args:
+            slugs: Slugs of the products to retrieve, duplicates are ignored
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing slugs
+        """
+        pass
+
     @abstractmethod
     async def get_product_by_slug(self, slug: str) -> Optional[ProductDTO]:
         """
@@ -99,12 +189,30 @@ class CatalogServiceInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_available_filters(self, q: Optional[str] = None) -> Optional[FiltersDTO]:
+    async def get_available_filters(
+            self,
+            q: Optional[str] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None
+    ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on the actual data
 
+        With a filter selection, each facet value counts the products that would match
+        if it were ticked, given the selection on the other facets.
+
         Args:
             q: Optional search query to limit filters to relevant options
+            min_year: Selected minimum year
+            max_year: Selected maximum year
+            gender: Selected gender(s) (comma-separated)
+            colour: Selected base colour(s) (comma-separated)
+            season: Selected season(s) (comma-separated)
+            usage: Selected usage type(s) (comma-separated)
 
         Returns:
             FiltersDTO object containing all available filters or None if catalog is empty
@@ -116,7 +224,13 @@ class CatalogServiceInterface(ABC):
             self,
             master_category_id: int,
             sub_category_id: Optional[int] = None,
-            article_type_id: Optional[int] = None
+            article_type_id: Optional[int] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None
     ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on products in specific categories
@@ -125,9 +239,18 @@ class CatalogServiceInterface(ABC):
             master_category_id: ID of the master category (required)
             sub_category_id: ID of the sub-category (optional)
             article_type_id: ID of the article type (optional)
+            min_year: Selected minimum year
+            max_year: Selected maximum year
+            gender: Selected gender(s) (comma-separated)
+            colour: Selected base colour(s) (comma-separated)
+            season: Selected season(s) (comma-separated)
+            usage: Selected usage type(s) (comma-separated)
 
         Returns:
             FiltersDTO object containing all available filters for the specified categories or None if no products found
+
+        Raises:
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
         """
         pass
 
@@ -142,6 +265,16 @@ class CatalogServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_category_menu_payload(self) -> CategoryMenuPayloadDTO:
+        """
+        Get the complete category menu pre-serialized to JSON with its ETag
+
+        Returns:
+            CategoryMenuPayloadDTO: Encoded menu, ETag and number of master categories
+        """
+        pass
+
     @abstractmethod
     async def get_product_suggestions(self, query: str, limit: int = 10) -> list[str]:
         """
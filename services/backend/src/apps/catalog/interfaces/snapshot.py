@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apps.catalog.snapshot import CatalogSnapshot
+
+
+class CatalogSnapshotManagerInterface(ABC):
+    """Interface for holders of the in-memory catalog snapshot"""
+
+    @abstractmethod
+    def get_snapshot(self) -> Optional['CatalogSnapshot']:
+        """
+        Get the current snapshot
+
+        Returns:
+            Current snapshot, or None if it is not loaded yet
+        """
+        pass
+
+    @abstractmethod
+    async def load(self) -> 'CatalogSnapshot':
+        """
+        Load a fresh snapshot from the database and make it current
+
+        Returns:
+            Loaded snapshot
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop the current snapshot because catalog data changed
+
+        Args:
+            key: Optional invalidated key
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop background work and release resources"""
+        pass
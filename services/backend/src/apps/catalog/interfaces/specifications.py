@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, AbstractSet, Sequence
+
+from apps.catalog.dto.catalog import CursorDTO
+from apps.catalog.enums.facet import FacetEnum
 
 
 class SpecificationInterface(ABC):
@@ -29,6 +32,16 @@ class PaginationSpecificationInterface(SpecificationInterface):
         """Get limit for pagination"""
         pass
 
+    @abstractmethod
+    def get_cursor(self) -> Optional[CursorDTO]:
+        """Get decoded keyset cursor, None for offset pagination"""
+        pass
+
+    @abstractmethod
+    def encode_cursor(self, cursor: CursorDTO) -> str:
+        """Encode keyset cursor for the next page"""
+        pass
+
 
 class OrderingSpecificationInterface(SpecificationInterface):
     """Interface for ordering specifications"""
@@ -42,6 +55,68 @@ class OrderingSpecificationInterface(SpecificationInterface):
 class FilterSpecificationInterface(SpecificationInterface):
     """Interface for filtering specifications"""
 
+    @property
+    @abstractmethod
+    def min_year(self) -> Optional[int]:
+        """Get the minimum year (inclusive), None if unbounded"""
+        pass
+
+    @property
+    @abstractmethod
+    def max_year(self) -> Optional[int]:
+        """Get the maximum year (inclusive), None if unbounded"""
+        pass
+
+    @property
+    @abstractmethod
+    def genders(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted genders, None or empty if not filtered by gender"""
+        pass
+
+    @property
+    @abstractmethod
+    def colours(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted base colour names (lowercase), None or empty if not filtered by colour"""
+        pass
+
+    @property
+    @abstractmethod
+    def seasons(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted season names (lowercase), None or empty if not filtered by season"""
+        pass
+
+    @property
+    @abstractmethod
+    def usage_types(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted usage type names (lowercase), None or empty if not filtered by usage"""
+        pass
+
+    @abstractmethod
+    def get_names(self, facet: FacetEnum) -> Optional[AbstractSet[str]]:
+        """
+        Get the accepted names of a lookup facet
+
+        Args:
+            facet: Facet backed by a lookup table (colour, season or usage)
+
+        Returns:
+            Lowercase names, None or empty if not filtered by the facet
+        """
+        pass
+
+    @abstractmethod
+    def without(self, facet: FacetEnum) -> 'FilterSpecificationInterface':
+        """
+        Get a copy of the specification without the predicate on one facet
+
+        Args:
+            facet: Facet whose predicate is dropped
+
+        Returns:
+            New filter specification
+        """
+        pass
+
     @abstractmethod
     def add_filter(self, field: str, value: Any) -> None:
         """
@@ -73,6 +148,16 @@ class SearchSpecificationInterface(SpecificationInterface):
         """Get the search query."""
         pass
 
+    @abstractmethod
+    def get_rank_sql(self) -> tuple[str, list[Any]]:
+        """
+        Get SQL expression for search relevance rank
+
+        Returns:
+            tuple[str, list[Any]]: SQL expression, list of parameters
+        """
+        pass
+
     @abstractmethod
     def is_empty(self) -> bool:
         """Check if the search specification is empty."""
@@ -82,6 +167,30 @@ class SearchSpecificationInterface(SpecificationInterface):
 class CategorySpecificationInterface(SpecificationInterface):
     """Interface for category specifications"""
 
+    @property
+    @abstractmethod
+    def master_category_id(self) -> Optional[int]:
+        """Get the master category ID"""
+        pass
+
+    @property
+    @abstractmethod
+    def sub_category_id(self) -> Optional[int]:
+        """Get the subcategory ID, None if not filtered by subcategory"""
+        pass
+
+    @property
+    @abstractmethod
+    def article_type_id(self) -> Optional[int]:
+        """Get the article type ID, None if not filtered by article type"""
+        pass
+
+    @property
+    @abstractmethod
+    def article_type_ids(self) -> Optional[Sequence[int]]:
+        """Get the article type ids resolved from the category hierarchy, None if not resolved"""
+        pass
+
     @abstractmethod
     def is_empty(self) -> bool:
         """
@@ -1,12 +1,13 @@
-from typing import Optional, ClassVar, Dict, Tuple
+import hashlib
+from typing import Optional, ClassVar, Dict, Tuple, List, Any
 
 from async_lru import alru_cache
 
 from apps.catalog.dto.category import (
+    CategoryHierarchyDTO,
     CategoryMenuDTO,
-    MasterCategoryInfoDTO,
-    SubCategoryInfoDTO,
-    ArticleTypeInfoDTO
+    CategoryMenuPayloadDTO,
+    MasterCategoryInfoDTO
 )
 from apps.catalog.interfaces.repositories import CategoryRepositoryInterface
 from db.interfaces import DAOInterface
@@ -17,6 +18,7 @@ logger = get_logger(__name__, "app")
 
 class CategoryRepository(CategoryRepositoryInterface):
     APP_NAME = "catalog"
+    CACHE_TTL_SECONDS = 24 * 3600
     _instances: ClassVar[Dict[str, 'CategoryRepository']] = {}
 
     def __init__(self, dao: DAOInterface):
@@ -38,11 +40,11 @@ class CategoryRepository(CategoryRepositoryInterface):
             cls._instances[key] = cls(dao)
         return cls._instances[key]
 
-    @alru_cache(maxsize=1, ttl=3600)
+    @alru_cache(maxsize=1, ttl=CACHE_TTL_SECONDS)
     async def get_category_menu(self) -> CategoryMenuDTO:
         """
         Get the complete category menu structure with all master categories,
-        subcategories and article types.
+        subcategories and article types, and the number of products in each.
 
         Returns:
             CategoryMenuDTO: The complete category hierarchy
@@ -55,30 +57,92 @@ class CategoryRepository(CategoryRepositoryInterface):
         if not menu_result:
             return CategoryMenuDTO(categories=[])
 
-        master_categories = {}
+        return CategoryMenuDTO.model_validate({"categories": self._build_menu_tree(menu_result)})
 
-        for row in menu_result:
-            master_id, master_name, sub_id, sub_name, article_id, article_name = self._extract_row_data(row)
+    @alru_cache(maxsize=1, ttl=CACHE_TTL_SECONDS)
+    async def get_category_menu_payload(self) -> CategoryMenuPayloadDTO:
+        """
+        Get the category menu pre-serialized to JSON bytes with its ETag
 
-            if master_id not in master_categories:
-                master_categories[master_id] = MasterCategoryInfoDTO(
-                    master_category_id=master_id,
-                    name=master_name,
-                    sub_categories=[]
-                )
+        Returns:
+            CategoryMenuPayloadDTO: Encoded menu, ETag and number of master categories
+        """
+        menu = await self.get_category_menu()
+        content = menu.model_dump_json().encode()
+        etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+        logger.info(f"Category menu payload encoded: {len(content)} bytes, ETag {etag}")
+
+        return CategoryMenuPayloadDTO(
+            content=content,
+            etag=etag,
+            categories_count=len(menu.categories)
+        )
 
-            if sub_id is not None:
-                master_category = master_categories[master_id]
-                subcategory = self._find_subcategory_in_master(master_category, sub_id)
+    @alru_cache(maxsize=1, ttl=CACHE_TTL_SECONDS)
+    async def get_category_hierarchy(self) -> CategoryHierarchyDTO:
+        """
+        Get the immutable category hierarchy index built from the cached category menu
+
+        Returns:
+            CategoryHierarchyDTO: Mapping of master and sub category ids to their article type ids
+        """
+        menu = await self.get_category_menu()
 
-                if subcategory is None:
-                    subcategory = self._add_subcategory_to_master(master_category, sub_id, sub_name)
+        master_article_types = {}
+        sub_article_types = {}
+        sub_to_master = {}
+        article_to_sub = {}
 
-                if article_id is not None:
-                    self._add_article_type_to_subcategory(subcategory, article_id, article_name)
+        for master_category in menu.categories:
+            master_ids = set()
 
-        categories = list(master_categories.values())
-        return CategoryMenuDTO(categories=categories)
+            for subcategory in master_category.sub_categories:
+                sub_ids = frozenset(article_type.id for article_type in subcategory.article_types)
+
+                sub_article_types[subcategory.id] = sub_ids
+                sub_to_master[subcategory.id] = master_category.id
+                article_to_sub.update((article_id, subcategory.id) for article_id in sub_ids)
+                master_ids.update(sub_ids)
+
+            master_article_types[master_category.id] = frozenset(master_ids)
+
+        logger.info(
+            f"Category hierarchy built: {len(master_article_types)} master categories, "
+            f"{len(sub_article_types)} subcategories, {len(article_to_sub)} article types"
+        )
+
+        return CategoryHierarchyDTO(
+            master_article_types=master_article_types,
+            sub_article_types=sub_article_types,
+            sub_to_master=sub_to_master,
+            article_to_sub=article_to_sub
+        )
+
+    def invalidate_cache(self, key: Optional[str] = None) -> None:
+        """
+        Drop the cached category menu and hierarchy so they are rebuilt on next access
+
+        Args:
+            key: Invalidated key, ignored because category data is cached as a whole
+        """
+        self.get_category_menu.cache_clear()
+        self.get_category_menu_payload.cache_clear()
+        self.get_category_hierarchy.cache_clear()
+        logger.info("Category cache invalidated")
+
+    def invalidate_products_count(self, key: Optional[str] = None) -> None:
+        """
+        Drop the cached category menu so its product counts are recomputed on next access
+
+        The hierarchy does not depend on products and stays cached.
+
+        Args:
+            key: Invalidated key, ignored because product counts are cached with the whole menu
+        """
+        self.get_category_menu.cache_clear()
+        self.get_category_menu_payload.cache_clear()
+        logger.info("Category menu product counts invalidated")
 
     async def get_master_category_by_id(self, master_category_id: int) -> Optional[MasterCategoryInfoDTO]:
         """
@@ -93,46 +157,32 @@ class CategoryRepository(CategoryRepositoryInterface):
         category_query = self._get_category_query(master_category_id)
 
         logger.info(f"Master category by ID query: {category_query}")
-        logger.info(f"Master category by ID params: [{master_category_id}]")
+        logger.info(f"Master category by ID params: [{master_category_id}, {master_category_id}]")
 
-        category_result = await self._dao.execute(category_query, [master_category_id])
+        category_result = await self._dao.execute(category_query, [master_category_id, master_category_id])
 
         if not category_result:
             return None
 
-        master_id, master_name, _, _, _, _ = self._extract_row_data(category_result[0])
-
-        master_category = MasterCategoryInfoDTO(
-            master_category_id=master_id,
-            name=master_name,
-            sub_categories=[]
-        )
-
-        subcategories = {}
-
-        for row in category_result:
-            _, _, sub_id, sub_name, article_id, article_name = self._extract_row_data(row)
-
-            if sub_id is not None:
-                if sub_id not in subcategories:
-                    subcategory = self._add_subcategory_to_master(master_category, sub_id, sub_name)
-                    subcategories[sub_id] = subcategory
-
-                if article_id is not None:
-                    self._add_article_type_to_subcategory(subcategories[sub_id], article_id, article_name)
-
-        return master_category
+        return MasterCategoryInfoDTO.model_validate(self._build_menu_tree(category_result)[0])
 
     def _get_category_query(self, master_category_id: Optional[int] = None) -> str:
         """
         Generate SQL query for retrieving category data
 
+        Product counts per article type come from one grouped aggregate over the products,
+        joined to the category tree; subcategory and master category counts are their sums.
+
         Args:
-            master_category_id: Optional master category ID to filter by
+            master_category_id: Optional master category ID to filter by, passed twice as parameter
 
         Returns:
             SQL query string
         """
+        products_filter = ""
+        if master_category_id is not None:
+            products_filter = "WHERE master_category_id = %s"
+
         query = f"""
             SELECT 
                 mc.master_category_id,
@@ -140,13 +190,20 @@ class CategoryRepository(CategoryRepositoryInterface):
                 sc.sub_category_id,
                 sc.name as sub_name,
                 at.article_type_id,
-                at.name as article_name
+                at.name as article_name,
+                COALESCE(pc.products_count, 0) as products_count
             FROM 
                 {self.APP_NAME}_master_category mc
             LEFT JOIN 
                 {self.APP_NAME}_sub_category sc ON mc.master_category_id = sc.master_category_id
             LEFT JOIN 
                 {self.APP_NAME}_article_type at ON sc.sub_category_id = at.sub_category_id
+            LEFT JOIN (
+                SELECT article_type_id, COUNT(*) as products_count
+                FROM {self.APP_NAME}_products
+                {products_filter}
+                GROUP BY article_type_id
+            ) pc ON at.article_type_id = pc.article_type_id
         """
 
         if master_category_id is not None:
@@ -157,7 +214,7 @@ class CategoryRepository(CategoryRepositoryInterface):
         return query
 
     def _extract_row_data(self, row: Tuple) -> Tuple[
-        int, str, Optional[int], Optional[str], Optional[int], Optional[str]]:
+        int, str, Optional[int], Optional[str], Optional[int], Optional[str], int]:
         """
         Extract and normalize data from a database row
 
@@ -165,7 +222,7 @@ class CategoryRepository(CategoryRepositoryInterface):
             row: Database result row
 
         Returns:
-            Tuple of (master_id, master_name, sub_id, sub_name, article_id, article_name)
+            Tuple of (master_id, master_name, sub_id, sub_name, article_id, article_name, products_count)
         """
         master_id = int(row[0])
         master_name = row[1]
@@ -173,72 +230,56 @@ class CategoryRepository(CategoryRepositoryInterface):
         sub_name = row[3]
         article_id = int(row[4]) if row[4] is not None else None
         article_name = row[5]
+        products_count = int(row[6])
 
-        return master_id, master_name, sub_id, sub_name, article_id, article_name
-
-    def _add_article_type_to_subcategory(
-            self,
-            subcategory: SubCategoryInfoDTO,
-            article_id: int,
-            article_name: str
-    ) -> None:
-        """
-        Add article type to subcategory if it doesn't exist
+        return master_id, master_name, sub_id, sub_name, article_id, article_name, products_count
 
-        Args:
-            subcategory: Subcategory to add article type to
-            article_id: Article type ID
-            article_name: Article type name
+    def _build_menu_tree(self, rows: List[Tuple]) -> List[Dict[str, Any]]:
         """
-        article_type = ArticleTypeInfoDTO(
-            article_type_id=article_id,
-            name=article_name
-        )
+        Assemble category rows into a nested tree in a single pass
 
-        if not any(at.id == article_id for at in subcategory.article_types):
-            subcategory.article_types.append(article_type)
-
-    def _find_subcategory_in_master(
-            self,
-            master_category: MasterCategoryInfoDTO,
-            sub_id: int
-    ) -> Optional[SubCategoryInfoDTO]:
-        """
-        Find subcategory in master category by ID
+        Master categories and subcategories are indexed by id while rows are consumed,
+        so each row costs O(1) regardless of tree width. The tree is built from plain
+        dicts and validated into DTOs once by the caller. Product counts of article types
+        are added up into their subcategory and master category.
 
         Args:
-            master_category: Master category to search in
-            sub_id: Subcategory ID to find
+            rows: Category rows ordered by master, subcategory and article type name
 
         Returns:
-            Subcategory if found, None otherwise
-        """
-        return next(
-            (sc for sc in master_category.sub_categories if sc.id == sub_id),
-            None
-        )
-
-    def _add_subcategory_to_master(
-            self,
-            master_category: MasterCategoryInfoDTO,
-            sub_id: int,
-            sub_name: str
-    ) -> SubCategoryInfoDTO:
+            List of master category dicts keyed by DTO aliases
         """
-        Add new subcategory to master category
-
-        Args:
-            master_category: Master category to add subcategory to
-            sub_id: Subcategory ID
-            sub_name: Subcategory name
+        master_categories: Dict[int, Dict[str, Any]] = {}
+        subcategories: Dict[int, Dict[str, Any]] = {}
+        article_type_ids = set()
+
+        for row in rows:
+            (
+                master_id, master_name, sub_id, sub_name, article_id, article_name, products_count
+            ) = self._extract_row_data(row)
+
+            master_category = master_categories.get(master_id)
+            if master_category is None:
+                master_category = {
+                    "master_category_id": master_id, "name": master_name, "products_count": 0, "sub_categories": []
+                }
+                master_categories[master_id] = master_category
+
+            if sub_id is None:
+                continue
+
+            subcategory = subcategories.get(sub_id)
+            if subcategory is None:
+                subcategory = {"sub_category_id": sub_id, "name": sub_name, "products_count": 0, "article_types": []}
+                subcategories[sub_id] = subcategory
+                master_category["sub_categories"].append(subcategory)
+
+            if article_id is not None and article_id not in article_type_ids:
+                article_type_ids.add(article_id)
+                subcategory["article_types"].append(
+                    {"article_type_id": article_id, "name": article_name, "products_count": products_count}
+                )
+                subcategory["products_count"] += products_count
+                master_category["products_count"] += products_count
 
-        Returns:
-            Created subcategory
-        """
-        subcategory = SubCategoryInfoDTO(
-            sub_category_id=sub_id,
-            name=sub_name,
-            article_types=[]
-        )
-        master_category.sub_categories.append(subcategory)
-        return subcategory
+        return list(master_categories.values())
@@ -1,8 +1,14 @@
-from typing import Optional, List, Any, Tuple
-
-from apps.catalog.dto.filters import FiltersDTO, CheckboxFilterDTO, RangeFilterDTO
-from apps.catalog.dto.products import ProductDTO
+import hashlib
+from dataclasses import dataclass, field, replace
+from typing import Optional, List, Any, Tuple, Sequence, Hashable, Dict, AsyncIterator
+
+from apps.catalog.dto.catalog import CursorDTO, ProductPageDTO
+from apps.catalog.dto.filters import FiltersDTO
+from apps.catalog.dto.products import ProductDTO, ProductBatchDTO
+from apps.catalog.enums.count_strategy import CountStrategyEnum
+from apps.catalog.enums.facet import FacetEnum
 from apps.catalog.interfaces.repositories import ProductRepositoryInterface
+from apps.catalog.interfaces.snapshot import CatalogSnapshotManagerInterface
 from apps.catalog.interfaces.specifications import (
     PaginationSpecificationInterface,
     OrderingSpecificationInterface,
@@ -10,27 +16,105 @@ from apps.catalog.interfaces.specifications import (
     SearchSpecificationInterface,
     CategorySpecificationInterface
 )
+from apps.catalog.snapshot import CatalogSnapshot
+from apps.catalog.specifications.exceptions import InvalidCursorError
 from db.interfaces import DAOInterface, SQLQueryBuilderInterface
+from db.materialized_views import CATEGORY_FACETS_VIEW
+from db.query_cache import CompiledQuery, ParamSlot, QueryShapeCache
 from settings.logging_config import get_logger
 
 logger = get_logger(__name__, "app")
 
 
+@dataclass(frozen=True)
+class SortKey:
+    """Single ORDER BY key used for both ordering and keyset pagination"""
+    name: str
+    expression: str
+    descending: bool
+    params: Tuple[Any, ...] = field(default_factory=tuple)
+    nullable: bool = False
+
+    @property
+    def signature(self) -> str:
+        return f"-{self.name}" if self.descending else self.name
+
+    @property
+    def direction(self) -> str:
+        """ORDER BY direction, with the placement of NULLs spelled out for nullable keys"""
+        direction = "DESC" if self.descending else "ASC"
+        if not self.nullable:
+            return direction
+        # Postgres defaults, which the (year DESC, id DESC) indexes are built with
+        return f"{direction} NULLS FIRST" if self.descending else f"{direction} NULLS LAST"
+
+
+@dataclass(frozen=True)
+class ListingQueryShape:
+    """
+    Everything that determines the SQL text of a listing query, but none of its parameter values
+
+    Specification fragments are (source, SQL, number of parameters): the SQL of a specification
+    only depends on which predicates it sets (filter set, search on/off, category depth).
+    Keyset pages record which cursor values are NULL, those are compared with IS NULL.
+    """
+    kind: str
+    fragments: Tuple[Tuple[str, str, int], ...]
+    ordering: Tuple[str, ...] = ()
+    keyset: Optional[Tuple[bool, ...]] = None
+    total: Optional[str] = None
+    count_capped: bool = False
+    offset: bool = False
+
+
 class ProductRepository(ProductRepositoryInterface):
     """Repository implementation for product operations using SQL database"""
 
     APP_NAME = "catalog"
-
-    def __init__(self, dao: DAOInterface, query_builder: SQLQueryBuilderInterface):
+    PRODUCT_COLUMNS = ("product_id", "gender", "year", "product_display_name", "image_url", "slug", "id")
+    NULLABLE_COLUMNS = frozenset({"year"})
+    SEARCH_RANK_KEY = "search_rank"
+    TOTAL_ITEMS_KEY = "total_items"
+    FACETS = tuple(FacetEnum)
+
+    # Kinds of listing queries compiled from specifications
+    PAGE_QUERY = "page"
+    STREAM_QUERY = "stream"
+    COUNT_QUERY = "count"
+    MATCHING_ROWS_QUERY = "matching_rows"
+    FACETS_QUERY = "facets"
+    CATEGORY_FACETS_QUERY = "category_facets"
+
+    # Ways of selecting the total count with a page
+    WINDOW_TOTAL = "window"
+    SUBQUERY_TOTAL = "subquery"
+
+    def __init__(
+            self,
+            dao: DAOInterface,
+            query_builder: SQLQueryBuilderInterface,
+            count_strategy: CountStrategyEnum = CountStrategyEnum.EXACT,
+            count_limit: int = 10000,
+            snapshot_manager: Optional[CatalogSnapshotManagerInterface] = None,
+            query_cache: Optional[QueryShapeCache] = None
+    ):
         """
         Initialize product repository
 
         Args:
             dao: Data Access Object for database operations
             query_builder: SQL query builder for constructing queries
+            count_strategy: How listing totals are computed
+            count_limit: Cap for capped totals, threshold below which estimated totals are counted exactly
+            snapshot_manager: Optional in-memory catalog snapshot answering counts and facets without SQL
+            query_cache: Optional process-wide cache of compiled listing queries, a private one by default
         """
         self._dao = dao
         self._query_builder = query_builder
+        self._count_strategy = count_strategy
+        self._count_limit = count_limit
+        self._snapshot_manager = snapshot_manager
+        self._query_cache = query_cache if query_cache is not None else QueryShapeCache()
 
     async def get_product_by_id(self, product_id: int) -> Optional[ProductDTO]:
         """
@@ -48,22 +132,15 @@ class ProductRepository(ProductRepositoryInterface):
             WHERE product_id = %s
         """
 
-        logger.info(f"Get product by ID query: {query}")
-        logger.info(f"Get product by ID params: [{product_id}]")
+        logger.debug(f"Get product by ID query: {query}")
+        logger.debug(f"Get product by ID params: [{product_id}]")
 
         result = await self._dao.execute(query, [product_id], fetch_one=True)
 
         if not result:
             return None
 
-        return ProductDTO(
-            product_id=int(result[0]),
-            gender=result[1],
-            year=int(result[2]),
-            product_display_name=result[3],
-            image_url=result[4],
-            slug=result[5],
-        )
+        return self._row_to_product(result)
 
     async def get_product_by_slug(self, slug: str) -> Optional[ProductDTO]:
         """
@@ -81,30 +158,110 @@ class ProductRepository(ProductRepositoryInterface):
             WHERE slug = %s
         """
 
-        logger.info(f"Get product by slug query: {query}")
-        logger.info(f"Get product by slug params: [{slug}]")
+        logger.debug(f"Get product by slug query: {query}")
+        logger.debug(f"Get product by slug params: [{slug}]")
 
         result = await self._dao.execute(query, [slug], fetch_one=True)
 
         if not result:
             return None
 
-        return ProductDTO(
-            product_id=int(result[0]),
-            gender=result[1],
-            year=int(result[2]),
-            product_display_name=result[3],
-            image_url=result[4],
-            slug=result[5],
+        return self._row_to_product(result)
+
+    async def get_products_by_ids(self, product_ids: Sequence[int]) -> ProductBatchDTO:
+        """
+        Get products by their IDs in a single query
+
+        Args:
+            product_ids: Unique IDs of the products to retrieve
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing IDs
+        """
+        query = f"""
+            SELECT product_id, gender, year, product_display_name, image_url, slug
+            FROM {self.APP_NAME}_products
+            WHERE product_id = ANY(%s)
+        """
+
+        logger.debug(f"Get products by IDs query: {query}")
+        logger.debug(f"Get products by IDs params: [{list(product_ids)}]")
+
+        rows = await self._dao.execute(query, [list(product_ids)])
+        products = {product.product_id: product for product in map(self._row_to_product, rows or [])}
+
+        return self._order_batch(product_ids, products)
+
+    async def get_products_by_slugs(self, slugs: Sequence[str]) -> ProductBatchDTO:
+        """
+        Get products by their slugs in a single query
+
+        Args:
+            slugs: Unique slugs of the products to retrieve
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing slugs
+        """
+        query = f"""
+            SELECT product_id, gender, year, product_display_name, image_url, slug
+            FROM {self.APP_NAME}_products
+            WHERE slug = ANY(%s)
+        """
+
+        logger.debug(f"Get products by slugs query: {query}")
+        logger.debug(f"Get products by slugs params: [{list(slugs)}]")
+
+        rows = await self._dao.execute(query, [list(slugs)])
+        products = {product.slug: product for product in map(self._row_to_product, rows or [])}
+
+        return self._order_batch(slugs, products)
+
+    async def stream_products(
+            self,
+            ordering_spec: Optional[OrderingSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[ProductDTO]:
+        """
+        Stream every product matching the specifications through a server-side cursor
+
+        Args:
+            ordering_spec: Optional specification for ordering results
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+            category_spec: Optional specification for category filtering
+            batch_size: Number of rows fetched from the cursor per round trip
+
+        Returns:
+            Async iterator over product DTOs
+        """
+        fragments = self._get_spec_fragments(filter_spec, search_spec, category_spec)
+        sort_keys = self._get_sort_keys(ordering_spec, search_spec)
+        compiled = self._get_compiled_query(
+            ListingQueryShape(
+                self.STREAM_QUERY,
+                self._fragments_shape(fragments),
+                ordering=tuple(sort_key.signature for sort_key in sort_keys)
+            ),
+            sort_keys
         )
 
+        query, params = compiled.sql, compiled.bind(self._fragment_params(fragments))
+        logger.debug(f"Stream products query: {query}")
+        logger.debug(f"Stream products params: {params}")
+
+        async for row in self._dao.stream(query, params, batch_size):
+            yield self._row_to_product(row)
+
     async def get_products_with_specifications(
             self,
             pagination_spec: PaginationSpecificationInterface,
             ordering_spec: Optional[OrderingSpecificationInterface] = None,
             filter_spec: Optional[FilterSpecificationInterface] = None,
             search_spec: Optional[SearchSpecificationInterface] = None
-    ) -> List[ProductDTO]:
+    ) -> ProductPageDTO:
         """
         Get products using pagination, ordering, and filtering specifications
 
@@ -115,7 +272,7 @@ class ProductRepository(ProductRepositoryInterface):
             search_spec: Optional specification for search
 
         Returns:
-            List of product DTOs
+            Page of product DTOs with cursor for the next page
         """
         return await self._get_products_with_specs(
             pagination_spec=pagination_spec,
@@ -132,7 +289,7 @@ class ProductRepository(ProductRepositoryInterface):
             ordering_spec: Optional[OrderingSpecificationInterface] = None,
             filter_spec: Optional[FilterSpecificationInterface] = None,
             search_spec: Optional[SearchSpecificationInterface] = None
-    ) -> List[ProductDTO]:
+    ) -> ProductPageDTO:
         """
         Get products filtered by category and other specifications
 
@@ -144,7 +301,7 @@ class ProductRepository(ProductRepositoryInterface):
             search_spec: Optional specification for search
 
         Returns:
-            List of product DTOs
+            Page of product DTOs with cursor for the next page
         """
         return await self._get_products_with_specs(
             pagination_spec=pagination_spec,
@@ -155,6 +312,65 @@ class ProductRepository(ProductRepositoryInterface):
             log_prefix="Category products"
         )
 
+    async def get_products_with_total(
+            self,
+            pagination_spec: PaginationSpecificationInterface,
+            ordering_spec: Optional[OrderingSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None
+    ) -> ProductPageDTO:
+        """
+        Get a page of products together with the total count in a single query
+
+        Args:
+            pagination_spec: Specification for pagination
+            ordering_spec: Optional specification for ordering results
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+
+        Returns:
+            Page of product DTOs with cursor for the next page and total count
+        """
+        return await self._get_products_with_specs(
+            pagination_spec=pagination_spec,
+            ordering_spec=ordering_spec,
+            filter_spec=filter_spec,
+            search_spec=search_spec,
+            with_total=True,
+            log_prefix="Products with total"
+        )
+
+    async def get_products_with_total_by_categories(
+            self,
+            category_spec: CategorySpecificationInterface,
+            pagination_spec: PaginationSpecificationInterface,
+            ordering_spec: Optional[OrderingSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None
+    ) -> ProductPageDTO:
+        """
+        Get a page of products in categories together with the total count in a single query
+
+        Args:
+            category_spec: Specification for category filtering
+            pagination_spec: Specification for pagination
+            ordering_spec: Optional specification for ordering results
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+
+        Returns:
+            Page of product DTOs with cursor for the next page and total count
+        """
+        return await self._get_products_with_specs(
+            pagination_spec=pagination_spec,
+            ordering_spec=ordering_spec,
+            filter_spec=filter_spec,
+            search_spec=search_spec,
+            category_spec=category_spec,
+            with_total=True,
+            log_prefix="Category products with total"
+        )
+
     async def get_products_count(
             self,
             filter_spec: Optional[FilterSpecificationInterface] = None,
@@ -202,78 +418,87 @@ class ProductRepository(ProductRepositoryInterface):
 
     async def get_available_filters(
             self,
-            search_spec: Optional[SearchSpecificationInterface] = None
+            search_spec: Optional[SearchSpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None
     ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on the actual data
 
         Args:
             search_spec: Optional search specification to limit filters to relevant options
+            filter_spec: Optional current filter selection, counts show what ticking each value would match
 
         Returns:
             FiltersDTO object containing all available filters or None if catalog is empty
         """
         if not search_spec or search_spec.is_empty():
-            return await self._get_all_filters()
+            return await self._get_facets(filter_spec=filter_spec)
 
-        return await self._get_filtered_filters(search_spec)
+        return await self._get_facets(search_spec=search_spec, filter_spec=filter_spec, log_prefix="Filtered filters")
 
     async def get_available_filters_by_categories(
             self,
             category_spec: CategorySpecificationInterface,
+            filter_spec: Optional[FilterSpecificationInterface] = None
     ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on products in specific categories
 
+        Without a filter selection (and without the in-memory snapshot) the counts are read
+        from the precomputed category facets instead of aggregating the products.
+
         Args:
             category_spec: Specification for category filtering
+            filter_spec: Optional current filter selection, counts show what ticking each value would match
 
         Returns:
             FiltersDTO object containing all available filters for the specified categories or None if no products found
         """
         if category_spec.is_empty():
-            return await self._get_all_filters()
+            return await self._get_facets(filter_spec=filter_spec)
+
+        if (filter_spec is None or filter_spec.is_empty()) and self._get_snapshot() is None:
+            return await self._get_category_facets(category_spec)
 
-        return await self._get_category_filters(category_spec)
+        return await self._get_facets(
+            category_spec=category_spec, filter_spec=filter_spec, log_prefix="Category filters"
+        )
 
-    async def _get_category_filters(self, category_spec: CategorySpecificationInterface) -> Optional[FiltersDTO]:
+    @staticmethod
+    def _row_to_product(row: Tuple) -> ProductDTO:
         """
-        Get filters for specific categories
+        Convert a product detail row to ProductDTO
 
         Args:
-            category_spec: Specification for category filtering
+            row: Row of product_id, gender, year, product_display_name, image_url, slug
 
         Returns:
-            FiltersDTO object with available filters for categories or None if no products found
+            ProductDTO
         """
-        category_sql, category_params = category_spec.to_sql()
-
-        count_query = f"SELECT COUNT(*) FROM {self.APP_NAME}_products " + category_sql
-        logger.info(f"Category filters count query: {count_query}")
-        logger.info(f"Category filters count params: {category_params}")
-
-        count_result = await self._dao.execute(count_query, category_params, fetch_one=True)
-
-        if not count_result or count_result[0] == 0:
-            return None
-
-        gender_query = f"SELECT DISTINCT gender FROM {self.APP_NAME}_products " + category_sql
-        logger.info(f"Category filters gender query: {gender_query}")
-        logger.info(f"Category filters gender params: {category_params}")
-
-        gender_result = await self._dao.execute(gender_query, category_params)
-        gender_values = [row[0] for row in gender_result] if gender_result else []
+        return ProductDTO(
+            product_id=int(row[0]),
+            gender=row[1],
+            year=int(row[2]) if row[2] is not None else None,
+            product_display_name=row[3],
+            image_url=row[4],
+            slug=row[5],
+        )
 
-        year_query = f"SELECT MIN(year), MAX(year) FROM {self.APP_NAME}_products " + category_sql + " AND year IS NOT NULL"
-        logger.info(f"Category filters year query: {year_query}")
-        logger.info(f"Category filters year params: {category_params}")
+    @staticmethod
+    def _order_batch(keys: Sequence[Hashable], products: Dict[Hashable, ProductDTO]) -> ProductBatchDTO:
+        """
+        Arrange batch lookup results in requested order
 
-        year_result = await self._dao.execute(year_query, category_params, fetch_one=True)
-        min_year, max_year = year_result if year_result else (None, None)
+        Args:
+            keys: Requested product keys
+            products: Found products by key
 
-        return FiltersDTO(
-            gender=CheckboxFilterDTO(values=gender_values) if gender_values else None,
-            year=RangeFilterDTO(min=min_year, max=max_year) if min_year and max_year else None
+        Returns:
+            ProductBatchDTO with found products and missing keys, both in requested order
+        """
+        return ProductBatchDTO(
+            products=[products[key] for key in keys if key in products],
+            missing=[key for key in keys if key not in products]
         )
 
     async def _get_products_with_specs(
@@ -283,10 +508,15 @@ class ProductRepository(ProductRepositoryInterface):
             filter_spec: Optional[FilterSpecificationInterface] = None,
             search_spec: Optional[SearchSpecificationInterface] = None,
             category_spec: Optional[CategorySpecificationInterface] = None,
+            with_total: bool = False,
             log_prefix: str = "Products"
-    ) -> List[ProductDTO]:
+    ) -> ProductPageDTO:
         """
-        Get products with specifications applied using query builder
+        Get products with specifications applied using query builder.
+
+        With an offset pagination spec the page is selected with LIMIT/OFFSET, with a cursor
+        pagination spec the rows after the cursor are selected with a keyset condition,
+        so every page costs the same as the first one.
 
         Args:
             pagination_spec: Specification for pagination
@@ -294,37 +524,100 @@ class ProductRepository(ProductRepositoryInterface):
             filter_spec: Optional specification for filtering results
             search_spec: Optional specification for search
             category_spec: Optional specification for category filtering
+            with_total: Whether to compute total count of matching products in the same query
             log_prefix: Prefix for logging messages
 
         Returns:
-            List of product DTOs matching the specifications
-        """
-        self._prepare_query_builder(filter_spec, search_spec, ordering_spec, category_spec)
-        self._query_builder.limit(pagination_spec.get_limit()).offset(pagination_spec.get_offset())
+            Page of product DTOs with cursor for the next page (and total count if requested)
 
-        query, params = self._query_builder.build()
-        logger.info(f"{log_prefix} query: {query}")
-        logger.info(f"{log_prefix} params: {params}")
+        Raises:
+            InvalidCursorError: If the cursor was issued for a different ordering, search, filters or category
+        """
+        sort_keys = self._get_sort_keys(ordering_spec, search_spec)
+        cursor = pagination_spec.get_cursor()
+        snapshot = self._get_snapshot(search_spec) if with_total else None
+
+        select_total = with_total and snapshot is None and self._count_strategy != CountStrategyEnum.ESTIMATED
+        fragments = self._get_spec_fragments(filter_spec, search_spec, category_spec)
+        cursor_scope = self._get_cursor_scope(fragments)
+        if cursor is not None:
+            self._check_cursor(sort_keys, cursor, cursor_scope)
+
+        count_cap = self._get_count_cap()
+        total = None
+        if select_total:
+            total = self.WINDOW_TOTAL if cursor is None and count_cap is None else self.SUBQUERY_TOTAL
+
+        compiled = self._get_compiled_query(
+            ListingQueryShape(
+                self.PAGE_QUERY,
+                self._fragments_shape(fragments),
+                ordering=tuple(sort_key.signature for sort_key in sort_keys),
+                keyset=tuple(value is None for value in cursor.values) if cursor is not None else None,
+                total=total,
+                count_capped=total == self.SUBQUERY_TOTAL and count_cap is not None,
+                offset=cursor is None
+            ),
+            sort_keys
+        )
 
-        result = await self._dao.execute(query, params)
+        limit = pagination_spec.get_limit()
+        sources = self._fragment_params(fragments)
+        sources.update(
+            limit=[limit + 1],
+            offset=[pagination_spec.get_offset()],
+            cursor=cursor.values if cursor is not None else [],
+            count_cap=[count_cap]
+        )
 
-        return [
-            ProductDTO(
-                product_id=int(row[0]),
-                gender=row[1],
-                year=int(row[2]),
-                product_display_name=row[3],
-                image_url=row[4],
-                slug=row[5],
+        query, params = compiled.sql, compiled.bind(sources)
+        logger.debug(f"{log_prefix} query: {query}")
+        logger.debug(f"{log_prefix} params: {params}")
+
+        result = await self._dao.execute(query, params, prepare=True) or []
+
+        rows = result[:limit]
+        next_cursor = None
+
+        if len(result) > limit and rows:
+            next_cursor = pagination_spec.encode_cursor(self._build_cursor(sort_keys, rows[-1], cursor_scope))
+
+        products = [self._row_to_product(row) for row in rows]
+
+        if not with_total:
+            return ProductPageDTO(products=products, next_cursor=next_cursor)
+
+        if snapshot is not None:
+            total_items, count_mode = snapshot.count(filter_spec, category_spec), CountStrategyEnum.EXACT
+        elif not select_total:
+            total_items, count_mode = await self._estimate_products_count(filter_spec, search_spec, category_spec)
+        elif result:
+            total_items, count_mode = self._resolve_total(int(result[0][-1]))
+        elif cursor is None and pagination_spec.get_offset() == 0:
+            total_items, count_mode = 0, CountStrategyEnum.EXACT
+        else:
+            count = await self._get_products_count(
+                filter_spec=filter_spec,
+                search_spec=search_spec,
+                category_spec=category_spec,
+                limit=self._get_count_cap(),
+                log_prefix=f"{log_prefix} count fallback"
             )
-            for row in (result or [])
-        ]
+            total_items, count_mode = self._resolve_total(count)
+
+        return ProductPageDTO(
+            products=products,
+            next_cursor=next_cursor,
+            total_items=total_items,
+            count_mode=count_mode.value
+        )
 
     async def _get_products_count(
             self,
             filter_spec: Optional[FilterSpecificationInterface] = None,
             search_spec: Optional[SearchSpecificationInterface] = None,
             category_spec: Optional[CategorySpecificationInterface] = None,
+            limit: Optional[int] = None,
             log_prefix: str = "Count"
     ) -> int:
         """
@@ -334,204 +627,708 @@ class ProductRepository(ProductRepositoryInterface):
             filter_spec: Optional specification for filtering results
             search_spec: Optional specification for search
             category_spec: Optional specification for category filtering
+            limit: Optional maximum number of rows to count
             log_prefix: Prefix for logging messages
 
         Returns:
             Number of products matching the criteria
         """
-        self._query_builder.reset().select("COUNT(*)")
+        snapshot = self._get_snapshot(search_spec)
+        if snapshot is not None:
+            count = snapshot.count(filter_spec, category_spec)
+            return min(count, limit) if limit is not None else count
+
+        fragments = self._get_spec_fragments(filter_spec, search_spec, category_spec)
+        compiled = self._get_compiled_query(
+            ListingQueryShape(self.COUNT_QUERY, self._fragments_shape(fragments), count_capped=limit is not None)
+        )
 
-        if category_spec and not category_spec.is_empty():
-            self._apply_category_spec(category_spec)
+        sources = self._fragment_params(fragments)
+        sources.update(count_cap=[limit])
+        query, params = compiled.sql, compiled.bind(sources)
 
-        if filter_spec and not filter_spec.is_empty():
-            filter_sql, filter_params = filter_spec.to_sql()
-            self._parse_sql_conditions(filter_sql, filter_params)
+        logger.debug(f"{log_prefix} query: {query}")
+        logger.debug(f"{log_prefix} params: {params}")
 
-        if search_spec and not search_spec.is_empty():
-            search_sql, search_params = search_spec.to_sql()
-            where_sql, _ = self._split_search_sql(search_sql)
-            self._parse_sql_conditions(where_sql, search_params[:1])
+        result = await self._dao.execute(query, params, fetch_one=True, prepare=True)
+        return result[0] if result else 0
 
-        query, params = self._query_builder.build()
+    async def _estimate_products_count(
+            self,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            search_spec: Optional[SearchSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None
+    ) -> Tuple[int, CountStrategyEnum]:
+        """
+        Estimate count of products matching specifications from planner statistics.
 
-        logger.info(f"{log_prefix} query: {query}")
-        logger.info(f"{log_prefix} params: {params}")
+        Unfiltered listings read pg_class.reltuples, filtered ones take the row estimate
+        of the planned query without executing it. Estimates below the count limit, and
+        tables without statistics, are replaced by an exact count because small sets are
+        cheap to count and poorly estimated.
 
-        result = await self._dao.execute(query, params, fetch_one=True)
-        return result[0] if result else 0
+        Args:
+            filter_spec: Optional specification for filtering results
+            search_spec: Optional specification for search
+            category_spec: Optional specification for category filtering
 
-    async def _get_all_filters(self) -> Optional[FiltersDTO]:
+        Returns:
+            Tuple of (number of products, count mode that produced it)
         """
-        Get all available filters from the entire product catalog
+        has_predicates = any(
+            spec is not None and not spec.is_empty()
+            for spec in (filter_spec, search_spec, category_spec)
+        )
 
-        Returns:
-            FiltersDTO object containing all available filters or None if catalog is empty
+        if not has_predicates:
+            query = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+            params = [f"{self.APP_NAME}_products"]
+            logger.debug(f"Estimated count query: {query}")
+
+            result = await self._dao.execute(query, params, fetch_one=True)
+            estimate = int(result[0]) if result else -1
+        else:
+            fragments = self._get_spec_fragments(filter_spec, search_spec, category_spec)
+            compiled = self._get_compiled_query(
+                ListingQueryShape(self.MATCHING_ROWS_QUERY, self._fragments_shape(fragments))
+            )
+
+            params = compiled.bind(self._fragment_params(fragments))
+            query = f"EXPLAIN (FORMAT JSON) {compiled.sql}"
+            logger.debug(f"Estimated count query: {query}")
+            logger.debug(f"Estimated count params: {params}")
+
+            result = await self._dao.execute(query, params, fetch_one=True)
+            estimate = int(result[0][0]["Plan"]["Plan Rows"]) if result else -1
+
+        if estimate >= self._count_limit:
+            return estimate, CountStrategyEnum.ESTIMATED
+
+        count = await self._get_products_count(
+            filter_spec=filter_spec,
+            search_spec=search_spec,
+            category_spec=category_spec,
+            log_prefix="Estimated count fallback"
+        )
+        return count, CountStrategyEnum.EXACT
+
+    def _get_snapshot(self, search_spec: Optional[SearchSpecificationInterface] = None) -> Optional[CatalogSnapshot]:
         """
-        count_query = f"SELECT COUNT(*) FROM {self.APP_NAME}_products"
-        logger.info(f"Filters count query: {count_query}")
+        Get the in-memory catalog snapshot if it can answer a query
 
-        count_result = await self._dao.execute(count_query, [], fetch_one=True)
+        Full-text predicates are not part of the snapshot, so searches always use SQL.
 
-        if not count_result or count_result[0] == 0:
+        Args:
+            search_spec: Optional search specification of the query
+
+        Returns:
+            Current snapshot, or None if the query must run in SQL
+        """
+        if self._snapshot_manager is None or (search_spec and not search_spec.is_empty()):
             return None
+        return self._snapshot_manager.get_snapshot()
+
+    def _get_count_cap(self) -> Optional[int]:
+        """
+        Get the number of rows a capped total counts up to
+
+        Returns:
+            One more than the count limit for the capped strategy (to detect overflow), None otherwise
+        """
+        if self._count_strategy == CountStrategyEnum.CAPPED:
+            return self._count_limit + 1
+        return None
 
-        gender_query = f"SELECT DISTINCT gender FROM {self.APP_NAME}_products"
-        logger.info(f"Filters gender query: {gender_query}")
+    def _resolve_total(self, count: int) -> Tuple[int, CountStrategyEnum]:
+        """
+        Resolve counted rows into reported total and count mode
 
-        gender_result = await self._dao.execute(gender_query, [])
-        gender_values = [row[0] for row in gender_result] if gender_result else []
+        Args:
+            count: Number of counted rows, at most the count cap
 
-        year_query = f"SELECT MIN(year), MAX(year) FROM {self.APP_NAME}_products WHERE year IS NOT NULL"
-        logger.info(f"Filters year query: {year_query}")
+        Returns:
+            Tuple of (total items, count mode that produced it)
+        """
+        if self._count_strategy == CountStrategyEnum.CAPPED and count > self._count_limit:
+            return self._count_limit, CountStrategyEnum.CAPPED
+        return count, CountStrategyEnum.EXACT
 
-        year_result = await self._dao.execute(year_query, [], fetch_one=True)
-        min_year, max_year = year_result if year_result else (None, None)
+    async def _get_facets(
+            self,
+            search_spec: Optional[SearchSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            log_prefix: str = "Filters"
+    ) -> Optional[FiltersDTO]:
+        """
+        Get available filters with per-value counts in a single aggregate query
 
-        return FiltersDTO(
-            gender=CheckboxFilterDTO(values=gender_values) if gender_values else None,
-            year=RangeFilterDTO(min=min_year, max=max_year) if min_year and max_year else None
+        Total count and items per value of every facet are computed from one scan
+        using GROUPING SETS, so joins and full-text matching run once per request.
+        Colour, season and usage names come from LEFT JOINs of their lookup tables.
+        Facets list the values present regardless of the filter selection; with a
+        selection, each value counts the products matching if it were ticked, i.e.
+        under the predicates of all other facets (FILTER clauses per count). The SQL is
+        compiled once per query shape and runs as a prepared statement.
+
+        Args:
+            search_spec: Optional search specification to limit filters to search results
+            category_spec: Optional specification for category filtering
+            filter_spec: Optional current filter selection
+            log_prefix: Prefix for logging messages
+
+        Returns:
+            FiltersDTO object with available filters or None if no products match
+        """
+        snapshot = self._get_snapshot(search_spec)
+        if snapshot is not None:
+            return snapshot.get_facets(filter_spec, category_spec)
+
+        fragments = self._get_spec_fragments(None, search_spec, category_spec)
+        fragments.pop("rank", None)
+        if filter_spec and not filter_spec.is_empty():
+            fragments["selection"] = self._filter_condition(filter_spec)
+            for facet in self.FACETS:
+                fragments[f"selection_{facet.value}"] = self._filter_condition(filter_spec.without(facet))
+
+        compiled = self._get_compiled_query(ListingQueryShape(self.FACETS_QUERY, self._fragments_shape(fragments)))
+        query, params = compiled.sql, compiled.bind(self._fragment_params(fragments))
+
+        logger.debug(f"{log_prefix} query: {query}")
+        logger.debug(f"{log_prefix} params: {params}")
+
+        result = await self._dao.execute(query, params, prepare=True)
+        return self._facets_from_rows(result or [])
+
+    async def _get_category_facets(self, category_spec: CategorySpecificationInterface) -> Optional[FiltersDTO]:
+        """
+        Get available filters of categories without a filter selection from precomputed counts
+
+        The category facets materialized view holds the rows of the facets query per
+        article type, so the counts of a category are sums over its article types,
+        read with one indexed lookup. The view is refreshed by the ETL and the sync
+        command, product changes in between show up after the next refresh.
+
+        Args:
+            category_spec: Specification for category filtering
+
+        Returns:
+            FiltersDTO object with available filters or None if no products are in the categories
+        """
+        fragments = {"category_view": self._category_view_condition(category_spec)}
+        compiled = self._get_compiled_query(
+            ListingQueryShape(self.CATEGORY_FACETS_QUERY, self._fragments_shape(fragments))
         )
+        query, params = compiled.sql, compiled.bind(self._fragment_params(fragments))
+
+        logger.debug(f"Category facets query: {query}")
+        logger.debug(f"Category facets params: {params}")
 
-    async def _get_filtered_filters(self, search_spec: SearchSpecificationInterface) -> Optional[FiltersDTO]:
+        result = await self._dao.execute(query, params, as_dict=True, prepare=True)
+        return self._category_facets_from_rows(result or [])
+
+    @staticmethod
+    def _category_view_condition(category_spec: CategorySpecificationInterface) -> Tuple[str, List[Any]]:
         """
-        Get available filters based on search results
+        Get the condition on the category keys of the category facets view
 
         Args:
-            search_spec: Search specification to filter available options
+            category_spec: Specification for category filtering
 
         Returns:
-            FiltersDTO object with available filters for search results or None if no results
+            Tuple of SQL condition and parameters
         """
-        self._query_builder.reset()
+        if category_spec.article_type_ids is not None:
+            return "article_type_id = ANY(%s)", [list(category_spec.article_type_ids)]
+
+        keys = [("master_category_id", category_spec.master_category_id)]
+        if category_spec.sub_category_id is not None:
+            keys.append(("sub_category_id", category_spec.sub_category_id))
+        if category_spec.article_type_id is not None:
+            keys.append(("article_type_id", category_spec.article_type_id))
 
-        search_sql, search_params = search_spec.to_sql()
-        where_sql, _ = self._split_search_sql(search_sql)
-        self._parse_sql_conditions(where_sql, search_params[:1])
+        return " AND ".join(f"{column} = %s" for column, _ in keys), [value for _, value in keys]
 
-        count_query, count_params = self._query_builder.build_count()
-        logger.info(f"Filtered filters count query: {count_query}")
-        logger.info(f"Filtered filters count params: {count_params}")
+    def _category_facets_from_rows(self, rows: Sequence[Dict[str, Any]]) -> Optional[FiltersDTO]:
+        """
+        Build available filters from the summed rows of the category facets view
+
+        Args:
+            rows: Rows with facet_grouping, a column per facet named by its value and product_count
+
+        Returns:
+            FiltersDTO object with available filters or None if the rows count no products
+        """
+        total = 0
+        facet_counts = {facet: {} for facet in self.FACETS}
 
-        count_result = await self._dao.execute(count_query, count_params, fetch_one=True)
+        for row in rows:
+            facet = self._grouped_facet(row["facet_grouping"])
+            if facet is None:
+                total = row["product_count"]
+            elif row[facet.value] is not None:
+                facet_counts[facet][row[facet.value]] = int(row["product_count"])
 
-        if not count_result or count_result[0] == 0:
+        if not total:
             return None
 
-        gender_values = await self._get_filtered_gender_values(where_sql, search_params)
+        # Without a selection every product is selected and "if ticked" counts are the plain counts
+        return FiltersDTO.from_facet_counts(facet_counts, int(total))
 
-        min_year, max_year = await self._get_filtered_year_range(where_sql, search_params)
+    def _select_facet_counts(self, fragments: Dict[str, str], slots: Dict[str, List[ParamSlot]]) -> None:
+        """
+        Select the facet values and counts of the facets query, joining the lookup tables of named facets
 
-        return FiltersDTO(
-            gender=CheckboxFilterDTO(values=gender_values) if gender_values else None,
-            year=RangeFilterDTO(min=min_year, max=max_year) if min_year and max_year else None
-        )
+        Args:
+            fragments: SQL of the shape's fragments, "selection" and "selection_<facet>" hold the
+                conditions of the filter selection and of the selection without each facet
+            slots: Parameter slots of the fragments
+        """
+        columns = [self._facet_column(facet) for facet in self.FACETS]
+        self._query_builder.select(f"GROUPING({', '.join(columns)})", *columns, "COUNT(*)")
+
+        if "selection" in fragments:
+            for name in ("selection", *(f"selection_{facet.value}" for facet in self.FACETS)):
+                self._query_builder.select_expression(f"COUNT(*) FILTER (WHERE {fragments[name]})", *slots[name])
+        else:
+            self._query_builder.select(*["COUNT(*)"] * (len(self.FACETS) + 1))
+
+        for facet in FacetEnum.lookup_facets():
+            self._query_builder.join(
+                f"LEFT JOIN {self.APP_NAME}_{facet.lookup_table} {facet.lookup_table} "
+                f"ON {facet.lookup_table}.{facet.column} = {self.APP_NAME}_products.{facet.column}"
+            )
 
-    async def _get_filtered_gender_values(self, where_sql: str, search_params: List[Any]) -> List[str]:
+    def _facets_from_rows(self, rows: Sequence[Tuple]) -> Optional[FiltersDTO]:
         """
-        Get available gender values for filtered search results
+        Build available filters from grouping set rows
 
         Args:
-            where_sql: WHERE clause SQL for filtering
-            search_params: Parameters for the WHERE clause
+            rows: Rows of GROUPING() over the facet columns, the facet values, the total count,
+                the count matching the selection and the "if ticked" count of every facet
 
         Returns:
-            List of available gender values
+            FiltersDTO object with available filters or None if the rows count no products
         """
-        self._query_builder.reset().select("DISTINCT gender")
-        self._parse_sql_conditions(where_sql, search_params[:1])
-        self._query_builder.where("gender IS NOT NULL")
+        facet_count = len(self.FACETS)
+        total = 0
+        selected_total = 0
+        facet_counts = {facet: {} for facet in self.FACETS}
 
-        gender_query, gender_params = self._query_builder.build()
-        logger.info(f"Filtered filters gender query: {gender_query}")
-        logger.info(f"Filtered filters gender params: {gender_params}")
+        for row in rows:
+            grouping, values = row[0], row[1:facet_count + 1]
+            count, selected_count, counts = row[facet_count + 1], row[facet_count + 2], row[facet_count + 3:]
 
-        gender_result = await self._dao.execute(gender_query, gender_params)
-        return [row[0] for row in gender_result] if gender_result else []
+            facet = self._grouped_facet(grouping)
+            if facet is None:
+                total, selected_total = count, selected_count
+                continue
 
-    async def _get_filtered_year_range(
-            self,
-            where_sql: str,
-            search_params: List[Any]
-    ) -> Tuple[Optional[int], Optional[int]]:
+            index = self.FACETS.index(facet)
+            if values[index] is not None:
+                facet_counts[facet][values[index]] = int(counts[index])
+
+        if not total:
+            return None
+
+        return FiltersDTO.from_facet_counts(facet_counts, int(selected_total))
+
+    def _grouped_facet(self, grouping: int) -> Optional[FacetEnum]:
+        """
+        Get the facet a grouping set row is grouped by
+
+        Args:
+            grouping: GROUPING() over the facet columns, which sets the bit of every column
+                the row is not grouped by, first column highest
+
+        Returns:
+            Facet of the row, or None for the total row
         """
-        Get available year range for filtered search results
+        grouping_total = (1 << len(self.FACETS)) - 1
+        if grouping == grouping_total:
+            return None
+        return self.FACETS[len(self.FACETS) - (grouping_total ^ grouping).bit_length()]
+
+    def _facet_column(self, facet: FacetEnum) -> str:
+        """
+        Get the SQL expression of a facet's values
 
         Args:
-            where_sql: WHERE clause SQL for filtering
-            search_params: Parameters for the WHERE clause
+            facet: Facet
 
         Returns:
-            Tuple of (min_year, max_year) or (None, None) if no results
+            Column of the products table, or name column of the joined lookup table
         """
-        self._query_builder.reset().select("MIN(year)", "MAX(year)")
-        self._parse_sql_conditions(where_sql, search_params[:1])
-        self._query_builder.where("year IS NOT NULL")
+        if facet.lookup_table is not None:
+            return f"{facet.lookup_table}.name"
+        return facet.column
 
-        year_query, year_params = self._query_builder.build()
-        logger.info(f"Filtered filters year query: {year_query}")
-        logger.info(f"Filtered filters year params: {year_params}")
+    @staticmethod
+    def _filter_condition(filter_spec: FilterSpecificationInterface) -> Tuple[str, List[Any]]:
+        """
+        Get the predicates of a filter specification as one boolean SQL condition
+
+        Args:
+            filter_spec: Filter specification
 
-        year_result = await self._dao.execute(year_query, year_params, fetch_one=True)
-        return year_result if year_result else (None, None)
+        Returns:
+            Tuple of condition ("TRUE" if the specification is empty) and its parameters
+        """
+        filter_sql, filter_params = filter_spec.to_sql()
+        return filter_sql.removeprefix("WHERE ") or "TRUE", filter_params
 
-    def _prepare_query_builder(
+    def _get_spec_fragments(
             self,
             filter_spec: Optional[FilterSpecificationInterface],
             search_spec: Optional[SearchSpecificationInterface],
-            ordering_spec: Optional[OrderingSpecificationInterface] = None,
             category_spec: Optional[CategorySpecificationInterface] = None
-    ) -> None:
+    ) -> Dict[str, Tuple[str, List[Any]]]:
         """
-        Prepare query builder with all specifications
+        Get the SQL fragments of the non-empty specifications of a listing query
 
         Args:
             filter_spec: Optional specification for filtering results
             search_spec: Optional specification for search
-            ordering_spec: Optional specification for ordering results
             category_spec: Optional specification for category filtering
+
+        Returns:
+            Dictionary of fragment name ("category", "filter", "search" or "rank") to SQL and parameters,
+            in the order the fragments are applied
         """
-        self._query_builder.reset().select(
-            "product_id", "gender", "year", "product_display_name", "image_url", "slug"
-        )
+        fragments = {}
 
         if category_spec and not category_spec.is_empty():
-            self._apply_category_spec(category_spec)
+            fragments["category"] = category_spec.to_sql()
 
         if filter_spec and not filter_spec.is_empty():
-            filter_sql, filter_params = filter_spec.to_sql()
-            self._parse_sql_conditions(filter_sql, filter_params)
+            fragments["filter"] = filter_spec.to_sql()
+
+        if search_spec and not search_spec.is_empty():
+            search_sql, search_params = search_spec.to_sql()
+            where_sql, _ = self._split_search_sql(search_sql)
+            fragments["search"] = (where_sql, search_params[:1])
+            fragments["rank"] = search_spec.get_rank_sql()
+
+        return fragments
+
+    @staticmethod
+    def _fragments_shape(fragments: Dict[str, Tuple[str, List[Any]]]) -> Tuple[Tuple[str, str, int], ...]:
+        """Get the part of a query shape given by the specification fragments: their SQL and parameter counts"""
+        return tuple((name, sql, len(params)) for name, (sql, params) in fragments.items())
+
+    @staticmethod
+    def _fragment_params(fragments: Dict[str, Tuple[str, List[Any]]]) -> Dict[str, Sequence[Any]]:
+        """Get the parameter sources of the specification fragments for binding a compiled query"""
+        return {name: params for name, (_, params) in fragments.items()}
+
+    def _get_compiled_query(self, shape: ListingQueryShape, sort_keys: Sequence[SortKey] = ()) -> CompiledQuery:
+        """
+        Get the compiled query of a listing query shape from the cache, compiling it on first use
+
+        Args:
+            shape: Query shape
+            sort_keys: Sort keys of the query, matching the shape's ordering
+
+        Returns:
+            Compiled query
+        """
+        return self._query_cache.get_or_compile(shape, lambda: self._compile_query(shape, sort_keys))
+
+    def _compile_query(self, shape: ListingQueryShape, sort_keys: Sequence[SortKey]) -> CompiledQuery:
+        """
+        Build the SQL of a listing query shape with parameter slots in place of values.
+
+        Page queries with a total select the total count of matching rows as the last
+        column of every row: as a window count for exact offset pages (filters, joins and
+        full-text matching run once for both page and total), or as an uncorrelated
+        count subquery for keyset pages, where the keyset condition must not narrow the total,
+        and for capped counts, which stop scanning once the cap is exceeded.
+
+        Args:
+            shape: Query shape
+            sort_keys: Sort keys of the query, matching the shape's ordering
+
+        Returns:
+            Compiled query
+        """
+        slots = {name: [ParamSlot(name, index) for index in range(count)] for name, _, count in shape.fragments}
+        fragments = {name: sql for name, sql, _ in shape.fragments}
+        count_cap = ParamSlot("count_cap") if shape.count_capped else None
+
+        self._query_builder.reset()
+
+        if shape.kind == self.CATEGORY_FACETS_QUERY:
+            columns = [facet.value for facet in self.FACETS]
+            self._query_builder.from_table(CATEGORY_FACETS_VIEW)
+            self._query_builder.select("facet_grouping", *columns, "SUM(product_count) AS product_count")
+            self._query_builder.where(fragments["category_view"], *slots["category_view"])
+            self._query_builder.group_by(", ".join(("facet_grouping", *columns)))
+            return CompiledQuery.from_built(*self._query_builder.build())
+
+        if shape.kind in (self.PAGE_QUERY, self.STREAM_QUERY):
+            self._query_builder.select(*self.PRODUCT_COLUMNS)
+            if "rank" in fragments:
+                self._query_builder.select_expression(
+                    f"{fragments['rank']} AS {self.SEARCH_RANK_KEY}", *slots["rank"]
+                )
+
+        if shape.kind == self.FACETS_QUERY:
+            self._select_facet_counts(fragments, slots)
+
+        if "category" in fragments:
+            self._apply_category_sql(fragments["category"], slots["category"])
+
+        if "filter" in fragments:
+            self._parse_sql_conditions(fragments["filter"], slots["filter"])
+
+        if "search" in fragments:
+            self._parse_sql_conditions(fragments["search"], slots["search"])
+
+        if shape.kind == self.COUNT_QUERY:
+            return CompiledQuery.from_built(*self._query_builder.build_count(count_cap))
+
+        if shape.kind == self.MATCHING_ROWS_QUERY:
+            return CompiledQuery.from_built(*self._query_builder.build_matching_rows())
+
+        if shape.kind == self.FACETS_QUERY:
+            columns = ", ".join(f"({self._facet_column(facet)})" for facet in self.FACETS)
+            self._query_builder.group_by(f"GROUPING SETS ((), {columns})")
+            return CompiledQuery.from_built(*self._query_builder.build())
+
+        # Relevance is ranked with the slots of the rank fragment, not the values of the compiling request
+        sort_keys = [
+            replace(sort_key, params=tuple(slots["rank"])) if sort_key.params else sort_key
+            for sort_key in sort_keys
+        ]
+
+        if shape.total == self.WINDOW_TOTAL:
+            self._query_builder.select_expression(f"COUNT(*) OVER () AS {self.TOTAL_ITEMS_KEY}")
+        elif shape.total == self.SUBQUERY_TOTAL:
+            count_sql, count_params = self._query_builder.build_count(count_cap)
+            self._query_builder.select_expression(f"({count_sql}) AS {self.TOTAL_ITEMS_KEY}", *count_params)
+
+        if shape.keyset is not None:
+            cursor_slots = [ParamSlot("cursor", index) for index in range(len(sort_keys))]
+            keyset_sql, keyset_params = self._build_keyset_condition(sort_keys, cursor_slots, shape.keyset)
+            self._query_builder.where(keyset_sql, *keyset_params)
 
         order_by_clauses = []
-        order_by_params = []
+        for sort_key in sort_keys:
+            target = sort_key.name if sort_key.params else sort_key.expression
+            order_by_clauses.append(f"{target} {sort_key.direction}")
+
+        self._query_builder.order_by(", ".join(order_by_clauses))
+
+        if shape.kind == self.PAGE_QUERY:
+            self._query_builder.limit(ParamSlot("limit"))
+            if shape.offset:
+                self._query_builder.offset(ParamSlot("offset"))
+
+        return CompiledQuery.from_built(*self._query_builder.build())
+
+    def _get_sort_keys(
+            self,
+            ordering_spec: Optional[OrderingSpecificationInterface],
+            search_spec: Optional[SearchSpecificationInterface]
+    ) -> List[SortKey]:
+        """
+        Build the complete list of sort keys for a listing query.
+
+        Search relevance goes first, then the requested ordering fields, and the
+        unique id column is appended as a tiebreaker so the ordering is total.
+
+        Args:
+            ordering_spec: Optional specification for ordering results
+            search_spec: Optional specification for search
+
+        Returns:
+            List of sort keys
+        """
+        sort_keys = []
 
         if search_spec and not search_spec.is_empty():
-            search_sql, search_params = search_spec.to_sql()
-            where_sql, search_order_sql = self._split_search_sql(search_sql)
-            self._parse_sql_conditions(where_sql, search_params[:1])
+            rank_sql, rank_params = search_spec.get_rank_sql()
+            sort_keys.append(SortKey(self.SEARCH_RANK_KEY, rank_sql, True, tuple(rank_params)))
+
+        seen = set()
+        ordering_fields = ordering_spec.get_ordering_fields() if ordering_spec else []
+
+        for ordering_field in ordering_fields:
+            name = ordering_field.lstrip('-')
+            if name in seen:
+                continue
+            seen.add(name)
+            sort_keys.append(
+                SortKey(name, name, ordering_field.startswith('-'), nullable=name in self.NULLABLE_COLUMNS)
+            )
+
+        if "id" not in seen:
+            sort_keys.append(SortKey("id", "id", True))
+
+        return sort_keys
+
+    @staticmethod
+    def _get_cursor_scope(fragments: Dict[str, Tuple[str, List[Any]]]) -> str:
+        """
+        Get the digest of the search, filters and category a listing's cursors belong to
+
+        Args:
+            fragments: Specification fragments of the listing query
+
+        Returns:
+            Hex digest of the fragments' SQL and parameters
+        """
+        payload = repr([(name, sql, list(params)) for name, (sql, params) in fragments.items()])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _check_cursor(sort_keys: List[SortKey], cursor: CursorDTO, scope: str) -> None:
+        """
+        Check that a cursor was issued for the ordering, search, filters and category of the current query
+
+        Args:
+            sort_keys: Sort keys of the current query
+            cursor: Decoded cursor of the last row of the previous page
+            scope: Digest of the current query's specifications
 
-            if search_order_sql:
-                order_by_clauses.append(search_order_sql)
-                order_by_params.append(search_params[1])
+        Raises:
+            InvalidCursorError: If the cursor was issued for a different ordering, search, filters or category
+        """
+        if cursor.ordering != [sort_key.signature for sort_key in sort_keys] or len(cursor.values) != len(sort_keys):
+            raise InvalidCursorError("Pagination cursor does not match the requested ordering or search")
+        if cursor.scope != scope:
+            raise InvalidCursorError("Pagination cursor does not match the requested search, filters or category")
+
+    def _build_keyset_condition(
+            self,
+            sort_keys: List[SortKey],
+            values: Sequence[Any],
+            nulls: Sequence[bool]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build WHERE condition selecting rows that come after the cursor in the given ordering.
+
+        NULLs of nullable keys sort last ascending and first descending, as in the ORDER BY,
+        so they are matched with IS NULL / IS NOT NULL branches instead of comparisons.
+
+        Args:
+            sort_keys: Sort keys of the current query
+            values: Sort key values of the last row of the previous page, or their parameter slots
+            nulls: Whether each cursor value is NULL, such values are not passed as parameters
+
+        Returns:
+            Tuple of (SQL condition, parameters list)
+        """
+        params = []
+
+        # A row comparison is served by the sort key indexes but never matches NULLs,
+        # which only come after the cursor for ascending nullable keys or NULL cursor values
+        skips_nulls = any(
+            sort_key.nullable and (is_null or not sort_key.descending)
+            for sort_key, is_null in zip(sort_keys, nulls)
+        )
+
+        if len({sort_key.descending for sort_key in sort_keys}) == 1 and not skips_nulls:
+            operator = "<" if sort_keys[0].descending else ">"
+            expressions = ", ".join(sort_key.expression for sort_key in sort_keys)
+            placeholders = ", ".join(["%s"] * len(sort_keys))
+
+            for sort_key in sort_keys:
+                params.extend(sort_key.params)
+            params.extend(values)
+
+            return f"({expressions}) {operator} ({placeholders})", params
+
+        branches = []
+
+        for index, sort_key in enumerate(sort_keys):
+            after_sql, after_params = self._build_after_condition(sort_key, values[index], nulls[index])
+            if after_sql is None:
+                continue
+
+            conditions = []
+
+            for previous_key, previous_value, previous_null in zip(sort_keys[:index], values, nulls):
+                params.extend(previous_key.params)
+                if previous_null:
+                    conditions.append(f"{previous_key.expression} IS NULL")
+                else:
+                    conditions.append(f"{previous_key.expression} = %s")
+                    params.append(previous_value)
+
+            conditions.append(after_sql)
+            params.extend(after_params)
+
+            branches.append(f"({' AND '.join(conditions)})")
+
+        return f"({' OR '.join(branches)})", params
 
-        if ordering_spec:
-            ordering_sql, _ = ordering_spec.to_sql()
-            ordering_sql_cleaned = ordering_sql.replace("ORDER BY", "").strip()
-            if ordering_sql_cleaned:
-                order_by_clauses.append(ordering_sql_cleaned)
+    @staticmethod
+    def _build_after_condition(sort_key: SortKey, value: Any, is_null: bool) -> Tuple[Optional[str], List[Any]]:
+        """
+        Build condition selecting rows whose sort key comes strictly after a cursor value
+
+        Args:
+            sort_key: Sort key
+            value: Cursor value or its parameter slot
+            is_null: Whether the cursor value is NULL
+
+        Returns:
+            Tuple of (SQL condition, parameters list), condition is None if no row can come after the value
+        """
+        expression, key_params = sort_key.expression, list(sort_key.params)
+
+        if is_null:
+            # NULLs are last ascending, and first descending where every set value follows them
+            return (f"{expression} IS NOT NULL", key_params) if sort_key.descending else (None, [])
+
+        operator = "<" if sort_key.descending else ">"
+        if sort_key.nullable and not sort_key.descending:
+            return f"({expression} {operator} %s OR {expression} IS NULL)", key_params + [value] + key_params
+
+        return f"{expression} {operator} %s", key_params + [value]
+
+    def _build_cursor(self, sort_keys: List[SortKey], row: Tuple, scope: str) -> CursorDTO:
+        """
+        Build cursor from sort key values of a result row
+
+        Args:
+            sort_keys: Sort keys of the current query
+            row: Result row selected with PRODUCT_COLUMNS (and search rank when searching)
+            scope: Digest of the current query's specifications
 
-        if order_by_clauses:
-            final_ordering = ", ".join(order_by_clauses)
-            self._query_builder.order_by(final_ordering, *order_by_params)
+        Returns:
+            Cursor pointing after the row
+        """
+        columns = list(self.PRODUCT_COLUMNS) + [self.SEARCH_RANK_KEY]
+        values = [row[columns.index(sort_key.name)] for sort_key in sort_keys]
+
+        return CursorDTO(
+            ordering=[sort_key.signature for sort_key in sort_keys],
+            values=[
+                value if value is None else float(value) if isinstance(value, float) else int(value)
+                for value in values
+            ],
+            scope=scope
+        )
 
     def _apply_category_spec(self, category_spec: CategorySpecificationInterface) -> None:
         """
         Apply category specification to query builder
 
         Args:
-            category_spec: Category specification with joins and filters
+            category_spec: Category specification with optional joins and filters
+        """
+        self._apply_category_sql(*category_spec.to_sql())
+
+    def _apply_category_sql(self, category_sql: str, category_params: Sequence[Any]) -> None:
+        """
+        Apply the SQL of a category specification to query builder
+
+        Args:
+            category_sql: Joins and WHERE conditions of the category specification
+            category_params: Parameters of the conditions
         """
-        category_sql, category_params = category_spec.to_sql()
         joins_part, where_part = category_sql.split("WHERE", 1)
 
         for join_clause in joins_part.strip().split("JOIN"):
@@ -549,7 +1346,7 @@ class ProductRepository(ProductRepositoryInterface):
             params: Parameters for the SQL conditions
         """
         if sql_conditions.startswith("WHERE"):
-            conditions_text = sql_conditions.replace("WHERE", "").strip()
+            conditions_text = sql_conditions.removeprefix("WHERE").strip()
             self._query_builder.where(conditions_text, *params)
 
     @staticmethod
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from psycopg import errors
+
+from apps.catalog.dto.version import CatalogVersionDTO
+from apps.catalog.interfaces.repositories import CatalogVersionRepositoryInterface
+from db.interfaces import DAOInterface
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "app")
+
+
+class CatalogVersionRepository(CatalogVersionRepositoryInterface):
+    APP_NAME = "catalog"
+
+    def __init__(self, dao: DAOInterface):
+        self._dao = dao
+
+    async def get_data_version(self) -> Optional[CatalogVersionDTO]:
+        """
+        Get the current catalog data version
+
+        Returns:
+            CatalogVersionDTO or None if version tracking is not set up
+        """
+        query = f"SELECT version, updated_at FROM {self.APP_NAME}_data_version WHERE id = 1"
+        logger.info(f"Catalog data version query: {query}")
+
+        try:
+            result = await self._dao.execute(query, [], fetch_one=True)
+        except errors.UndefinedTable:
+            logger.warning("Catalog data version table is missing, conditional caching is disabled")
+            return None
+
+        if not result:
+            return None
+
+        return CatalogVersionDTO(version=result[0], updated_at=result[1])
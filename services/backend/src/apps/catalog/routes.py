@@ -1,6 +1,7 @@
 from typing import Optional
 
-from fastapi import APIRouter, Query, Depends, Path
+from fastapi import APIRouter, Query, Depends, Path, Header, Response
+from fastapi.responses import StreamingResponse
 
 from apps.catalog.controllers import (
     get_product_list_controller,
@@ -10,12 +11,19 @@ from apps.catalog.controllers import (
     get_filters_by_categories_controller,
     get_product_suggestions_controller,
     get_product_by_id_controller,
-    get_product_by_slug_controller
+    get_product_by_slug_controller,
+    get_products_by_ids_controller,
+    get_products_by_slugs_controller,
+    export_products_controller
 )
 from apps.catalog.dependencies import get_catalog_service
+from apps.catalog.enums.export_format import ExportFormatEnum
+from apps.catalog.http_cache import check_catalog_not_modified
 from apps.catalog.interfaces.services import CatalogServiceInterface
 from apps.catalog.schemas.examples.filters import FILTERS_FULL_EXAMPLE
 from apps.catalog.schemas.examples.responses import (
+    PRODUCT_BATCH_EXAMPLE,
+    PRODUCT_BATCH_BY_SLUG_EXAMPLE,
     STANDARD_RESPONSE_VALUE,
     YEAR_FILTERED_VALUE,
     GENDER_FILTERED_VALUE,
@@ -28,14 +36,20 @@ from apps.catalog.schemas.filters import FiltersResponseSchema
 from apps.catalog.schemas.responses import (
     ProductListResponseSchema,
     CategoryMenuResponseSchema,
-    ProductSchema
+    ProductSchema,
+    ProductBatchResponseSchema,
+    ProductBatchBySlugResponseSchema
 )
+from settings.config import config
 
 API_PATHS: dict[str, str] = {
     # Products
     "products": "/products",
     "products_filters": "/products/filters",
     "products_suggestions": "/products/suggestions",
+    "products_batch": "/products/batch",
+    "products_batch_by_slug": "/products/batch/slugs",
+    "products_export": "/products/export",
     "product_by_id": "/products/{product_id}",
     "product_by_slug": "/products/slug/{slug}",
 
@@ -58,9 +72,14 @@ router = APIRouter(
     tags=["catalog"]
 )
 
+# Conditional GET for the listing, filter and detail routes answered from catalog tables; ETags follow the
+# catalog data version. Suggestions come from Elasticsearch, exports stream, and the category menu has its own ETag
+CONDITIONAL_GET = [Depends(check_catalog_not_modified)]
+
 
 @router.get(
     API_PATHS["products"],
+    dependencies=CONDITIONAL_GET,
     response_model=ProductListResponseSchema,
     status_code=200,
     summary="Get a paginated list of products",
@@ -68,12 +87,24 @@ router = APIRouter(
             "<h3>This endpoint retrieves a paginated and filtered list of products from the database. "
             "Clients can specify the `page` number and the number of items per page using `per_page`. "
             "Optional parameter `ordering` allows sorting results by fields with direction (e.g., 'year,-product_id'). "
-            "Filtering is available by year range (`min_year`, `max_year`) and by gender (`gender`, which can be a comma-separated list). "
+            "Filtering is available by year range (`min_year`, `max_year`), by gender (`gender`) and by base colour, "
+            "season and usage type names (`colour`, `season`, `usage`, case-insensitive); each of these can be a "
+            "comma-separated list. "
             "The search parameter `q` allows for full-text search in product names with results sorted by relevance. "
             "The response includes details about the products, total pages, and total items, "
-            "along with links to the previous and next pages if applicable.</h3>"
+            "along with links to the previous and next pages if applicable. "
+            "For deep pagination pass `next_cursor` from the previous response as `cursor`: "
+            "the next page is then located by keyset instead of OFFSET, so every page costs the same.</h3>"
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor"}
+                }
+            },
+        },
         422: {
             "description": "Validation error occurred for query parameters.",
             "content": {
@@ -131,7 +162,14 @@ async def get_products_route(
         min_year: Optional[int] = Query(None, description="Minimum year filter (inclusive)"),
         max_year: Optional[int] = Query(None, description="Maximum year filter (inclusive)"),
         gender: Optional[str] = Query(None, description="Gender filter (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Base colour filter (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Season filter (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Usage type filter (comma-separated list, e.g., 'casual,sports')"),
         q: Optional[str] = Query(None, description="Search query for full-text search in product names"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from `next_cursor` of a previous response (keyset pagination, ignores `page`)"
+        ),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
 ):
     return await get_product_list_controller(
@@ -141,22 +179,30 @@ async def get_products_route(
         min_year=min_year,
         max_year=max_year,
         gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         q=q,
+        cursor=cursor,
         catalog_service=catalog_service,
     )
 
 
 @router.get(
     API_PATHS["products_filters"],
+    dependencies=CONDITIONAL_GET,
     response_model=FiltersResponseSchema,
     status_code=200,
     summary="Get available product filters",
     description=(
             "<h3>This endpoint retrieves available filters for the product catalog based on the actual data. "
-            "It provides information about available filter options such as gender values and year ranges. "
+            "It provides information about available filter options such as gender, colour, season and usage values "
+            "and year ranges. "
             "Clients can use this information to build dynamic filter UIs that adapt to the current catalog state. "
             "The endpoint returns filter metadata including possible values for checkbox filters and min/max ranges for "
-            "numeric filters.</h3>"
+            "numeric filters. Pass the current selection (`min_year`, `max_year`, `gender`, `colour`, `season`, "
+            "`usage`) to get, for every value, "
+            "the number of products that would match if it were ticked.</h3>"
     ),
     responses={
         404: {
@@ -188,6 +234,12 @@ async def get_products_route(
 )
 async def filters_route(
         q: Optional[str] = Query(None, description="Optional search query to show only relevant filters"),
+        min_year: Optional[int] = Query(None, description="Selected minimum year (inclusive)"),
+        max_year: Optional[int] = Query(None, description="Selected maximum year (inclusive)"),
+        gender: Optional[str] = Query(None, description="Selected gender(s) (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Selected base colour(s) (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Selected season(s) (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Selected usage type(s) (comma-separated list, e.g., 'casual,sports')"),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service)
 ) -> FiltersResponseSchema:
     """
@@ -196,6 +248,12 @@ async def filters_route(
     Args:
        catalog_service: Catalog service for data access
        q: Optional search query to limit filters to relevant options
+       min_year: Selected minimum year
+       max_year: Selected maximum year
+       gender: Selected gender(s)
+       colour: Selected base colour(s)
+       season: Selected season(s)
+       usage: Selected usage type(s)
 
     Returns:
        Filters response schema
@@ -203,7 +261,7 @@ async def filters_route(
     Raises:
        HTTPException: If the catalog is empty
     """
-    return await get_filters_controller(catalog_service, q)
+    return await get_filters_controller(catalog_service, q, min_year, max_year, gender, colour, season, usage)
 
 
 @router.get(
@@ -243,8 +301,249 @@ async def get_product_suggestions_route(
     )
 
 
+@router.get(
+    API_PATHS["products_export"],
+    response_class=StreamingResponse,
+    status_code=200,
+    summary="Export all matching products",
+    description=(
+            "<h3>This endpoint streams every product matching the filters as NDJSON (one JSON object per "
+            "line) or CSV, replacing page-by-page crawling of the listing endpoint. Rows are read through "
+            "a server-side cursor, so the export runs in constant memory whatever the catalog size. "
+            "Accepts the same filters, search and ordering as the listing endpoints, and optionally a "
+            "category path. The response is gzip-compressed when the client sends "
+            "<code>Accept-Encoding: gzip</code>.</h3>"
+    ),
+    responses={
+        200: {
+            "description": "Serialized products.",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {}
+            },
+        },
+        400: {
+            "description": "Subcategory or article type filter given without a master category.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "master_category_id is required when filtering by subcategory or article type"
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "Category not found or doesn't belong to its parent.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Category not found: master_category_id=999, sub_category_id=None, "
+                                  "article_type_id=None"
+                    }
+                }
+            },
+        },
+    },
+)
+async def export_products_route(
+        export_format: ExportFormatEnum = Query(
+            ExportFormatEnum.NDJSON,
+            alias="format",
+            description="Output format: ndjson or csv"
+        ),
+        ordering: Optional[str] = Query(None, description="Ordering fields (e.g., 'year,-id')"),
+        min_year: Optional[int] = Query(None, description="Minimum year filter (inclusive)"),
+        max_year: Optional[int] = Query(None, description="Maximum year filter (inclusive)"),
+        gender: Optional[str] = Query(None, description="Gender filter (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Base colour filter (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Season filter (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Usage type filter (comma-separated list, e.g., 'casual,sports')"),
+        q: Optional[str] = Query(None, description="Search query for full-text search in product names"),
+        master_category_id: Optional[int] = Query(None, description="ID of the master category"),
+        subcategory_id: Optional[int] = Query(None, description="ID of the subcategory"),
+        article_type_id: Optional[int] = Query(None, description="ID of the article type"),
+        accept_encoding: Optional[str] = Header(None, description="Send 'gzip' for a compressed export"),
+        catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
+) -> StreamingResponse:
+    """
+    Stream every product matching the filters as NDJSON or CSV
+
+    Args:
+        export_format: Output format
+        ordering: Ordering string
+        min_year: Minimum year filter
+        max_year: Maximum year filter
+        gender: Gender filter
+        colour: Base colour filter
+        season: Season filter
+        usage: Usage type filter
+        q: Search query
+        master_category_id: ID of the master category
+        subcategory_id: ID of the subcategory
+        article_type_id: ID of the article type
+        accept_encoding: Value of the Accept-Encoding request header
+        catalog_service: Catalog service for data access
+
+    Returns:
+        StreamingResponse: Serialized products
+    """
+    return await export_products_controller(
+        export_format=export_format,
+        ordering=ordering,
+        min_year=min_year,
+        max_year=max_year,
+        gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
+        q=q,
+        master_category_id=master_category_id,
+        sub_category_id=subcategory_id,
+        article_type_id=article_type_id,
+        accept_encoding=accept_encoding,
+        batch_size=config.CATALOG_EXPORT_BATCH_SIZE,
+        catalog_service=catalog_service,
+    )
+
+
+@router.get(
+    API_PATHS["products_batch"],
+    dependencies=CONDITIONAL_GET,
+    response_model=ProductBatchResponseSchema,
+    status_code=200,
+    summary="Get several products by their IDs",
+    description=(
+            "<h3>This endpoint retrieves several products in one request, replacing one request per product "
+            "for product grids and recommendation widgets. Pass each ID as a repeated <code>ids</code> "
+            "parameter. Products are returned in the requested order, duplicates are ignored and IDs "
+            "without a product are listed in <code>missing_ids</code>.</h3>"
+    ),
+    responses={
+        422: {
+            "description": "Validation error occurred for query parameters, e.g. too many IDs.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "field": "ids",
+                        "message": "List should have at most 100 items after validation, not 101"
+                    }
+                }
+            },
+        },
+    },
+    openapi_extra={
+        "responses": {
+            "200": {
+                "content": {
+                    "application/json": {
+                        "examples": {
+                            "products_batch": {
+                                "summary": "Products by IDs",
+                                "description": "Example response with one missing ID",
+                                "value": PRODUCT_BATCH_EXAMPLE
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_products_by_ids_route(
+        ids: list[int] = Query(
+            ...,
+            min_length=1,
+            max_length=config.CATALOG_BATCH_MAX_SIZE,
+            description="Product IDs in the order they should be returned"
+        ),
+        catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
+):
+    """
+    Get several products by their IDs
+
+    Args:
+        ids: Product IDs in the order they should be returned
+        catalog_service: Catalog service for data access
+
+    Returns:
+        ProductBatchResponseSchema: Found products and missing IDs
+    """
+    return await get_products_by_ids_controller(
+        product_ids=ids,
+        catalog_service=catalog_service,
+    )
+
+
+@router.get(
+    API_PATHS["products_batch_by_slug"],
+    dependencies=CONDITIONAL_GET,
+    response_model=ProductBatchBySlugResponseSchema,
+    status_code=200,
+    summary="Get several products by their slugs",
+    description=(
+            "<h3>This endpoint retrieves several products by slug in one request. Pass each slug as a "
+            "repeated <code>slugs</code> parameter. Products are returned in the requested order, "
+            "duplicates are ignored and unknown slugs are listed in <code>missing_slugs</code>.</h3>"
+    ),
+    responses={
+        422: {
+            "description": "Validation error occurred for query parameters, e.g. too many slugs.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "field": "slugs",
+                        "message": "List should have at most 100 items after validation, not 101"
+                    }
+                }
+            },
+        },
+    },
+    openapi_extra={
+        "responses": {
+            "200": {
+                "content": {
+                    "application/json": {
+                        "examples": {
+                            "products_batch_by_slug": {
+                                "summary": "Products by slugs",
+                                "description": "Example response with one unknown slug",
+                                "value": PRODUCT_BATCH_BY_SLUG_EXAMPLE
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+)
+async def get_products_by_slugs_route(
+        slugs: list[str] = Query(
+            ...,
+            min_length=1,
+            max_length=config.CATALOG_BATCH_MAX_SIZE,
+            description="Product slugs in the order they should be returned"
+        ),
+        catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
+):
+    """
+    Get several products by their slugs
+
+    Args:
+        slugs: Product slugs in the order they should be returned
+        catalog_service: Catalog service for data access
+
+    Returns:
+        ProductBatchBySlugResponseSchema: Found products and missing slugs
+    """
+    return await get_products_by_slugs_controller(
+        slugs=slugs,
+        catalog_service=catalog_service,
+    )
+
+
 @router.get(
     API_PATHS["product_by_id"],
+    dependencies=CONDITIONAL_GET,
     response_model=ProductSchema,
     status_code=200,
     summary="Get detailed product information by ID",
@@ -318,6 +617,7 @@ async def get_product_by_id_route(
 
 @router.get(
     API_PATHS["product_by_slug"],
+    dependencies=CONDITIONAL_GET,
     response_model=ProductSchema,
     status_code=200,
     summary="Get detailed product information by slug",
@@ -398,10 +698,15 @@ async def get_product_by_slug_route(
             "<h3>This endpoint retrieves the complete category hierarchy with all master categories, "
             "subcategories, and article types. The hierarchy is structured as a tree with three levels: "
             "master categories at the top level, subcategories as children of master categories, and "
-            "article types as children of subcategories. This information can be used to build navigation menus, "
-            "category browsers, or filtering interfaces in e-commerce applications.</h3>"
+            "article types as children of subcategories. Every node carries the number of products it contains, "
+            "so empty nodes can be hidden. This information can be used to build navigation menus, "
+            "category browsers, or filtering interfaces in e-commerce applications. "
+            "Responses carry an ETag; send it back in If-None-Match to get 304 Not Modified.</h3>"
     ),
     responses={
+        304: {
+            "description": "Category menu has not changed since the ETag sent in If-None-Match.",
+        },
         404: {
             "description": "No categories available.",
             "content": {
@@ -430,25 +735,28 @@ async def get_product_by_slug_route(
     }
 )
 async def get_categories_route(
+        if_none_match: Optional[str] = Header(None, description="ETag of a previously received category menu"),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service)
-) -> CategoryMenuResponseSchema:
+) -> Response:
     """
     Get the complete category hierarchy
 
     Args:
+        if_none_match: ETag of a previously received category menu
         catalog_service: Catalog service for data access
 
     Returns:
-        Category menu with all hierarchy levels
+        Category menu with all hierarchy levels, or 304 if unchanged
 
     Raises:
         HTTPException: If no categories are available
     """
-    return await get_category_menu_controller(catalog_service)
+    return await get_category_menu_controller(catalog_service, if_none_match)
 
 
 @router.get(
     API_PATHS["products_by_master_category"],
+    dependencies=CONDITIONAL_GET,
     response_model=ProductListResponseSchema,
     status_code=200,
     summary="Get products by category",
@@ -459,6 +767,24 @@ async def get_categories_route(
             "allowing for comprehensive data filtering based on your specific requirements.</h3>"
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor"}
+                }
+            },
+        },
+        404: {
+            "description": "Category not found.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Category not found: master_category_id=999, sub_category_id=None, article_type_id=None"
+                    }
+                }
+            },
+        },
         422: {
             "description": "Validation error occurred for query parameters.",
             "content": {
@@ -497,7 +823,14 @@ async def get_products_by_category_route(
         min_year: Optional[int] = Query(None, description="Minimum year filter (inclusive)"),
         max_year: Optional[int] = Query(None, description="Maximum year filter (inclusive)"),
         gender: Optional[str] = Query(None, description="Gender filter (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Base colour filter (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Season filter (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Usage type filter (comma-separated list, e.g., 'casual,sports')"),
         q: Optional[str] = Query(None, description="Search query for full-text search in product names"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from `next_cursor` of a previous response (keyset pagination, ignores `page`)"
+        ),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
 ):
     """
@@ -511,7 +844,11 @@ async def get_products_by_category_route(
         min_year: Minimum year filter
         max_year: Maximum year filter
         gender: Gender filter
+        colour: Base colour filter
+        season: Season filter
+        usage: Usage type filter
         q: Search query
+        cursor: Keyset pagination cursor
         catalog_service: Catalog service
 
     Returns:
@@ -527,13 +864,18 @@ async def get_products_by_category_route(
         min_year=min_year,
         max_year=max_year,
         gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         q=q,
+        cursor=cursor,
         catalog_service=catalog_service,
     )
 
 
 @router.get(
     API_PATHS["products_by_subcategory"],
+    dependencies=CONDITIONAL_GET,
     response_model=ProductListResponseSchema,
     status_code=200,
     summary="Get products by subcategory",
@@ -544,6 +886,24 @@ async def get_products_by_category_route(
             "allowing for comprehensive data filtering based on your specific requirements.</h3>"
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor"}
+                }
+            },
+        },
+        404: {
+            "description": "Category not found.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Category not found: master_category_id=999, sub_category_id=None, article_type_id=None"
+                    }
+                }
+            },
+        },
         422: {
             "description": "Validation error occurred for query parameters.",
             "content": {
@@ -583,7 +943,14 @@ async def get_products_by_subcategory_route(
         min_year: Optional[int] = Query(None, description="Minimum year filter (inclusive)"),
         max_year: Optional[int] = Query(None, description="Maximum year filter (inclusive)"),
         gender: Optional[str] = Query(None, description="Gender filter (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Base colour filter (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Season filter (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Usage type filter (comma-separated list, e.g., 'casual,sports')"),
         q: Optional[str] = Query(None, description="Search query for full-text search in product names"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from `next_cursor` of a previous response (keyset pagination, ignores `page`)"
+        ),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
 ):
     """
@@ -598,7 +965,11 @@ async def get_products_by_subcategory_route(
         min_year: Minimum year filter
         max_year: Maximum year filter
         gender: Gender filter
+        colour: Base colour filter
+        season: Season filter
+        usage: Usage type filter
         q: Search query
+        cursor: Keyset pagination cursor
         catalog_service: Catalog service
 
     Returns:
@@ -614,13 +985,18 @@ async def get_products_by_subcategory_route(
         min_year=min_year,
         max_year=max_year,
         gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         q=q,
+        cursor=cursor,
         catalog_service=catalog_service,
     )
 
 
 @router.get(
     API_PATHS["products_by_article_type"],
+    dependencies=CONDITIONAL_GET,
     response_model=ProductListResponseSchema,
     status_code=200,
     summary="Get products by article type",
@@ -631,6 +1007,24 @@ async def get_products_by_subcategory_route(
             "allowing for comprehensive data filtering based on your specific requirements.</h3>"
     ),
     responses={
+        400: {
+            "description": "Invalid pagination cursor.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid pagination cursor"}
+                }
+            },
+        },
+        404: {
+            "description": "Category not found.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Category not found: master_category_id=999, sub_category_id=None, article_type_id=None"
+                    }
+                }
+            },
+        },
         422: {
             "description": "Validation error occurred for query parameters.",
             "content": {
@@ -671,7 +1065,14 @@ async def get_products_by_article_type_route(
         min_year: Optional[int] = Query(None, description="Minimum year filter (inclusive)"),
         max_year: Optional[int] = Query(None, description="Maximum year filter (inclusive)"),
         gender: Optional[str] = Query(None, description="Gender filter (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Base colour filter (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Season filter (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Usage type filter (comma-separated list, e.g., 'casual,sports')"),
         q: Optional[str] = Query(None, description="Search query for full-text search in product names"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Opaque cursor from `next_cursor` of a previous response (keyset pagination, ignores `page`)"
+        ),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service),
 ):
     """
@@ -687,7 +1088,11 @@ async def get_products_by_article_type_route(
         min_year: Minimum year filter
         max_year: Maximum year filter
         gender: Gender filter
+        colour: Base colour filter
+        season: Season filter
+        usage: Usage type filter
         q: Search query
+        cursor: Keyset pagination cursor
         catalog_service: Catalog service
 
     Returns:
@@ -703,25 +1108,31 @@ async def get_products_by_article_type_route(
         min_year=min_year,
         max_year=max_year,
         gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         q=q,
+        cursor=cursor,
         catalog_service=catalog_service,
     )
 
 
 @router.get(
     API_PATHS["filters_by_master_category"],
+    dependencies=CONDITIONAL_GET,
     response_model=FiltersResponseSchema,
     status_code=200,
     summary="Get available filters for master category",
     description=(
             "<h3>This endpoint retrieves available filters for products in a specific master category. "
-            "It provides information about available filter options such as gender values and year ranges "
+            "It provides information about available filter options such as gender, colour, season and usage values "
+            "and year ranges "
             "based only on products within the specified master category. "
             "Clients can use this information to build dynamic filter UIs that adapt to the current category state.</h3>"
     ),
     responses={
         404: {
-            "description": "No products found in the specified category.",
+            "description": "Category not found or no products found in the specified category.",
             "content": {
                 "application/json": {
                     "example": {"detail": "No products found in the specified categories. No filters available."}
@@ -749,6 +1160,12 @@ async def get_products_by_article_type_route(
 )
 async def get_filters_by_master_category_route(
         master_category_id: int = Path(..., description="ID of the master category"),
+        min_year: Optional[int] = Query(None, description="Selected minimum year (inclusive)"),
+        max_year: Optional[int] = Query(None, description="Selected maximum year (inclusive)"),
+        gender: Optional[str] = Query(None, description="Selected gender(s) (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Selected base colour(s) (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Selected season(s) (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Selected usage type(s) (comma-separated list, e.g., 'casual,sports')"),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service)
 ) -> FiltersResponseSchema:
     """
@@ -756,6 +1173,12 @@ async def get_filters_by_master_category_route(
 
     Args:
         master_category_id: ID of the master category (required)
+        min_year: Selected minimum year
+        max_year: Selected maximum year
+        gender: Selected gender(s)
+        colour: Selected base colour(s)
+        season: Selected season(s)
+        usage: Selected usage type(s)
         catalog_service: Catalog service for data access
 
     Returns:
@@ -766,24 +1189,32 @@ async def get_filters_by_master_category_route(
     """
     return await get_filters_by_categories_controller(
         master_category_id=master_category_id,
+        min_year=min_year,
+        max_year=max_year,
+        gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         catalog_service=catalog_service
     )
 
 
 @router.get(
     API_PATHS["filters_by_subcategory"],
+    dependencies=CONDITIONAL_GET,
     response_model=FiltersResponseSchema,
     status_code=200,
     summary="Get available filters for subcategory",
     description=(
             "<h3>This endpoint retrieves available filters for products in a specific subcategory. "
-            "It provides information about available filter options such as gender values and year ranges "
+            "It provides information about available filter options such as gender, colour, season and usage values "
+            "and year ranges "
             "based only on products within the specified subcategory. "
             "Clients can use this information to build dynamic filter UIs that adapt to the current subcategory state.</h3>"
     ),
     responses={
         404: {
-            "description": "No products found in the specified subcategory.",
+            "description": "Category not found or no products found in the specified subcategory.",
             "content": {
                 "application/json": {
                     "example": {"detail": "No products found in the specified categories. No filters available."}
@@ -812,6 +1243,12 @@ async def get_filters_by_master_category_route(
 async def get_filters_by_subcategory_route(
         master_category_id: int = Path(..., description="ID of the master category"),
         subcategory_id: int = Path(..., description="ID of the subcategory"),
+        min_year: Optional[int] = Query(None, description="Selected minimum year (inclusive)"),
+        max_year: Optional[int] = Query(None, description="Selected maximum year (inclusive)"),
+        gender: Optional[str] = Query(None, description="Selected gender(s) (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Selected base colour(s) (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Selected season(s) (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Selected usage type(s) (comma-separated list, e.g., 'casual,sports')"),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service)
 ) -> FiltersResponseSchema:
     """
@@ -820,6 +1257,12 @@ async def get_filters_by_subcategory_route(
     Args:
         master_category_id: ID of the master category (required)
         subcategory_id: ID of the subcategory (required)
+        min_year: Selected minimum year
+        max_year: Selected maximum year
+        gender: Selected gender(s)
+        colour: Selected base colour(s)
+        season: Selected season(s)
+        usage: Selected usage type(s)
         catalog_service: Catalog service for data access
 
     Returns:
@@ -831,24 +1274,32 @@ async def get_filters_by_subcategory_route(
     return await get_filters_by_categories_controller(
         master_category_id=master_category_id,
         sub_category_id=subcategory_id,
+        min_year=min_year,
+        max_year=max_year,
+        gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         catalog_service=catalog_service
     )
 
 
 @router.get(
     API_PATHS["filters_by_article_type"],
+    dependencies=CONDITIONAL_GET,
     response_model=FiltersResponseSchema,
     status_code=200,
     summary="Get available filters for article type",
     description=(
             "<h3>This endpoint retrieves available filters for products in a specific article type. "
-            "It provides information about available filter options such as gender values and year ranges "
+            "It provides information about available filter options such as gender, colour, season and usage values "
+            "and year ranges "
             "based only on products within the specified article type. "
             "Clients can use this information to build dynamic filter UIs that adapt to the current article type state.</h3>"
     ),
     responses={
         404: {
-            "description": "No products found in the specified article type.",
+            "description": "Category not found or no products found in the specified article type.",
             "content": {
                 "application/json": {
                     "example": {"detail": "No products found in the specified categories. No filters available."}
@@ -878,6 +1329,12 @@ async def get_filters_by_article_type_route(
         master_category_id: int = Path(..., description="ID of the master category"),
         subcategory_id: int = Path(..., description="ID of the subcategory"),
         article_type_id: int = Path(..., description="ID of the article type"),
+        min_year: Optional[int] = Query(None, description="Selected minimum year (inclusive)"),
+        max_year: Optional[int] = Query(None, description="Selected maximum year (inclusive)"),
+        gender: Optional[str] = Query(None, description="Selected gender(s) (comma-separated list, e.g., 'men,women')"),
+        colour: Optional[str] = Query(None, description="Selected base colour(s) (comma-separated list, e.g., 'black,navy blue')"),
+        season: Optional[str] = Query(None, description="Selected season(s) (comma-separated list, e.g., 'summer,fall')"),
+        usage: Optional[str] = Query(None, description="Selected usage type(s) (comma-separated list, e.g., 'casual,sports')"),
         catalog_service: CatalogServiceInterface = Depends(get_catalog_service)
 ) -> FiltersResponseSchema:
     """
@@ -887,6 +1344,12 @@ async def get_filters_by_article_type_route(
         master_category_id: ID of the master category (required)
         subcategory_id: ID of the subcategory (required)
         article_type_id: ID of the article type (required)
+        min_year: Selected minimum year
+        max_year: Selected maximum year
+        gender: Selected gender(s)
+        colour: Selected base colour(s)
+        season: Selected season(s)
+        usage: Selected usage type(s)
         catalog_service: Catalog service for data access
 
     Returns:
@@ -899,5 +1362,11 @@ async def get_filters_by_article_type_route(
         master_category_id=master_category_id,
         sub_category_id=subcategory_id,
         article_type_id=article_type_id,
+        min_year=min_year,
+        max_year=max_year,
+        gender=gender,
+        colour=colour,
+        season=season,
+        usage=usage,
         catalog_service=catalog_service
     )
@@ -7,5 +7,17 @@ FILTERS_FULL_EXAMPLE = {
         "min": 2020,
         "max": 2023,
         "type": "range"
+    },
+    "colour": {
+        "values": ["Black", "Navy Blue", "White"],
+        "type": "checkbox"
+    },
+    "season": {
+        "values": ["Fall", "Summer"],
+        "type": "checkbox"
+    },
+    "usage": {
+        "values": ["Casual", "Sports"],
+        "type": "checkbox"
     }
 }
@@ -16,6 +16,16 @@ PRODUCT_EXAMPLE2 = {
     "slug": "comfortable-sandals-2",
 }
 
+PRODUCT_BATCH_EXAMPLE = {
+    "products": [PRODUCT_EXAMPLE2, PRODUCT_EXAMPLE1],
+    "missing_ids": [999999],
+}
+
+PRODUCT_BATCH_BY_SLUG_EXAMPLE = {
+    "products": [PRODUCT_EXAMPLE2, PRODUCT_EXAMPLE1],
+    "missing_slugs": ["unknown-product"],
+}
+
 PRODUCT_EXAMPLE3 = {
     "product_id": 3,
     "gender": "Women",
@@ -106,23 +116,26 @@ CATEGORY_MENU_EXAMPLE = {
         {
             "id": 1,
             "name": "Accessories",
+            "products_count": 2807,
             "sub_categories": [
                 {
                     "id": 29,
                     "name": "Accessories",
+                    "products_count": 34,
                     "article_types": [
-                        {"id": 89, "name": "Accessory Gift Set"},
-                        {"id": 133, "name": "Hair Accessory"},
-                        {"id": 146, "name": "Key chain"}
+                        {"id": 89, "name": "Accessory Gift Set", "products_count": 28},
+                        {"id": 133, "name": "Hair Accessory", "products_count": 4},
+                        {"id": 146, "name": "Key chain", "products_count": 2}
                     ]
                 },
                 {
                     "id": 8,
                     "name": "Bags",
+                    "products_count": 2773,
                     "article_types": [
-                        {"id": 45, "name": "Backpacks"},
-                        {"id": 43, "name": "Clutches"},
-                        {"id": 10, "name": "Handbags"}
+                        {"id": 45, "name": "Backpacks", "products_count": 724},
+                        {"id": 43, "name": "Clutches", "products_count": 290},
+                        {"id": 10, "name": "Handbags", "products_count": 1759}
                     ]
                 }
             ]
@@ -130,23 +143,26 @@ CATEGORY_MENU_EXAMPLE = {
         {
             "id": 2,
             "name": "Apparel",
+            "products_count": 11856,
             "sub_categories": [
                 {
                     "id": 2,
                     "name": "Bottomwear",
+                    "products_count": 1284,
                     "article_types": [
-                        {"id": 2, "name": "Jeans"},
-                        {"id": 24, "name": "Shorts"},
-                        {"id": 38, "name": "Skirts"}
+                        {"id": 2, "name": "Jeans", "products_count": 609},
+                        {"id": 24, "name": "Shorts", "products_count": 547},
+                        {"id": 38, "name": "Skirts", "products_count": 128}
                     ]
                 },
                 {
                     "id": 1,
                     "name": "Topwear",
+                    "products_count": 10572,
                     "article_types": [
-                        {"id": 1, "name": "Shirts"},
-                        {"id": 5, "name": "Tshirts"},
-                        {"id": 15, "name": "Sweatshirts"}
+                        {"id": 1, "name": "Shirts", "products_count": 3217},
+                        {"id": 5, "name": "Tshirts", "products_count": 7070},
+                        {"id": 15, "name": "Sweatshirts", "products_count": 285}
                     ]
                 }
             ]
@@ -154,14 +170,16 @@ CATEGORY_MENU_EXAMPLE = {
         {
             "id": 3,
             "name": "Footwear",
+            "products_count": 5519,
             "sub_categories": [
                 {
                     "id": 5,
                     "name": "Shoes",
+                    "products_count": 5519,
                     "article_types": [
-                        {"id": 7, "name": "Casual Shoes"},
-                        {"id": 17, "name": "Formal Shoes"},
-                        {"id": 23, "name": "Sports Shoes"}
+                        {"id": 7, "name": "Casual Shoes", "products_count": 2846},
+                        {"id": 17, "name": "Formal Shoes", "products_count": 637},
+                        {"id": 23, "name": "Sports Shoes", "products_count": 2036}
                     ]
                 }
             ]
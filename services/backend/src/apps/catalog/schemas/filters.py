@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Dict
 
 from pydantic import BaseModel
 
@@ -7,12 +7,14 @@ class RangeFilterSchema(BaseModel):
     """Schema for range filter data"""
     min: int
     max: int
+    counts: Dict[int, int] = {}
     type: str = "range"
 
 
 class CheckboxFilterSchema(BaseModel):
     """Schema for checkbox filter data"""
     values: List[str]
+    counts: Dict[str, int] = {}
     type: str = "checkbox"
 
 
@@ -20,3 +22,7 @@ class FiltersResponseSchema(BaseModel):
     """API response schema for filters data"""
     gender: Optional[CheckboxFilterSchema] = None
     year: Optional[RangeFilterSchema] = None
+    colour: Optional[CheckboxFilterSchema] = None
+    season: Optional[CheckboxFilterSchema] = None
+    usage: Optional[CheckboxFilterSchema] = None
+    total_items: int = 0
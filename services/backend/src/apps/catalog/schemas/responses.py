@@ -7,30 +7,46 @@ class ProductSchema(BaseModel):
     """Schema for product information in API responses"""
     product_id: int
     gender: str
-    year: int
+    year: Optional[int] = None
     product_display_name: str
     image_url: str
     slug: str
 
+class ProductBatchResponseSchema(BaseModel):
+    """Schema for batch product lookup by IDs"""
+    products: list[ProductSchema]
+    missing_ids: list[int] = []
+
+
+class ProductBatchBySlugResponseSchema(BaseModel):
+    """Schema for batch product lookup by slugs"""
+    products: list[ProductSchema]
+    missing_slugs: list[str] = []
+
+
 class ProductListResponseSchema(BaseModel):
     """Schema for paginated product list response with navigation links"""
     products: list[ProductSchema]
     prev_page: Optional[str] = None
     next_page: Optional[str] = None
+    next_cursor: Optional[str] = None
     total_pages: int
     total_items: int
+    count_mode: str = "exact"
 
 
 class ArticleTypeSchema(BaseModel):
     """Schema for article type information in API responses"""
     id: int
     name: str
+    products_count: int = 0
 
 
 class SubCategorySchema(BaseModel):
     """Schema for subcategory information with article types in API responses"""
     id: int
     name: str
+    products_count: int = 0
     article_types: list[ArticleTypeSchema] = []
 
 
@@ -38,6 +54,7 @@ class MasterCategorySchema(BaseModel):
     """Schema for master category information with subcategories in API responses"""
     id: int
     name: str
+    products_count: int = 0
     sub_categories: list[SubCategorySchema] = []
 
 
@@ -1,9 +1,9 @@
-from typing import Optional, Callable
+from typing import Optional, Callable, Collection, Awaitable, Sequence, AsyncIterator
 
 from apps.catalog.dto.catalog import CatalogDTO, PaginationDTO
-from apps.catalog.dto.category import CategoryMenuDTO
+from apps.catalog.dto.category import CategoryMenuDTO, CategoryMenuPayloadDTO
 from apps.catalog.dto.filters import FiltersDTO
-from apps.catalog.dto.products import ProductDTO
+from apps.catalog.dto.products import ProductDTO, ProductBatchDTO
 from apps.catalog.interfaces.repositories import (
     ProductRepositoryInterface,
     CategoryRepositoryInterface
@@ -16,13 +16,25 @@ from apps.catalog.interfaces.specifications import (
     SearchSpecificationInterface,
     CategorySpecificationInterface
 )
+from apps.catalog.services.exceptions import CategoryNotFoundError
+from cache.decorators import cached
+from cache.interfaces import CacheInterface
 from search.interfaces import AutocompleteClientInterface
 
-PaginationSpecificationFactory = Callable[[int, int], PaginationSpecificationInterface]
+PRODUCT_ID_CACHE_KEY = "id:{}"
+PRODUCT_SLUG_CACHE_KEY = "slug:{}"
+
+PaginationSpecificationFactory = Callable[[int, int, Optional[str]], PaginationSpecificationInterface]
 OrderingSpecificationFactory = Callable[[Optional[str]], OrderingSpecificationInterface]
-FilterSpecificationFactory = Callable[[Optional[int], Optional[int], Optional[str]], FilterSpecificationInterface]
+FilterSpecificationFactory = Callable[
+    [Optional[int], Optional[int], Optional[str], Optional[str], Optional[str], Optional[str]],
+    FilterSpecificationInterface
+]
 SearchSpecificationFactory = Callable[[Optional[str]], SearchSpecificationInterface]
-CategorySpecificationFactory = Callable[[int, Optional[int], Optional[int]], CategorySpecificationInterface]
+CategorySpecificationFactory = Callable[
+    [int, Optional[int], Optional[int], Optional[Collection[int]]],
+    CategorySpecificationInterface
+]
 
 
 class CatalogService(CatalogServiceInterface):
@@ -37,7 +49,10 @@ class CatalogService(CatalogServiceInterface):
             filter_specification_factory: FilterSpecificationFactory,
             search_specification_factory: SearchSpecificationFactory,
             category_specification_factory: CategorySpecificationFactory,
-            autocomplete_client: AutocompleteClientInterface
+            autocomplete_client: AutocompleteClientInterface,
+            filters_cache: Optional[CacheInterface] = None,
+            product_cache: Optional[CacheInterface] = None,
+            product_not_found_ttl: Optional[int] = None
     ):
         """
         Initialize catalog service
@@ -51,6 +66,9 @@ class CatalogService(CatalogServiceInterface):
             search_specification_factory: Factory for creating search specifications
             category_specification_factory: Factory for creating category specifications
             autocomplete_client: Client for autocomplete operations
+            filters_cache: Optional cache for available filters
+            product_cache: Optional cache for product details keyed by "id:<id>" and "slug:<slug>"
+            product_not_found_ttl: Time to live in seconds of cached "not found" product lookups
         """
         self._product_repository = product_repository
         self._category_repository = category_repository
@@ -60,6 +78,9 @@ class CatalogService(CatalogServiceInterface):
         self._search_specification_factory = search_specification_factory
         self._category_specification_factory = category_specification_factory
         self._autocomplete_client = autocomplete_client
+        self._filters_cache = filters_cache
+        self._product_cache = product_cache
+        self._product_not_found_ttl = product_not_found_ttl
 
     async def get_products(
             self,
@@ -69,7 +90,11 @@ class CatalogService(CatalogServiceInterface):
             min_year: Optional[int] = None,
             max_year: Optional[int] = None,
             gender: Optional[str] = None,
-            q: Optional[str] = None
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None,
+            q: Optional[str] = None,
+            cursor: Optional[str] = None
     ) -> CatalogDTO:
         """
         Get paginated, sorted and filtered products
@@ -81,41 +106,48 @@ class CatalogService(CatalogServiceInterface):
             min_year: Minimum year filter
             max_year: Maximum year filter
             gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
             q: Search query string
+            cursor: Opaque keyset cursor from a previous page, replaces page-based offset
 
         Returns:
             CatalogDTO with products and pagination info
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or doesn't match the ordering, search or filters
         """
-        pagination_spec = self._pagination_specification_factory(page, per_page)
+        pagination_spec = self._pagination_specification_factory(page, per_page, cursor)
 
         ordering_spec = self._ordering_specification_factory(ordering)
 
-        filter_spec = None
-        if min_year is not None or max_year is not None or gender:
-            filter_spec = self._filter_specification_factory(min_year, max_year, gender)
+        filter_spec = self._create_filter_specification(min_year, max_year, gender, colour, season, usage)
 
         search_spec = None
         if q:
             search_spec = self._search_specification_factory(q)
 
-        products = await self._product_repository.get_products_with_specifications(
+        products_page = await self._product_repository.get_products_with_total(
             pagination_spec,
             ordering_spec,
             filter_spec,
             search_spec
         )
 
-        total = await self._product_repository.get_products_count(filter_spec, search_spec)
+        total = products_page.total_items
 
         total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
 
         return CatalogDTO(
-            products=products,
+            products=products_page.products,
             pagination=PaginationDTO(
                 page=page,
                 per_page=per_page,
                 total_items=total,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=products_page.next_cursor,
+                count_mode=products_page.count_mode
             )
         )
 
@@ -130,7 +162,11 @@ class CatalogService(CatalogServiceInterface):
             min_year: Optional[int] = None,
             max_year: Optional[int] = None,
             gender: Optional[str] = None,
-            q: Optional[str] = None
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None,
+            q: Optional[str] = None,
+            cursor: Optional[str] = None
     ) -> CatalogDTO:
         """
         Get products filtered by category with pagination, sorting and filtering
@@ -145,28 +181,34 @@ class CatalogService(CatalogServiceInterface):
             min_year: Minimum year filter
             max_year: Maximum year filter
             gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
             q: Search query string
+            cursor: Opaque keyset cursor from a previous page, replaces page-based offset
 
         Returns:
             CatalogDTO with products and pagination info
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or doesn't match the ordering, search or filters
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
         """
-        category_spec = self._category_specification_factory(
+        category_spec = await self._create_category_specification(
             master_category_id, sub_category_id, article_type_id
         )
 
-        pagination_spec = self._pagination_specification_factory(page, per_page)
+        pagination_spec = self._pagination_specification_factory(page, per_page, cursor)
 
         ordering_spec = self._ordering_specification_factory(ordering)
 
-        filter_spec = None
-        if min_year is not None or max_year is not None or gender:
-            filter_spec = self._filter_specification_factory(min_year, max_year, gender)
+        filter_spec = self._create_filter_specification(min_year, max_year, gender, colour, season, usage)
 
         search_spec = None
         if q:
             search_spec = self._search_specification_factory(q)
 
-        products = await self._product_repository.get_products_with_specifications_by_categories(
+        products_page = await self._product_repository.get_products_with_total_by_categories(
             category_spec,
             pagination_spec,
             ordering_spec,
@@ -174,24 +216,85 @@ class CatalogService(CatalogServiceInterface):
             search_spec
         )
 
-        total = await self._product_repository.get_products_count_by_categories(
-            category_spec,
-            filter_spec,
-            search_spec
-        )
+        total = products_page.total_items
 
         total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
 
         return CatalogDTO(
-            products=products,
+            products=products_page.products,
             pagination=PaginationDTO(
                 page=page,
                 per_page=per_page,
                 total_items=total,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=products_page.next_cursor,
+                count_mode=products_page.count_mode
             )
         )
 
+    async def export_products(
+            self,
+            ordering: Optional[str] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None,
+            q: Optional[str] = None,
+            master_category_id: Optional[int] = None,
+            sub_category_id: Optional[int] = None,
+            article_type_id: Optional[int] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[ProductDTO]:
+        """
+        Get every product matching the filters as a stream for export
+
+        Specifications are built and categories are resolved before this method returns,
+        so invalid requests fail before any row is streamed.
+
+        Args:
+            ordering: Ordering string (comma-separated fields with optional "-" prefix for descending)
+            min_year: Minimum year filter
+            max_year: Maximum year filter
+            gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
+            q: Search query string
+            master_category_id: ID of the master category (optional)
+            sub_category_id: ID of the sub-category (optional, requires master_category_id)
+            article_type_id: ID of the article type (optional, requires sub_category_id)
+            batch_size: Number of rows fetched from the database per round trip
+
+        Returns:
+            Async iterator over product DTOs
+
+        Raises:
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
+        """
+        category_spec = None
+        if master_category_id is not None:
+            category_spec = await self._create_category_specification(
+                master_category_id, sub_category_id, article_type_id
+            )
+
+        ordering_spec = self._ordering_specification_factory(ordering)
+
+        filter_spec = self._create_filter_specification(min_year, max_year, gender, colour, season, usage)
+
+        search_spec = None
+        if q:
+            search_spec = self._search_specification_factory(q)
+
+        return self._product_repository.stream_products(
+            ordering_spec,
+            filter_spec,
+            search_spec,
+            category_spec,
+            batch_size
+        )
+
     async def get_product_by_id(self, product_id: int) -> Optional[ProductDTO]:
         """
         Get detailed information about a single product by its ID
@@ -202,7 +305,10 @@ class CatalogService(CatalogServiceInterface):
         Returns:
             ProductDTO with detailed product information if found, None otherwise
         """
-        return await self._product_repository.get_product_by_id(product_id)
+        return await self._get_cached_product(
+            PRODUCT_ID_CACHE_KEY.format(product_id),
+            lambda: self._product_repository.get_product_by_id(product_id)
+        )
 
     async def get_product_by_slug(self, slug: str) -> Optional[ProductDTO]:
         """
@@ -214,14 +320,57 @@ class CatalogService(CatalogServiceInterface):
         Returns:
             ProductDTO with detailed product information if found, None otherwise
         """
-        return await self._product_repository.get_product_by_slug(slug)
+        return await self._get_cached_product(
+            PRODUCT_SLUG_CACHE_KEY.format(slug),
+            lambda: self._product_repository.get_product_by_slug(slug)
+        )
+
+    async def get_products_by_ids(self, product_ids: Sequence[int]) -> ProductBatchDTO:
+        """
+        Get several products by their IDs at once
 
-    async def get_available_filters(self, q: Optional[str] = None) -> Optional[FiltersDTO]:
+        Args:
+            product_ids: IDs of the products to retrieve, duplicates are ignored
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing IDs
+        """
+        return await self._product_repository.get_products_by_ids(list(dict.fromkeys(product_ids)))
+
+    async def get_products_by_slugs(self, slugs: Sequence[str]) -> ProductBatchDTO:
+        """
+        Get several products by their slugs at once
+
+        Args:
+            slugs: Slugs of the products to retrieve, duplicates are ignored
+
+        Returns:
+            ProductBatchDTO with found products in requested order and the missing slugs
+        """
+        return await self._product_repository.get_products_by_slugs(list(dict.fromkeys(slugs)))
+
+    @cached("filters", cache_attr="_filters_cache")
+    async def get_available_filters(
+            self,
+            q: Optional[str] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None
+    ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on the actual data
 
         Args:
             q: Optional search query to limit filters to relevant options
+            min_year: Selected minimum year
+            max_year: Selected maximum year
+            gender: Selected gender(s) (comma-separated)
+            colour: Selected base colour(s) (comma-separated)
+            season: Selected season(s) (comma-separated)
+            usage: Selected usage type(s) (comma-separated)
 
         Returns:
             FiltersDTO object containing all available filters or None if catalog is empty
@@ -230,13 +379,22 @@ class CatalogService(CatalogServiceInterface):
         if q:
             search_spec = self._search_specification_factory(q)
 
-        return await self._product_repository.get_available_filters(search_spec)
+        filter_spec = self._create_filter_specification(min_year, max_year, gender, colour, season, usage)
 
+        return await self._product_repository.get_available_filters(search_spec, filter_spec)
+
+    @cached("category_filters", cache_attr="_filters_cache")
     async def get_available_filters_by_categories(
             self,
             master_category_id: int,
             sub_category_id: Optional[int] = None,
-            article_type_id: Optional[int] = None
+            article_type_id: Optional[int] = None,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None
     ) -> Optional[FiltersDTO]:
         """
         Get available filters and their possible values based on products in specific categories
@@ -245,15 +403,26 @@ class CatalogService(CatalogServiceInterface):
             master_category_id: ID of the master category (required)
             sub_category_id: ID of the sub-category (optional)
             article_type_id: ID of the article type (optional)
+            min_year: Selected minimum year
+            max_year: Selected maximum year
+            gender: Selected gender(s) (comma-separated)
+            colour: Selected base colour(s) (comma-separated)
+            season: Selected season(s) (comma-separated)
+            usage: Selected usage type(s) (comma-separated)
 
         Returns:
             FiltersDTO object containing all available filters for the specified categories or None if no products found
+
+        Raises:
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
         """
-        category_spec = self._category_specification_factory(
+        category_spec = await self._create_category_specification(
             master_category_id, sub_category_id, article_type_id
         )
 
-        return await self._product_repository.get_available_filters_by_categories(category_spec)
+        filter_spec = self._create_filter_specification(min_year, max_year, gender, colour, season, usage)
+
+        return await self._product_repository.get_available_filters_by_categories(category_spec, filter_spec)
 
     async def get_category_menu(self) -> Optional[CategoryMenuDTO]:
         """
@@ -265,6 +434,15 @@ class CatalogService(CatalogServiceInterface):
         """
         return await self._category_repository.get_category_menu()
 
+    async def get_category_menu_payload(self) -> CategoryMenuPayloadDTO:
+        """
+        Get the complete category menu pre-serialized to JSON with its ETag
+
+        Returns:
+            CategoryMenuPayloadDTO: Encoded menu, ETag and number of master categories
+        """
+        return await self._category_repository.get_category_menu_payload()
+
     async def get_product_suggestions(self, query: str, limit: int = 10) -> list[str]:
         """
         Get product name suggestions for autocomplete
@@ -277,3 +455,87 @@ class CatalogService(CatalogServiceInterface):
             List of product name suggestions
         """
         return await self._autocomplete_client.get_suggestions(query, limit)
+
+    async def _get_cached_product(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Optional[ProductDTO]]]
+    ) -> Optional[ProductDTO]:
+        """
+        Get product through the product cache, caching "not found" results with a shorter TTL
+
+        Args:
+            key: Product cache key
+            loader: Repository lookup run on a cache miss
+
+        Returns:
+            ProductDTO if found, None otherwise
+        """
+        if self._product_cache is None:
+            return await loader()
+
+        return await self._product_cache.get_or_set(key, loader, negative_ttl=self._product_not_found_ttl)
+
+    def _create_filter_specification(
+            self,
+            min_year: Optional[int] = None,
+            max_year: Optional[int] = None,
+            gender: Optional[str] = None,
+            colour: Optional[str] = None,
+            season: Optional[str] = None,
+            usage: Optional[str] = None
+    ) -> Optional[FilterSpecificationInterface]:
+        """
+        Create filter specification from request filters
+
+        Args:
+            min_year: Minimum year filter
+            max_year: Maximum year filter
+            gender: Gender filter (comma-separated list)
+            colour: Base colour filter (comma-separated list)
+            season: Season filter (comma-separated list)
+            usage: Usage type filter (comma-separated list)
+
+        Returns:
+            Filter specification, or None if no filter is set
+        """
+        if min_year is None and max_year is None and not any((gender, colour, season, usage)):
+            return None
+
+        return self._filter_specification_factory(min_year, max_year, gender, colour, season, usage)
+
+    async def _create_category_specification(
+            self,
+            master_category_id: int,
+            sub_category_id: Optional[int] = None,
+            article_type_id: Optional[int] = None
+    ) -> CategorySpecificationInterface:
+        """
+        Create category specification with article type ids resolved from the in-memory category hierarchy
+
+        Args:
+            master_category_id: ID of the master category
+            sub_category_id: ID of the sub-category (optional)
+            article_type_id: ID of the article type (optional)
+
+        Returns:
+            Category specification filtering by the resolved article type ids
+
+        Raises:
+            CategoryNotFoundError: If a category id is unknown or doesn't belong to its parent
+        """
+        hierarchy = await self._category_repository.get_category_hierarchy()
+
+        article_type_ids = hierarchy.resolve_article_type_ids(
+            master_category_id, sub_category_id, article_type_id
+        )
+
+        if article_type_ids is None:
+            raise CategoryNotFoundError(
+                f"Category not found: master_category_id={master_category_id}, "
+                f"sub_category_id={sub_category_id}, article_type_id={article_type_id}"
+            )
+
+        return self._category_specification_factory(
+            master_category_id, sub_category_id, article_type_id, article_type_ids
+        )
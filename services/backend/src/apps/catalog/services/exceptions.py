@@ -0,0 +1,14 @@
+"""Catalog service exceptions - business logic errors for catalog scenarios"""
+
+
+class CatalogServiceError(Exception):
+    """Base exception for all catalog service errors"""
+
+    def __init__(self, message: str, original_error: Exception = None):
+        super().__init__(message)
+        self.original_error = original_error
+
+
+class CategoryNotFoundError(CatalogServiceError):
+    """Raised when a category id is unknown or does not belong to its parent category"""
+    pass
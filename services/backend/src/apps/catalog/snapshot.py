@@ -0,0 +1,244 @@
+import asyncio
+import time
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from apps.catalog.dto.filters import FiltersDTO
+from apps.catalog.enums.facet import FacetEnum
+from apps.catalog.facet_index import BitmapFacetIndex
+from apps.catalog.interfaces.snapshot import CatalogSnapshotManagerInterface
+from apps.catalog.interfaces.specifications import (
+    FilterSpecificationInterface,
+    CategorySpecificationInterface
+)
+from db.dto import BatchQueryDTO
+from db.interfaces import DAOInterface
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "catalog")
+
+
+class CatalogSnapshot:
+    """
+    In-memory index of the filterable product attributes
+
+    The attributes are held only as the bitsets of a BitmapFacetIndex, which answers
+    counts and facets of filter and category specifications without SQL.
+    """
+
+    COLUMNS = (
+        "gender",
+        "year",
+        "master_category_id",
+        "sub_category_id",
+        "article_type_id",
+        "base_colour_id",
+        "season_id",
+        "usage_type_id",
+    )
+
+    def __init__(self, facet_index: BitmapFacetIndex):
+        """
+        Initialize snapshot from its index
+
+        Args:
+            facet_index: Bitmap index over the products
+        """
+        self.facet_index = facet_index
+
+    @classmethod
+    def from_rows(
+            cls,
+            rows: Iterable[Tuple],
+            names: Optional[Mapping[FacetEnum, Mapping[int, str]]] = None
+    ) -> 'CatalogSnapshot':
+        """
+        Build snapshot from product rows
+
+        Colour, season and usage type ids are indexed by name, ids without a name are unknown.
+
+        Args:
+            rows: Rows of the COLUMNS in order
+            names: Name of every id, per lookup facet (colour, season, usage)
+
+        Returns:
+            CatalogSnapshot
+        """
+        rows = list(rows)
+        facets = {facet.column: facet for facet in FacetEnum}
+        columns = {}
+
+        for position, column in enumerate(cls.COLUMNS):
+            attribute = facets.get(column, column)
+            values = [row[position] for row in rows]
+            if attribute in FacetEnum.lookup_facets():
+                labels = (names or {}).get(attribute, {})
+                values = [labels.get(value) for value in values]
+            columns[attribute] = values
+
+        return cls(BitmapFacetIndex.from_columns(len(rows), columns))
+
+    def __len__(self) -> int:
+        return len(self.facet_index)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index bitsets"""
+        return self.facet_index.nbytes
+
+    def count(
+            self,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None
+    ) -> int:
+        """
+        Count products matching the specifications
+
+        Args:
+            filter_spec: Optional specification for filtering results
+            category_spec: Optional specification for category filtering
+
+        Returns:
+            Number of matching products
+        """
+        if (filter_spec is None or filter_spec.is_empty()) and (category_spec is None or category_spec.is_empty()):
+            return len(self)
+        return self.facet_index.count(filter_spec, category_spec)
+
+    def get_facets(
+            self,
+            filter_spec: Optional[FilterSpecificationInterface] = None,
+            category_spec: Optional[CategorySpecificationInterface] = None
+    ) -> Optional[FiltersDTO]:
+        """
+        Get available filters with per-value counts of matching products
+
+        Args:
+            filter_spec: Optional specification for filtering results
+            category_spec: Optional specification for category filtering
+
+        Returns:
+            FiltersDTO with available filters or None if no products are in the category
+        """
+        return self.facet_index.get_facets(filter_spec, category_spec)
+
+
+class CatalogSnapshotManager(CatalogSnapshotManagerInterface):
+    """
+    Holds the current catalog snapshot and rebuilds it in the background when catalog data changes
+
+    A rebuild reloads every product, so it waits reload_delay seconds after the first
+    invalidation and serves all invalidations arriving in the meantime with one load.
+    """
+
+    APP_NAME = "catalog"
+
+    def __init__(self, dao: DAOInterface, reload_delay: float = 0.0):
+        """
+        Initialize snapshot manager
+
+        Args:
+            dao: Data Access Object for database operations
+            reload_delay: Seconds to wait before a background rebuild, coalescing bursts of writes
+        """
+        self._dao = dao
+        self._reload_delay = reload_delay
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._reload_task: Optional[asyncio.Task] = None
+        self._generation = 0
+
+    def get_snapshot(self) -> Optional[CatalogSnapshot]:
+        """
+        Get the current snapshot, scheduling a rebuild if there is none
+
+        Returns:
+            Current snapshot, or None while it is being rebuilt
+        """
+        if self._snapshot is None:
+            self._schedule_reload()
+        return self._snapshot
+
+    async def load(self) -> CatalogSnapshot:
+        """
+        Load a fresh snapshot from the database and make it current
+
+        A snapshot invalidated while it was loading is returned but not made current,
+        because changes committed during the load may be missing from it.
+
+        Returns:
+            Loaded snapshot
+        """
+        generation = self._generation
+        columns = ", ".join(CatalogSnapshot.COLUMNS)
+        query = f"SELECT {columns} FROM {self.APP_NAME}_products"
+        logger.info(f"Catalog snapshot query: {query}")
+
+        # Products and lookup names are read from one database snapshot in one pipelined round trip
+        name_queries = self._name_queries()
+        started_at = time.perf_counter()
+        rows, *name_rows = await self._dao.execute_batch(
+            [BatchQueryDTO(query), *(BatchQueryDTO(name_query) for name_query in name_queries.values())],
+            consistent_read=True
+        )
+        names = {facet: dict(facet_rows or []) for facet, facet_rows in zip(name_queries, name_rows)}
+        snapshot = CatalogSnapshot.from_rows(rows or [], names)
+
+        if generation == self._generation:
+            self._snapshot = snapshot
+        logger.info(
+            f"Catalog snapshot loaded: {len(snapshot)} products, {snapshot.nbytes / 1024:.0f} KiB "
+            f"in {(time.perf_counter() - started_at) * 1000:.0f} ms"
+        )
+        return snapshot
+
+    def _name_queries(self) -> Dict[FacetEnum, str]:
+        """
+        Build the queries loading the names of colour, season and usage type ids
+
+        Returns:
+            Query selecting (id, name) rows, per lookup facet
+        """
+        queries = {}
+        for facet in FacetEnum.lookup_facets():
+            queries[facet] = f"SELECT {facet.column}, name FROM {self.APP_NAME}_{facet.lookup_table}"
+            logger.info(f"Catalog snapshot query: {queries[facet]}")
+        return queries
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop the current snapshot and rebuild it in the background
+
+        Requests fall back to SQL until the rebuild completes. Invalidations arriving
+        before the rebuild starts loading are served by the same rebuild.
+
+        Args:
+            key: Invalidated key, ignored because any product change affects the whole snapshot
+        """
+        self._snapshot = None
+        self._generation += 1
+        self._schedule_reload()
+
+    async def close(self) -> None:
+        """Cancel a running rebuild"""
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            try:
+                await self._reload_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reload_task = None
+
+    def _schedule_reload(self) -> None:
+        """Start a background rebuild unless one is already running"""
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.get_running_loop().create_task(self._reload())
+
+    async def _reload(self) -> None:
+        """Rebuild until a load completes without being invalidated"""
+        while self._snapshot is None:
+            if self._reload_delay > 0:
+                await asyncio.sleep(self._reload_delay)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.error(f"Catalog snapshot load failed: {e}")
+                return
@@ -1,4 +1,4 @@
-from typing import Optional, List, Any, Tuple
+from typing import Optional, List, Any, Tuple, Collection, Sequence
 
 from apps.catalog.interfaces.specifications import CategorySpecificationInterface
 
@@ -12,12 +12,33 @@ class CategorySpecification(CategorySpecificationInterface):
             self,
             master_category_id: int,
             sub_category_id: Optional[int] = None,
-            article_type_id: Optional[int] = None
+            article_type_id: Optional[int] = None,
+            article_type_ids: Optional[Collection[int]] = None
     ):
         self._master_id = master_category_id
         self._sub_id = sub_category_id
         self._article_id = article_type_id
+        self._article_type_ids = sorted(article_type_ids) if article_type_ids is not None else None
 
+    @property
+    def master_category_id(self) -> Optional[int]:
+        """Get the master category ID"""
+        return self._master_id
+
+    @property
+    def sub_category_id(self) -> Optional[int]:
+        """Get the subcategory ID, None if not filtered by subcategory"""
+        return self._sub_id
+
+    @property
+    def article_type_id(self) -> Optional[int]:
+        """Get the article type ID, None if not filtered by article type"""
+        return self._article_id
+
+    @property
+    def article_type_ids(self) -> Optional[Sequence[int]]:
+        """Get the article type ids resolved from the category hierarchy, None if not resolved"""
+        return self._article_type_ids
 
     def is_empty(self) -> bool:
         """Check if specification is empty"""
@@ -25,32 +46,32 @@ class CategorySpecification(CategorySpecificationInterface):
 
     def to_sql(self) -> Tuple[str, List[Any]]:
         """
-        Convert to SQL parts for joining and filtering by categories
+        Convert to SQL conditions for filtering by categories
+
+        Only the denormalized category keys on the products table are filtered, so no
+        joins are needed. When the article type ids of the category are already resolved
+        from the category hierarchy, the category is known to exist and only its most
+        specific key is compared, which the (key, year, id) and (key, id) indexes serve
+        in listing order. Otherwise every given key is compared, so a subcategory outside
+        its master category matches nothing.
 
         Returns:
-            Tuple[str, List[Any]]: SQL part (joins + conditions), list of parameters
+            Tuple[str, List[Any]]: SQL part (WHERE conditions), list of parameters
         """
-        joins = []
-        conditions = []
-        params = []
-
-        joins.append(
-            f"JOIN {self.APP_NAME}_article_type at ON {self.APP_NAME}_products.article_type_id = at.article_type_id"
-        )
-        joins.append(f"JOIN {self.APP_NAME}_sub_category sc ON at.sub_category_id = sc.sub_category_id")
-        joins.append(f"JOIN {self.APP_NAME}_master_category mc ON sc.master_category_id = mc.master_category_id")
-
-        conditions.append("mc.master_category_id = %s")
-        params.append(self._master_id)
+        table = f"{self.APP_NAME}_products"
 
+        keys = [("master_category_id", self._master_id)]
         if self._sub_id is not None:
-            conditions.append("sc.sub_category_id = %s")
-            params.append(self._sub_id)
-
+            keys.append(("sub_category_id", self._sub_id))
         if self._article_id is not None:
-            conditions.append("at.article_type_id = %s")
-            params.append(self._article_id)
+            keys.append(("article_type_id", self._article_id))
+
+        if self._article_type_ids is not None:
+            keys = keys[-1:]
+
+        conditions = [f"{table}.{column} = %s" for column, _ in keys]
+        params = [value for _, value in keys]
 
-        sql_part = " ".join(joins) + " WHERE " + " AND ".join(conditions)
+        sql_part = "WHERE " + " AND ".join(conditions)
 
         return sql_part, params
@@ -0,0 +1,14 @@
+"""Catalog specification exceptions - errors raised while building query specifications"""
+
+
+class SpecificationError(Exception):
+    """Base exception for all catalog specification errors"""
+
+    def __init__(self, message: str, original_error: Exception = None):
+        super().__init__(message)
+        self.original_error = original_error
+
+
+class InvalidCursorError(SpecificationError):
+    """Raised when a pagination cursor is malformed or doesn't match the requested ordering, search or filters"""
+    pass
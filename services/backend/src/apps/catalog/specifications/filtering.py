@@ -4,18 +4,66 @@ from typing import (
     Any,
     Optional,
     Union,
-    Set
+    Set,
+    Dict,
+    AbstractSet
 )
+from apps.catalog.enums.facet import FacetEnum
 from apps.catalog.interfaces.specifications import FilterSpecificationInterface
 
 
 class ProductFilterSpecification(FilterSpecificationInterface):
     """Specification for filtering products"""
 
+    APP_NAME = "catalog"
+
     def __init__(self):
         self._min_year: Optional[int] = None
         self._max_year: Optional[int] = None
         self._genders: Optional[Set[str]] = None
+        self._names: Dict[FacetEnum, Set[str]] = {}
+
+    @property
+    def min_year(self) -> Optional[int]:
+        """Get the minimum year (inclusive), None if unbounded"""
+        return self._min_year
+
+    @property
+    def max_year(self) -> Optional[int]:
+        """Get the maximum year (inclusive), None if unbounded"""
+        return self._max_year
+
+    @property
+    def genders(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted genders, None or empty if not filtered by gender"""
+        return self._genders
+
+    @property
+    def colours(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted base colour names (lowercase), None or empty if not filtered by colour"""
+        return self._names.get(FacetEnum.COLOUR)
+
+    @property
+    def seasons(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted season names (lowercase), None or empty if not filtered by season"""
+        return self._names.get(FacetEnum.SEASON)
+
+    @property
+    def usage_types(self) -> Optional[AbstractSet[str]]:
+        """Get the accepted usage type names (lowercase), None or empty if not filtered by usage"""
+        return self._names.get(FacetEnum.USAGE)
+
+    def get_names(self, facet: FacetEnum) -> Optional[AbstractSet[str]]:
+        """
+        Get the accepted names of a lookup facet
+
+        Args:
+            facet: Facet backed by a lookup table (colour, season or usage)
+
+        Returns:
+            Lowercase names, None or empty if not filtered by the facet
+        """
+        return self._names.get(facet)
 
     def set_year_range(self, min_year: Optional[int] = None, max_year: Optional[int] = None) -> None:
         """
@@ -41,6 +89,19 @@ class ProductFilterSpecification(FilterSpecificationInterface):
 
         self._genders = {self._capitalize_gender(gender) for gender in genders if gender}
 
+    def set_names(self, facet: FacetEnum, names: Union[str, List[str]]) -> None:
+        """
+        Set the accepted names of a lookup facet
+
+        Args:
+            facet: Facet backed by a lookup table (colour, season or usage)
+            names: Name or list of names to filter by, matched case-insensitively
+        """
+        if isinstance(names, str):
+            names = names.split(',')
+
+        self._names[facet] = {name.strip().lower() for name in names if name and name.strip()}
+
     @staticmethod
     def _capitalize_gender(gender: str) -> str:
         """
@@ -54,6 +115,27 @@ class ProductFilterSpecification(FilterSpecificationInterface):
         """
         return gender.strip().capitalize() if gender else ''
 
+    def without(self, facet: FacetEnum) -> 'ProductFilterSpecification':
+        """
+        Get a copy of the specification without the predicate on one facet
+
+        Args:
+            facet: Facet whose predicate is dropped
+
+        Returns:
+            New filter specification
+        """
+        spec = ProductFilterSpecification()
+        spec._min_year, spec._max_year, spec._genders = self._min_year, self._max_year, self._genders
+        spec._names = {name_facet: names for name_facet, names in self._names.items() if name_facet != facet}
+
+        if facet == FacetEnum.YEAR:
+            spec.set_year_range()
+        elif facet == FacetEnum.GENDER:
+            spec._genders = None
+
+        return spec
+
     def is_empty(self) -> bool:
         """
         Check if filter specification has any filters
@@ -64,7 +146,8 @@ class ProductFilterSpecification(FilterSpecificationInterface):
         return (
                 self._min_year is None and
                 self._max_year is None and
-                (self._genders is None or len(self._genders) == 0)
+                (self._genders is None or len(self._genders) == 0) and
+                not any(self._names.values())
         )
 
     def to_sql(self) -> Tuple[str, List[Any]]:
@@ -88,7 +171,16 @@ class ProductFilterSpecification(FilterSpecificationInterface):
         if self._genders and len(self._genders) > 0:
             placeholders = ', '.join(['%s'] * len(self._genders))
             conditions.append(f"gender IN ({placeholders})")
-            params.extend(self._genders)
+            params.extend(sorted(self._genders))
+
+        for facet, names in self._names.items():
+            if names:
+                table = f"{self.APP_NAME}_{facet.lookup_table}"
+                conditions.append(
+                    f"{self.APP_NAME}_products.{facet.column} IN "
+                    f"(SELECT {facet.column} FROM {table} WHERE lower(name) = ANY(%s))"
+                )
+                params.append(sorted(names))
 
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
@@ -110,3 +202,5 @@ class ProductFilterSpecification(FilterSpecificationInterface):
             self._max_year = int(value)
         elif field == 'gender' and value:
             self.set_genders(value)
+        elif field in (facet.value for facet in FacetEnum.lookup_facets()) and value:
+            self.set_names(FacetEnum(field), value)
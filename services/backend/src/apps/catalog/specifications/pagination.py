@@ -1,6 +1,11 @@
-from typing import Any
+import base64
+import binascii
+import json
+from typing import Any, Optional
 
+from apps.catalog.dto.catalog import CursorDTO
 from apps.catalog.interfaces.specifications import PaginationSpecificationInterface
+from apps.catalog.specifications.exceptions import InvalidCursorError
 
 
 class PaginationSpecification(PaginationSpecificationInterface):
@@ -19,3 +24,84 @@ class PaginationSpecification(PaginationSpecificationInterface):
 
     def get_limit(self) -> int:
         return self._limit
+
+    def get_cursor(self) -> Optional[CursorDTO]:
+        return None
+
+    def encode_cursor(self, cursor: CursorDTO) -> str:
+        return encode_cursor(cursor)
+
+
+class CursorPaginationSpecification(PaginationSpecificationInterface):
+    """Specification for keyset pagination starting after the row encoded in an opaque cursor"""
+
+    def __init__(self, cursor: str, per_page: int):
+        self._cursor = decode_cursor(cursor)
+        self._limit = per_page
+
+    def to_sql(self) -> tuple[str, list[Any]]:
+        """Convert to SQL LIMIT clause (the keyset condition depends on the ordering)"""
+        return "LIMIT %s", [self._limit]
+
+    def get_offset(self) -> int:
+        return 0
+
+    def get_limit(self) -> int:
+        return self._limit
+
+    def get_cursor(self) -> Optional[CursorDTO]:
+        return self._cursor
+
+    def encode_cursor(self, cursor: CursorDTO) -> str:
+        return encode_cursor(cursor)
+
+
+def encode_cursor(cursor: CursorDTO) -> str:
+    """
+    Encode cursor into an opaque URL-safe string
+
+    Args:
+        cursor: Sort key values of the last row, the ordering and the specifications digest they belong to
+
+    Returns:
+        URL-safe base64 string without padding
+    """
+    payload = json.dumps({"o": cursor.ordering, "v": cursor.values, "s": cursor.scope}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(value: str) -> CursorDTO:
+    """
+    Decode an opaque cursor string produced by encode_cursor
+
+    Args:
+        value: Cursor string received from the client
+
+    Returns:
+        Decoded cursor
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        ordering = payload["o"]
+        values = payload["v"]
+        scope = payload.get("s", "")
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor", e)
+
+    if (
+            not isinstance(ordering, list)
+            or not isinstance(scope, str)
+            or not isinstance(values, list)
+            or len(ordering) != len(values)
+            or not all(isinstance(item, str) for item in ordering)
+            or not all(
+                item is None or isinstance(item, (int, float)) and not isinstance(item, bool) for item in values
+            )
+    ):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    return CursorDTO(ordering=ordering, values=values, scope=scope)
@@ -6,6 +6,8 @@ from apps.catalog.interfaces.specifications import SearchSpecificationInterface
 class ProductSearchSpecification(SearchSpecificationInterface):
     """Specification for product text search with relevance ranking."""
 
+    SEARCH_VECTOR_COLUMN = "search_vector"
+
     def __init__(self, query: Optional[str] = None):
         """
         Initialize search specification
@@ -34,9 +36,21 @@ class ProductSearchSpecification(SearchSpecificationInterface):
         if self.is_empty():
             return "", []
 
-        sql = """
-        WHERE to_tsvector('public.english_unaccent', product_display_name) @@ plainto_tsquery('public.english_unaccent', %s)
-        ORDER BY ts_rank(to_tsvector('public.english_unaccent', product_display_name), 
-                        plainto_tsquery('public.english_unaccent', %s)) DESC
+        sql = f"""
+        WHERE {self.SEARCH_VECTOR_COLUMN} @@ plainto_tsquery('public.english_unaccent', %s)
+        ORDER BY ts_rank({self.SEARCH_VECTOR_COLUMN}, plainto_tsquery('public.english_unaccent', %s)) DESC
         """
         return sql, [self._query, self._query]
+
+    def get_rank_sql(self) -> Tuple[str, List[Any]]:
+        """
+        Get SQL expression for search relevance rank
+
+        Returns:
+            Tuple of (SQL expression, parameters list)
+        """
+        if self.is_empty():
+            return "", []
+
+        sql = f"ts_rank({self.SEARCH_VECTOR_COLUMN}, plainto_tsquery('public.english_unaccent', %s))"
+        return sql, [self._query]
@@ -0,0 +1,128 @@
+"""Benchmark: counts and facets from the in-memory catalog snapshot vs SQL aggregation."""
+
+import asyncio
+import sys
+from typing import Iterable, Optional, Tuple
+
+import click
+import numpy as np
+
+from apps.catalog.factories import create_product_filter_specification, create_category_specification
+from apps.catalog.repositories.product import ProductRepository
+from apps.catalog.interfaces.specifications import CategorySpecificationInterface, FilterSpecificationInterface
+from apps.catalog.snapshot import CatalogSnapshot, CatalogSnapshotManager
+from benchmarks.utils import measure, print_comparison
+from db.connection import get_connection_pool
+from db.dao import PostgreSQLDAO
+from db.query_builder import SQLQueryBuilder
+
+
+@click.command()
+@click.option("--iterations", default=50, type=int, help="Measured runs per case")
+@click.option("--master-category-id", default=1, type=int, help="Master category for category scenarios")
+def catalog_snapshot(iterations: int, master_category_id: int) -> None:
+    """
+    Compare SQL counts and facets with the snapshot bitmap index answering the same queries.
+
+    Counts are also measured on NumPy columns with vectorized boolean masks, the
+    representation the snapshot started with, to show why it keeps only the bitmap index.
+    """
+    click.echo("Catalog snapshot benchmark")
+    click.echo("=" * 40)
+
+    try:
+        asyncio.run(_run(iterations, master_category_id))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+
+async def _run(iterations: int, master_category_id: int) -> None:
+    pool = await get_connection_pool()
+
+    try:
+        dao = PostgreSQLDAO(pool)
+        snapshot_manager = CatalogSnapshotManager(dao)
+        snapshot = await snapshot_manager.load()
+        click.echo(f"Snapshot: {len(snapshot)} products, {snapshot.nbytes / 1024:.0f} KiB")
+
+        sql_repository = ProductRepository(dao, SQLQueryBuilder("catalog_products"))
+        snapshot_repository = ProductRepository(
+            dao, SQLQueryBuilder("catalog_products"), snapshot_manager=snapshot_manager
+        )
+
+        men_since_2012 = create_product_filter_specification(min_year=2012, gender="men")
+        category_spec = create_category_specification(master_category_id)
+
+        scenarios = {
+            "all products": dict(),
+            "gender + year filters": dict(filter_spec=men_since_2012),
+            "category": dict(category_spec=category_spec),
+            "category + filters": dict(category_spec=category_spec, filter_spec=men_since_2012),
+        }
+
+        columns = ", ".join(CatalogSnapshot.COLUMNS)
+        masks = ColumnarMasks(await dao.execute(f"SELECT {columns} FROM catalog_products", []) or [])
+
+        for scenario, specs in scenarios.items():
+            baseline = await measure("SQL COUNT(*)", lambda: _count(sql_repository, **specs), iterations)
+            columnar = await measure("NumPy mask count", lambda: masks.count(**specs), iterations)
+            candidate = await measure(
+                "bitmap popcount", lambda: _count(snapshot_repository, **specs), iterations
+            )
+            print_comparison(f"count: {scenario}", baseline, candidate)
+            print_comparison(f"count: {scenario} (columnar masks)", columnar, candidate)
+
+        for scenario, filter_spec in {"category facets": None, "category facets + selection": men_since_2012}.items():
+            baseline = await measure(
+                "SQL GROUP BY facets",
+                lambda: sql_repository.get_available_filters_by_categories(category_spec, filter_spec),
+                iterations
+            )
+            candidate = await measure(
+                "bitmap facet counts",
+                lambda: snapshot_repository.get_available_filters_by_categories(category_spec, filter_spec),
+                iterations
+            )
+            print_comparison(scenario, baseline, candidate)
+    finally:
+        await pool.close()
+
+
+class ColumnarMasks:
+    """Gender, year and category columns as NumPy arrays, counting products with vectorized boolean masks"""
+
+    def __init__(self, rows: Iterable[Tuple]):
+        rows = list(rows)
+        genders = sorted({row[0] for row in rows if row[0] is not None})
+        self._gender_codes = {gender: code for code, gender in enumerate(genders, start=1)}
+        self._gender = np.fromiter((self._gender_codes.get(row[0], 0) for row in rows), np.uint8, len(rows))
+        self._year = np.fromiter((row[1] or 0 for row in rows), np.int16, len(rows))
+        self._master_category_id = np.fromiter((row[2] or 0 for row in rows), np.int32, len(rows))
+
+    async def count(
+            self,
+            category_spec: Optional[CategorySpecificationInterface] = None,
+            filter_spec: Optional[FilterSpecificationInterface] = None
+    ) -> int:
+        mask = np.ones(len(self._gender), dtype=bool)
+        if category_spec:
+            mask &= self._master_category_id == category_spec.master_category_id
+        if filter_spec and filter_spec.min_year is not None:
+            mask &= self._year >= filter_spec.min_year
+        if filter_spec and filter_spec.genders:
+            codes = [self._gender_codes[gender] for gender in filter_spec.genders if gender in self._gender_codes]
+            selected = np.zeros(len(self._gender_codes) + 1, dtype=bool)
+            selected[codes] = True
+            mask &= selected[self._gender]
+        return int(np.count_nonzero(mask))
+
+
+async def _count(repository: ProductRepository, category_spec=None, filter_spec=None) -> int:
+    if category_spec:
+        return await repository.get_products_count_by_categories(category_spec, filter_spec)
+    return await repository.get_products_count(filter_spec)
+
+
+if __name__ == "__main__":
+    catalog_snapshot()
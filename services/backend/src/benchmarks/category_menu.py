@@ -0,0 +1,118 @@
+"""Benchmark: single-pass category menu builder vs the previous list-scanning builder."""
+
+import asyncio
+import sys
+from typing import List, Tuple
+
+import click
+
+from apps.catalog.dto.category import (
+    CategoryMenuDTO,
+    MasterCategoryInfoDTO,
+    SubCategoryInfoDTO,
+    ArticleTypeInfoDTO
+)
+from apps.catalog.repositories.category import CategoryRepository
+from benchmarks.utils import measure, print_comparison
+
+
+@click.command()
+@click.option("--iterations", default=20, type=int, help="Measured runs per case")
+@click.option("--masters", default=10, type=int, help="Number of master categories")
+@click.option("--subs-per-master", default=50, type=int, help="Subcategories per master category")
+@click.option("--types-per-sub", default=25, type=int, help="Article types per subcategory")
+def category_menu(iterations: int, masters: int, subs_per_master: int, types_per_sub: int) -> None:
+    """Compare category menu assembly on a synthetic category tree (no database needed)."""
+    click.echo("Category menu builder benchmark")
+    click.echo("=" * 40)
+
+    try:
+        asyncio.run(_run(iterations, masters, subs_per_master, types_per_sub))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+
+async def _run(iterations: int, masters: int, subs_per_master: int, types_per_sub: int) -> None:
+    rows = _generate_rows(masters, subs_per_master, types_per_sub)
+    click.echo(f"Synthetic tree: {len(rows)} article types")
+
+    repository = CategoryRepository(dao=None)
+
+    async def list_scanning():
+        _build_menu_with_list_scans(repository, rows)
+
+    async def single_pass():
+        CategoryMenuDTO.model_validate({"categories": repository._build_menu_tree(rows)})
+
+    baseline = await measure("list scans + row models", list_scanning, iterations, warmup=1)
+    candidate = await measure("single-pass dict builder", single_pass, iterations, warmup=1)
+    print_comparison("menu assembly", baseline, candidate)
+
+    menu = CategoryMenuDTO.model_validate({"categories": repository._build_menu_tree(rows)})
+    content = menu.model_dump_json().encode()
+
+    async def serialize_per_request():
+        menu.model_dump_json().encode()
+
+    async def pre_encoded():
+        bytes(content)
+
+    baseline = await measure("serialize per request", serialize_per_request, iterations, warmup=1)
+    candidate = await measure("pre-encoded bytes", pre_encoded, iterations, warmup=1)
+    print_comparison("menu response body", baseline, candidate)
+
+
+def _generate_rows(masters: int, subs_per_master: int, types_per_sub: int) -> List[Tuple]:
+    """Generate category rows in the shape returned by the category menu query"""
+    rows = []
+    sub_id = 0
+    article_id = 0
+
+    for master_id in range(1, masters + 1):
+        for _ in range(subs_per_master):
+            sub_id += 1
+            for _ in range(types_per_sub):
+                article_id += 1
+                rows.append((
+                    master_id, f"Master {master_id}",
+                    sub_id, f"Sub {sub_id}",
+                    article_id, f"Article type {article_id}",
+                    article_id % 100
+                ))
+
+    return rows
+
+
+def _build_menu_with_list_scans(repository: CategoryRepository, rows: List[Tuple]) -> CategoryMenuDTO:
+    """Previous menu assembly: per-row models, linear subcategory lookup and duplicate scan"""
+    master_categories = {}
+
+    for row in rows:
+        master_id, master_name, sub_id, sub_name, article_id, article_name, _ = repository._extract_row_data(row)
+
+        if master_id not in master_categories:
+            master_categories[master_id] = MasterCategoryInfoDTO(
+                master_category_id=master_id,
+                name=master_name,
+                sub_categories=[]
+            )
+
+        if sub_id is not None:
+            master_category = master_categories[master_id]
+            subcategory = next((sc for sc in master_category.sub_categories if sc.id == sub_id), None)
+
+            if subcategory is None:
+                subcategory = SubCategoryInfoDTO(sub_category_id=sub_id, name=sub_name, article_types=[])
+                master_category.sub_categories.append(subcategory)
+
+            if article_id is not None:
+                article_type = ArticleTypeInfoDTO(article_type_id=article_id, name=article_name)
+                if not any(at.id == article_id for at in subcategory.article_types):
+                    subcategory.article_types.append(article_type)
+
+    return CategoryMenuDTO(categories=list(master_categories.values()))
+
+
+if __name__ == "__main__":
+    category_menu()
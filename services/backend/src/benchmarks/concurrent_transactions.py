@@ -0,0 +1,164 @@
+"""Check: hundreds of overlapping account transactions on one shared DAO stay isolated from each other."""
+
+import asyncio
+import sys
+import time
+import uuid
+from typing import Dict
+from urllib.parse import parse_qs, urlparse
+
+import click
+
+from apps.accounts.dto.activation import ActivateAccountDTO
+from apps.accounts.dto.users import CreateUserDTO
+from apps.accounts.repositories.token import TokenRepository
+from apps.accounts.repositories.user import UserRepository
+from apps.accounts.repositories.user_group import UserGroupRepository
+from apps.accounts.services.account import AccountService
+from apps.accounts.services.exceptions import EmailAlreadyExistsError, UserCreationError
+from db.connection import get_connection_pool
+from db.dao import PostgreSQLDAO
+from db.query_builder import SQLQueryBuilder
+from notifications.email.interfaces import EmailSenderInterface
+from security.dependencies import get_jwt_manager
+from security.passwords import PasswordManager
+
+PASSWORD = "Concurrent-check-1"
+
+
+class RecordingEmailSender(EmailSenderInterface):
+    """Email sender keeping activation links in memory instead of sending them"""
+
+    def __init__(self):
+        self.activation_links: Dict[str, str] = {}
+
+    async def send_activation_email(self, email: str, activation_link: str) -> None:
+        self.activation_links[email] = activation_link
+
+    async def send_resend_activation_email(self, email: str, activation_link: str) -> None:
+        self.activation_links[email] = activation_link
+
+    async def send_activation_complete_email(self, email: str, login_link: str) -> None:
+        pass
+
+    async def send_password_reset_email(self, email: str, reset_link: str) -> None:
+        pass
+
+    async def send_password_reset_complete_email(self, email: str, login_link: str) -> None:
+        pass
+
+
+class HashOncePasswordManager(PasswordManager):
+    """Password manager hashing the shared check password once, so hashing does not serialize the run"""
+
+    def __init__(self):
+        super().__init__()
+        self._hashes: Dict[str, str] = {}
+
+    def hash_password(self, password: str) -> str:
+        if password not in self._hashes:
+            self._hashes[password] = super().hash_password(password)
+        return self._hashes[password]
+
+
+@click.command()
+@click.option("--users", default=300, type=int, help="Accounts registered and activated concurrently")
+@click.option("--duplicates-every", default=10, type=int, help="Register every n-th email twice at the same time")
+def concurrent_transactions(users: int, duplicates_every: int) -> None:
+    """Run overlapping register_user / activate_account transactions through one DAO and verify the outcome."""
+    click.echo("Concurrent transactions check")
+    click.echo("=" * 40)
+
+    try:
+        failures = asyncio.run(_run(users, duplicates_every))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+    if failures:
+        click.echo(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    click.echo("\nAll transactions were isolated")
+
+
+async def _run(users: int, duplicates_every: int) -> int:
+    pool = await get_connection_pool()
+    prefix = f"tx-check-{uuid.uuid4().hex[:8]}"
+    emails = [f"{prefix}-{index}@example.com" for index in range(users)]
+
+    # One DAO for every request, as get_database_dao provides; services are built per request
+    dao = PostgreSQLDAO(pool)
+    email_sender = RecordingEmailSender()
+    password_manager = HashOncePasswordManager()
+    jwt_manager = get_jwt_manager()
+
+    def create_service() -> AccountService:
+        return AccountService(
+            UserRepository(dao, SQLQueryBuilder("accounts_users")),
+            UserGroupRepository(dao, SQLQueryBuilder("accounts_user_groups")),
+            TokenRepository(dao, SQLQueryBuilder("accounts_users")),
+            password_manager,
+            jwt_manager,
+            email_sender
+        )
+
+    async def register(email: str) -> bool:
+        try:
+            await create_service().register_user(CreateUserDTO(email=email, password=PASSWORD))
+            return True
+        except (EmailAlreadyExistsError, UserCreationError):
+            return False
+
+    async def activate(email: str) -> None:
+        token = parse_qs(urlparse(email_sender.activation_links[email]).query)["token"][0]
+        await create_service().activate_account(ActivateAccountDTO(email=email, token=token))
+
+    failures = 0
+
+    try:
+        registrations = emails + emails[::duplicates_every]
+        started = time.perf_counter()
+        registered = await asyncio.gather(*(register(email) for email in registrations))
+        click.echo(f"register_user:    {len(registrations)} calls in {time.perf_counter() - started:.2f}s")
+
+        failures += _check("one registration per email succeeded", sum(registered) == users)
+        failures += _check("activation link per email", len(email_sender.activation_links) == users)
+
+        started = time.perf_counter()
+        activations = await asyncio.gather(*(activate(email) for email in emails), return_exceptions=True)
+        click.echo(f"activate_account: {len(emails)} calls in {time.perf_counter() - started:.2f}s")
+
+        errors = [error for error in activations if isinstance(error, Exception)]
+        for error in errors[:5]:
+            click.echo(f"     {type(error).__name__}: {error}")
+        failures += _check("every activation succeeded", not errors)
+
+        rows = await dao.execute(
+            """
+            SELECT COUNT(*), COUNT(*) FILTER (WHERE u.is_active), COUNT(t.id)
+            FROM accounts_users u
+            LEFT JOIN accounts_activation_tokens t ON t.user_id = u.id
+            WHERE u.email LIKE %s
+            """,
+            [f"{prefix}-%"],
+            fetch_one=True
+        )
+        failures += _check(f"{users} users stored", rows[0] == users)
+        failures += _check("every user active", rows[1] == users)
+        failures += _check("every activation token consumed", rows[2] == 0)
+        failures += _check("no transaction left open on the DAO", dao.current_connection is None)
+    finally:
+        await dao.execute("DELETE FROM accounts_users WHERE email LIKE %s", [f"{prefix}-%"], fetch=False)
+        await pool.close()
+
+    return failures
+
+
+def _check(description: str, passed: bool) -> int:
+    """Print a check result, returning 1 if it failed"""
+    click.echo(f"{'ok  ' if passed else 'FAIL'} {description}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    concurrent_transactions()
@@ -0,0 +1,106 @@
+"""Benchmark: page + total count in one query vs the two-query listing path."""
+
+import asyncio
+import sys
+from typing import Optional
+
+import click
+
+from apps.catalog.factories import (
+    create_pagination_specification,
+    create_ordering_specification,
+    create_product_filter_specification,
+    create_search_specification,
+    create_category_specification
+)
+from apps.catalog.repositories.product import ProductRepository
+from benchmarks.utils import measure, print_comparison
+from db.connection import get_connection_pool
+from db.dao import PostgreSQLDAO
+from db.query_builder import SQLQueryBuilder
+
+
+@click.command()
+@click.option("--iterations", default=50, type=int, help="Measured runs per case")
+@click.option("--page", default=1, type=int, help="Page number to request")
+@click.option("--per-page", default=20, type=int, help="Items per page")
+@click.option("--query", "search_query", default="shirt", help="Full-text search query")
+@click.option("--master-category-id", default=1, type=int, help="Master category for category scenarios")
+def listing_total(iterations: int, page: int, per_page: int, search_query: str, master_category_id: int) -> None:
+    """Compare separate page + COUNT(*) queries with the single-query page and total."""
+    click.echo("Listing page + total benchmark")
+    click.echo("=" * 40)
+
+    try:
+        asyncio.run(_run(iterations, page, per_page, search_query, master_category_id))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+
+async def _run(iterations: int, page: int, per_page: int, search_query: str, master_category_id: int) -> None:
+    pool = await get_connection_pool()
+
+    try:
+        repository = ProductRepository(PostgreSQLDAO(pool), SQLQueryBuilder("catalog_products"))
+
+        scenarios = {
+            "all products": dict(),
+            "gender + year filters": dict(filters=("men", 2012)),
+            "search": dict(q=search_query),
+            "category": dict(category=master_category_id),
+            "category + search": dict(category=master_category_id, q=search_query),
+        }
+
+        for scenario, options in scenarios.items():
+            baseline, candidate = await _compare(repository, page, per_page, iterations, **options)
+            print_comparison(scenario, baseline, candidate)
+    finally:
+        await pool.close()
+
+
+async def _compare(
+        repository: ProductRepository,
+        page: int,
+        per_page: int,
+        iterations: int,
+        filters: Optional[tuple] = None,
+        q: Optional[str] = None,
+        category: Optional[int] = None
+):
+    pagination_spec = create_pagination_specification(page, per_page)
+    ordering_spec = create_ordering_specification("-year")
+    filter_spec = create_product_filter_specification(min_year=filters[1], gender=filters[0]) if filters else None
+    search_spec = create_search_specification(q) if q else None
+    category_spec = create_category_specification(category) if category else None
+
+    async def two_queries():
+        if category_spec:
+            await repository.get_products_with_specifications_by_categories(
+                category_spec, pagination_spec, ordering_spec, filter_spec, search_spec
+            )
+            await repository.get_products_count_by_categories(category_spec, filter_spec, search_spec)
+        else:
+            await repository.get_products_with_specifications(
+                pagination_spec, ordering_spec, filter_spec, search_spec
+            )
+            await repository.get_products_count(filter_spec, search_spec)
+
+    async def single_query():
+        if category_spec:
+            await repository.get_products_with_total_by_categories(
+                category_spec, pagination_spec, ordering_spec, filter_spec, search_spec
+            )
+        else:
+            await repository.get_products_with_total(
+                pagination_spec, ordering_spec, filter_spec, search_spec
+            )
+
+    baseline = await measure("page + COUNT(*) (2 queries)", two_queries, iterations)
+    candidate = await measure("page with total (1 query)", single_query, iterations)
+
+    return baseline, candidate
+
+
+if __name__ == "__main__":
+    listing_total()
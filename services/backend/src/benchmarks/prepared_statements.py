@@ -0,0 +1,107 @@
+"""Benchmark: listing pages built and planned per request vs compiled query shapes run as prepared statements."""
+
+import asyncio
+import sys
+from typing import Any, List, Optional
+
+import click
+
+from apps.catalog.factories import (
+    create_pagination_specification,
+    create_ordering_specification,
+    create_product_filter_specification,
+    create_search_specification,
+    create_category_specification
+)
+from apps.catalog.repositories.product import ProductRepository
+from benchmarks.utils import measure, print_comparison
+from db.connection import get_connection_pool, close_connection_pool
+from db.dao import PostgreSQLDAO
+from db.query_builder import SQLQueryBuilder
+from db.query_cache import QueryShapeCache
+
+
+class UnpreparedDAO:
+    """DAO running every query with the extended protocol's unnamed statement, parsed and planned each time"""
+
+    def __init__(self, dao: PostgreSQLDAO):
+        self._dao = dao
+
+    async def execute(self, query: str, params: Optional[List[Any]] = None, **kwargs: Any) -> Any:
+        return await self._dao.execute(query, params, **{**kwargs, "prepare": False})
+
+
+@click.command()
+@click.option("--iterations", default=200, type=int, help="Measured runs per case")
+@click.option("--per-page", default=20, type=int, help="Items per page")
+@click.option("--query", "search_query", default="shirt", help="Full-text search query")
+@click.option("--master-category-id", default=1, type=int, help="Master category for category scenarios")
+def prepared_statements(iterations: int, per_page: int, search_query: str, master_category_id: int) -> None:
+    """Compare listing latency with per-request SQL and planning against cached shapes and prepared statements."""
+    click.echo("Prepared listing statements benchmark")
+    click.echo("=" * 40)
+
+    try:
+        asyncio.run(_run(iterations, per_page, search_query, master_category_id))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+
+async def _run(iterations: int, per_page: int, search_query: str, master_category_id: int) -> None:
+    pool = await get_connection_pool()
+
+    try:
+        dao = PostgreSQLDAO(pool)
+        unprepared = ProductRepository(
+            UnpreparedDAO(dao), SQLQueryBuilder("catalog_products"), query_cache=QueryShapeCache(max_size=0)
+        )
+        prepared = ProductRepository(dao, SQLQueryBuilder("catalog_products"))
+
+        scenarios = {
+            "all products": dict(),
+            "gender + year filters": dict(filter_spec=create_product_filter_specification(min_year=2012, gender="men")),
+            "search": dict(search_spec=create_search_specification(search_query)),
+            "category + filters": dict(
+                category_spec=create_category_specification(master_category_id),
+                filter_spec=create_product_filter_specification(min_year=2012, gender="men")
+            ),
+        }
+
+        for scenario, specs in scenarios.items():
+            # Warmup prepares the statements on the pool's connections and runs them past the first custom plans
+            warmup = 2 * pool.max_size
+            baseline = await measure(
+                "built + planned per request", _listing(unprepared, per_page, **specs), iterations, warmup
+            )
+            candidate = await measure(
+                "compiled shape, prepared", _listing(prepared, per_page, **specs), iterations, warmup
+            )
+            print_comparison(scenario, baseline, candidate)
+    finally:
+        await close_connection_pool()
+
+
+def _listing(repository: ProductRepository, per_page: int, category_spec=None, **specs):
+    """Get a benchmark case requesting the pages of a listing with their total, cycling through five pages"""
+    pages = [create_pagination_specification(page, per_page) for page in range(1, 6)]
+    ordering_spec = create_ordering_specification("-year")
+    requests = 0
+
+    async def listing_page():
+        nonlocal requests
+        pagination_spec = pages[requests % len(pages)]
+        requests += 1
+
+        if category_spec:
+            await repository.get_products_with_total_by_categories(
+                category_spec, pagination_spec, ordering_spec, **specs
+            )
+        else:
+            await repository.get_products_with_total(pagination_spec, ordering_spec, **specs)
+
+    return listing_page
+
+
+if __name__ == "__main__":
+    prepared_statements()
@@ -0,0 +1,214 @@
+"""Check: catalog listing queries are planned without sequential scans of catalog_products,
+and top-N listings are read in index order without sorting the filtered set."""
+
+import asyncio
+import sys
+from typing import Any, Dict, Iterator, List, Optional
+
+import click
+
+from apps.catalog.factories import (
+    create_pagination_specification,
+    create_ordering_specification,
+    create_product_filter_specification,
+    create_category_specification
+)
+from apps.catalog.interfaces.specifications import CategorySpecificationInterface
+from apps.catalog.repositories.category import CategoryRepository
+from apps.catalog.repositories.product import ProductRepository
+from db.connection import get_connection_pool
+from db.dao import PostgreSQLDAO
+from db.query_builder import SQLQueryBuilder
+from db.transaction_context import TransactionContext
+
+CHECKED_TABLE = "catalog_products"
+
+# Filters that must not scan catalog_products sequentially
+SCENARIOS = {
+    "colour": dict(colour="Black"),
+    "colour + year": dict(colour="Black", min_year=2015, ordering="-year"),
+    "season": dict(season="Fall"),
+    "season + year": dict(season="Fall", min_year=2015, ordering="-year"),
+    "usage": dict(usage="Formal"),
+    "colour + season + usage": dict(colour="Black", season="Fall", usage="Formal"),
+    "category + colour": dict(category=True, colour="Black"),
+    "category + usage": dict(category=True, usage="Formal"),
+    "year range": dict(min_year=2015),
+}
+
+# Listing shapes whose top-N page must additionally be read in index order, without a Sort node
+TOP_N_SCENARIOS = {
+    "ordered by id": dict(),
+    "ordered by year": dict(ordering="-year"),
+    "gender": dict(gender="Men"),
+    "gender ordered by year": dict(gender="Men", ordering="-year"),
+    "gender + year range by year": dict(gender="Men", min_year=2012, max_year=2015, ordering="-year"),
+    "year range by year": dict(min_year=2012, max_year=2015, ordering="-year"),
+    "category ordered by id": dict(category=True),
+    "category ordered by year": dict(category=True, ordering="-year"),
+}
+
+# Temporary table shadowing catalog_products for the rest of the transaction,
+# with its indexes, so plans are checked at a scale the sample dataset does not reach
+SYNTHETIC_TABLE_QUERY = f"""
+    CREATE TEMPORARY TABLE {CHECKED_TABLE}
+    (LIKE public.{CHECKED_TABLE} INCLUDING ALL)
+    ON COMMIT DROP
+"""
+
+SYNTHETIC_ROWS_QUERY = f"""
+    INSERT INTO {CHECKED_TABLE} (
+        id, product_id, gender, year, product_display_name, image_url, slug,
+        master_category_id, sub_category_id, article_type_id, base_colour_id, season_id, usage_type_id
+    )
+    SELECT
+        s.i, s.i, s.gender, s.year, 'Synthetic product ' || s.i, 'https://example.com/' || s.i || '.jpg',
+        s.i || '-synthetic-product', sc.master_category_id, at.sub_category_id, s.article_type_id,
+        s.base_colour_id, s.season_id, s.usage_type_id
+    FROM (
+        SELECT
+            i,
+            (ARRAY['Men', 'Women', 'Boys', 'Girls', 'Unisex'])[1 + floor(random() * 5)::int] AS gender,
+            2007 + floor(random() * 13)::int AS year,
+            a.ids[1 + floor(random() * cardinality(a.ids))::int] AS article_type_id,
+            c.ids[1 + floor(random() * cardinality(c.ids))::int] AS base_colour_id,
+            se.ids[1 + floor(random() * cardinality(se.ids))::int] AS season_id,
+            u.ids[1 + floor(random() * cardinality(u.ids))::int] AS usage_type_id
+        FROM generate_series(1, %s) AS i,
+            (SELECT array_agg(article_type_id) AS ids FROM catalog_article_type) AS a,
+            (SELECT array_agg(base_colour_id) AS ids FROM catalog_base_colour) AS c,
+            (SELECT array_agg(season_id) AS ids FROM catalog_season) AS se,
+            (SELECT array_agg(usage_type_id) AS ids FROM catalog_usage_type) AS u
+    ) AS s
+    JOIN catalog_article_type at ON at.article_type_id = s.article_type_id
+    JOIN catalog_sub_category sc ON sc.sub_category_id = at.sub_category_id
+"""
+
+
+class ExplainDAO:
+    """DAO recording the plan of every query instead of returning its rows"""
+
+    def __init__(self, dao: PostgreSQLDAO):
+        self._dao = dao
+        self.plans: List[Dict[str, Any]] = []
+
+    async def execute(self, query: str, params: Optional[List[Any]] = None, **kwargs: Any) -> List[Any]:
+        result = await self._dao.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+        self.plans.append(result[0][0][0]["Plan"])
+        return []
+
+
+@click.command()
+@click.option("--master-category-id", default=1, type=int, help="Master category for category scenarios")
+@click.option("--analyze/--no-analyze", default=True, help="Refresh planner statistics before explaining")
+@click.option(
+    "--synthetic-rows",
+    default=0,
+    type=int,
+    help="Explain against a temporary synthetic catalog of this many products instead of the real one"
+)
+def query_plans(master_category_id: int, analyze: bool, synthetic_rows: int) -> None:
+    """EXPLAIN listing page queries for common filter combinations and fail on sequential scans or sorts."""
+    click.echo("Catalog query plan check")
+    click.echo("=" * 40)
+
+    try:
+        failures = asyncio.run(_run(master_category_id, analyze, synthetic_rows))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+    if failures:
+        click.echo(f"\n{failures} scenario(s) scan {CHECKED_TABLE} sequentially or sort top-N pages")
+        sys.exit(1)
+    click.echo("\nAll scenarios use indexes")
+
+
+async def _run(master_category_id: int, analyze: bool, synthetic_rows: int) -> int:
+    pool = await get_connection_pool()
+
+    try:
+        dao = PostgreSQLDAO(pool)
+        if not synthetic_rows:
+            return await _check(dao, master_category_id, analyze)
+
+        # Every query runs on the transaction's connection, where the temporary table shadows the real one
+        async with TransactionContext(dao):
+            click.echo(f"Generating {synthetic_rows:,} synthetic products...")
+            await dao.execute(SYNTHETIC_TABLE_QUERY, fetch=False)
+            await dao.execute(SYNTHETIC_ROWS_QUERY, [synthetic_rows], fetch=False)
+            return await _check(dao, master_category_id, analyze=True)
+    finally:
+        await pool.close()
+
+
+async def _check(dao: PostgreSQLDAO, master_category_id: int, analyze: bool) -> int:
+    """Explain every scenario and print its scans, returning the number of failed scenarios"""
+    if analyze:
+        await dao.execute(f"ANALYZE {CHECKED_TABLE}", fetch=False)
+
+    # Category listings resolve their article type ids from the hierarchy, as the service does,
+    # and then filter on the denormalized master category key
+    hierarchy = await CategoryRepository(dao).get_category_hierarchy()
+    category_spec = create_category_specification(
+        master_category_id, article_type_ids=hierarchy.resolve_article_type_ids(master_category_id)
+    )
+
+    failures = 0
+    for top_n, scenarios in ((False, SCENARIOS), (True, TOP_N_SCENARIOS)):
+        for scenario, options in scenarios.items():
+            plans = await _explain(dao, category_spec, **options)
+            nodes = [node for plan in plans for node in _walk(plan)]
+            scans = sorted({
+                f"{node['Node Type']}({node.get('Index Name') or node.get('Relation Name')})"
+                for node in nodes
+                if node.get("Relation Name") == CHECKED_TABLE or node.get("Index Name", "").startswith("idx_catalog")
+            })
+            failed = any(node["Node Type"] == "Seq Scan" and _scans_checked_table(node) for node in nodes)
+            if top_n:
+                failed = failed or any(node["Node Type"] == "Sort" and _scans_checked_table(node) for node in nodes)
+            failures += failed
+            click.echo(f"{'FAIL' if failed else 'ok  '} {scenario:<28} {', '.join(scans)}")
+
+    return failures
+
+
+async def _explain(
+        dao: PostgreSQLDAO,
+        category_spec: CategorySpecificationInterface,
+        category: bool = False,
+        ordering: str = "-id",
+        **filters: Any
+) -> List[Dict[str, Any]]:
+    """Run the listing page query of a scenario through the repository and collect its plans"""
+    explain_dao = ExplainDAO(dao)
+    repository = ProductRepository(explain_dao, SQLQueryBuilder(CHECKED_TABLE))
+
+    pagination_spec = create_pagination_specification(1, 20)
+    ordering_spec = create_ordering_specification(ordering)
+    filter_spec = create_product_filter_specification(**filters)
+
+    if category:
+        await repository.get_products_with_specifications_by_categories(
+            category_spec, pagination_spec, ordering_spec, filter_spec
+        )
+    else:
+        await repository.get_products_with_specifications(pagination_spec, ordering_spec, filter_spec)
+
+    return explain_dao.plans
+
+
+def _walk(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Iterate over a plan node and all of its descendants"""
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def _scans_checked_table(node: Dict[str, Any]) -> bool:
+    """Whether a plan node reads catalog_products itself or through one of its descendants"""
+    return any(child.get("Relation Name") == CHECKED_TABLE for child in _walk(node))
+
+
+if __name__ == "__main__":
+    query_plans()
@@ -0,0 +1,95 @@
+"""Benchmark: building listing SQL from specifications on every request vs compiled query shapes."""
+
+import asyncio
+import sys
+from typing import Any, List, Optional
+
+import click
+
+from apps.catalog.dto.catalog import CursorDTO
+from apps.catalog.factories import (
+    create_pagination_specification,
+    create_ordering_specification,
+    create_product_filter_specification,
+    create_search_specification,
+    create_category_specification
+)
+from apps.catalog.repositories.product import ProductRepository
+from apps.catalog.specifications.pagination import encode_cursor
+from benchmarks.utils import measure, print_comparison
+from db.query_builder import SQLQueryBuilder
+from db.query_cache import QueryShapeCache
+
+
+class RecordingDAO:
+    """DAO recording every query instead of running it, so only SQL construction is timed"""
+
+    def __init__(self):
+        self.queries: List[str] = []
+
+    async def execute(self, query: str, params: Optional[List[Any]] = None, **kwargs: Any) -> Any:
+        self.queries.append(query)
+        return (0,) if kwargs.get("fetch_one") else []
+
+
+@click.command()
+@click.option("--iterations", default=50, type=int, help="Measured runs per case")
+@click.option("--builds", default=1000, type=int, help="Listing queries built per measured run")
+def query_shapes(iterations: int, builds: int) -> None:
+    """Compare spec-to-SQL construction per request with the query shape cache (no database needed)."""
+    click.echo("Listing query construction benchmark")
+    click.echo("=" * 40)
+
+    try:
+        asyncio.run(_run(iterations, builds))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+
+async def _run(iterations: int, builds: int) -> None:
+    keyset_cursor = encode_cursor(CursorDTO(ordering=["-year", "-id"], values=[2012, 10000]))
+
+    scenarios = {
+        "all products": dict(),
+        "gender + year filters": dict(filter_spec=create_product_filter_specification(min_year=2012, gender="men")),
+        "search": dict(search_spec=create_search_specification("shirt")),
+        "category + filters + search": dict(
+            category_spec=create_category_specification(1, 2),
+            filter_spec=create_product_filter_specification(min_year=2012, gender="men", colour="black"),
+            search_spec=create_search_specification("shirt")
+        ),
+        "keyset page": dict(pagination_spec=create_pagination_specification(1, 20, keyset_cursor)),
+    }
+
+    for scenario, specs in scenarios.items():
+        uncached = ProductRepository(
+            RecordingDAO(), SQLQueryBuilder("catalog_products"), query_cache=QueryShapeCache(max_size=0)
+        )
+        cached = ProductRepository(RecordingDAO(), SQLQueryBuilder("catalog_products"))
+
+        baseline = await measure("build per request", _builds(uncached, builds, **specs), iterations)
+        candidate = await measure("compiled query shape", _builds(cached, builds, **specs), iterations)
+        print_comparison(f"{scenario} ({builds} pages)", baseline, candidate)
+
+
+def _builds(repository: ProductRepository, builds: int, pagination_spec=None, **specs):
+    """Get a benchmark case building the page query of the given specifications builds times"""
+    pagination_spec = pagination_spec or create_pagination_specification(2, 20)
+    ordering_spec = create_ordering_specification("-year")
+    category_spec = specs.pop("category_spec", None)
+
+    async def build_pages():
+        for _ in range(builds):
+            if category_spec:
+                await repository.get_products_with_specifications_by_categories(
+                    category_spec, pagination_spec, ordering_spec, **specs
+                )
+            else:
+                await repository.get_products_with_specifications(pagination_spec, ordering_spec, **specs)
+
+    return build_pages
+
+
+if __name__ == "__main__":
+    query_shapes()
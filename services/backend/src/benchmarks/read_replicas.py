@@ -0,0 +1,96 @@
+"""Check: reads outside transactions are served by the streaming replica, transactions and reads after a write by the primary."""
+
+import asyncio
+import sys
+import time
+
+import click
+
+from db.connection import get_connection_pool, get_replica_pool, close_connection_pool
+from db.dao import PostgreSQLDAO
+from db.transaction_context import TransactionContext
+
+IN_RECOVERY_QUERY = "SELECT pg_is_in_recovery()"
+
+
+@click.command()
+@click.option("--sticky-seconds", default=1.0, type=float, help="Seconds reads stay on the primary after a write")
+@click.option("--max-lag-seconds", default=5.0, type=float, help="Time the replica gets to replay a write")
+def read_replicas(sticky_seconds: float, max_lag_seconds: float) -> None:
+    """Run reads, transactions and writes through a DAO with a replica pool and check where each one lands."""
+    click.echo("Read replica routing check")
+    click.echo("=" * 40)
+
+    try:
+        failures = asyncio.run(_run(sticky_seconds, max_lag_seconds))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+    if failures:
+        click.echo(f"\n{failures} check(s) failed")
+        sys.exit(1)
+    click.echo("\nReads are routed to the replica")
+
+
+async def _run(sticky_seconds: float, max_lag_seconds: float) -> int:
+    pool = await get_connection_pool()
+    replica_pool = await get_replica_pool()
+
+    try:
+        if replica_pool is None:
+            click.echo("FAIL no replica pool, set POSTGRES_REPLICA_HOSTS and start the replica compose profile")
+            return 1
+
+        dao = PostgreSQLDAO(pool, replica_pool, sticky_seconds)
+        failures = 0
+
+        failures += _check("reads outside transactions run on the replica", await _on_replica(dao))
+
+        async with TransactionContext(dao):
+            failures += _check("transactions run on the primary", not await _on_replica(dao))
+
+            # WAL record without touching any table, so there is something to replay
+            await dao.execute("SELECT pg_logical_emit_message(false, 'read-replica-check', 'ping')", fetch=False)
+            lsn = (await dao.execute("SELECT pg_current_wal_lsn()::text", fetch_one=True))[0]
+
+        failures += _check("reads right after a write stay on the primary", not await _on_replica(dao))
+        await asyncio.sleep(sticky_seconds)
+        failures += _check("reads return to the replica after the sticky window", await _on_replica(dao))
+
+        started = time.perf_counter()
+        replayed = False
+        while not replayed and time.perf_counter() - started < max_lag_seconds:
+            row = await dao.execute("SELECT pg_last_wal_replay_lsn() >= %s::pg_lsn", [lsn], fetch_one=True)
+            replayed = bool(row[0])
+            if not replayed:
+                await asyncio.sleep(0.05)
+        failures += _check(
+            f"replica replayed the write in {(time.perf_counter() - started) * 1000:.0f}ms", replayed
+        )
+
+        # Writes of other processes arrive as invalidations, which pin reads of every task
+        dao.mark_primary_reads()
+        failures += _check(
+            "reads of other tasks stay on the primary after an invalidation",
+            not await asyncio.create_task(_on_replica(dao))
+        )
+
+        return failures
+    finally:
+        await close_connection_pool()
+
+
+async def _on_replica(dao: PostgreSQLDAO) -> bool:
+    """Whether the DAO runs a read of the current task on a server in recovery"""
+    return (await dao.execute(IN_RECOVERY_QUERY, fetch_one=True))[0]
+
+
+def _check(description: str, passed: bool) -> int:
+    """Print a check result, returning 1 if it failed"""
+    click.echo(f"{'ok  ' if passed else 'FAIL'} {description}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    read_replicas()
@@ -0,0 +1,119 @@
+"""Benchmark: ranked search on to_tsvector() expressions vs the stored search_vector column."""
+
+import asyncio
+import sys
+
+import click
+
+from benchmarks.utils import measure, print_comparison
+from db.connection import get_connection_pool
+from db.dao import PostgreSQLDAO
+
+BENCH_TABLE = "bench_search_products"
+
+EXPRESSION_QUERY = f"""
+    SELECT id, ts_rank(to_tsvector('public.english_unaccent', product_display_name),
+                       plainto_tsquery('public.english_unaccent', %s)) AS search_rank
+    FROM {BENCH_TABLE}
+    WHERE to_tsvector('public.english_unaccent', product_display_name) @@ plainto_tsquery('public.english_unaccent', %s)
+    ORDER BY search_rank DESC, id DESC
+    LIMIT %s
+"""
+
+COLUMN_QUERY = f"""
+    SELECT id, ts_rank(search_vector, plainto_tsquery('public.english_unaccent', %s)) AS search_rank
+    FROM {BENCH_TABLE}
+    WHERE search_vector @@ plainto_tsquery('public.english_unaccent', %s)
+    ORDER BY search_rank DESC, id DESC
+    LIMIT %s
+"""
+
+
+@click.command()
+@click.option("--iterations", default=30, type=int, help="Measured runs per case")
+@click.option("--scale", default=10, type=int, help="Number of copies of catalog_products in the benchmark table")
+@click.option("--per-page", default=20, type=int, help="Items per page")
+@click.option("--query", "search_queries", multiple=True, default=("shirt", "men blue", "watch"),
+              help="Full-text search query, can be repeated")
+def search_vector(iterations: int, scale: int, per_page: int, search_queries: tuple) -> None:
+    """Compare ranked search latency before and after the generated search_vector column."""
+    click.echo("Ranked search benchmark")
+    click.echo("=" * 40)
+
+    try:
+        asyncio.run(_run(iterations, scale, per_page, search_queries))
+    except KeyboardInterrupt:
+        click.echo("\nOperation cancelled by user")
+        sys.exit(1)
+
+
+async def _run(iterations: int, scale: int, per_page: int, search_queries: tuple) -> None:
+    pool = await get_connection_pool()
+    dao = PostgreSQLDAO(pool)
+
+    try:
+        await _create_bench_table(dao, scale)
+
+        for search_query in search_queries:
+            params = [search_query, search_query, per_page]
+
+            baseline = await measure(
+                "to_tsvector() expression",
+                lambda: dao.execute(EXPRESSION_QUERY, params),
+                iterations
+            )
+            candidate = await measure(
+                "stored search_vector",
+                lambda: dao.execute(COLUMN_QUERY, params),
+                iterations
+            )
+            print_comparison(f"q={search_query!r}", baseline, candidate)
+    finally:
+        await dao.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}", fetch=False)
+        await pool.close()
+
+
+async def _create_bench_table(dao: PostgreSQLDAO, scale: int) -> None:
+    """
+    Create a scaled-up copy of the catalog with both the expression and the column index
+
+    Args:
+        dao: Data Access Object for database operations
+        scale: Number of copies of each product
+    """
+    click.echo(f"Creating {BENCH_TABLE} with x{scale} products...")
+
+    await dao.execute(f"DROP TABLE IF EXISTS {BENCH_TABLE}", fetch=False)
+    await dao.execute(
+        f"""
+        CREATE TABLE {BENCH_TABLE} AS
+        SELECT row_number() OVER () AS id, p.product_display_name
+        FROM catalog_products p
+        CROSS JOIN generate_series(1, {int(scale)})
+        """,
+        fetch=False
+    )
+    await dao.execute(
+        f"""
+        ALTER TABLE {BENCH_TABLE}
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (to_tsvector('public.english_unaccent', COALESCE(product_display_name, ''))) STORED
+        """,
+        fetch=False
+    )
+    await dao.execute(
+        f"""
+        CREATE INDEX ON {BENCH_TABLE}
+        USING GIN (to_tsvector('public.english_unaccent', product_display_name))
+        """,
+        fetch=False
+    )
+    await dao.execute(f"CREATE INDEX ON {BENCH_TABLE} USING GIN (search_vector)", fetch=False)
+    await dao.execute(f"ANALYZE {BENCH_TABLE}", fetch=False)
+
+    result = await dao.execute(f"SELECT COUNT(*) FROM {BENCH_TABLE}", fetch_one=True)
+    click.echo(f"Benchmark table ready: {result[0]} rows")
+
+
+if __name__ == "__main__":
+    search_vector()
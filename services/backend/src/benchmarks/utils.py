@@ -0,0 +1,76 @@
+"""Shared helpers for benchmark commands."""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List
+
+import click
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary of a single benchmark case"""
+    name: str
+    timings_ms: List[float]
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.timings_ms)
+
+    @property
+    def p50(self) -> float:
+        return statistics.median(self.timings_ms)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.timings_ms)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+async def measure(
+        name: str,
+        func: Callable[[], Awaitable[object]],
+        iterations: int,
+        warmup: int = 3
+) -> BenchmarkResult:
+    """
+    Measure latency of an async callable
+
+    Args:
+        name: Case name shown in the report
+        func: Async callable to measure
+        iterations: Number of measured runs
+        warmup: Number of runs discarded before measuring
+
+    Returns:
+        Benchmark result with per-run timings in milliseconds
+    """
+    for _ in range(warmup):
+        await func()
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return BenchmarkResult(name=name, timings_ms=timings)
+
+
+def print_comparison(scenario: str, baseline: BenchmarkResult, candidate: BenchmarkResult) -> None:
+    """
+    Print baseline vs candidate timings for a scenario
+
+    Args:
+        scenario: Scenario name
+        baseline: Result of the current implementation
+        candidate: Result of the new implementation
+    """
+    click.echo(f"\n{scenario}")
+    click.echo(f"  {'case':<28} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for result in (baseline, candidate):
+        click.echo(f"  {result.name:<28} {result.mean:>10.2f} {result.p50:>10.2f} {result.p95:>10.2f}")
+
+    speedup = baseline.mean / candidate.mean if candidate.mean else float("inf")
+    click.echo(f"  speedup (mean): x{speedup:.2f}")
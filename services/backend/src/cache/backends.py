@@ -0,0 +1,127 @@
+import asyncio
+import sqlite3
+import time
+from typing import Optional
+
+from cache.exceptions import CacheBackendError, CacheConfigurationError
+from cache.interfaces import CacheBackendInterface
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "cache")
+
+
+class RedisCacheBackend(CacheBackendInterface):
+    """L2 cache backend storing values in Redis"""
+
+    def __init__(self, redis_url: str):
+        """
+        Initialize Redis backend
+
+        Args:
+            redis_url: Redis connection URL
+
+        Raises:
+            CacheConfigurationError: If the redis package is not installed
+        """
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise CacheConfigurationError("Redis cache backend requires the 'redis' extra: poetry install --extras redis", e)
+
+        self._client = redis_asyncio.from_url(redis_url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._client.get(key)
+        except Exception as e:
+            raise CacheBackendError(f"Redis get failed for key '{key}'", e)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            await self._client.set(key, value, ex=ttl)
+        except Exception as e:
+            raise CacheBackendError(f"Redis set failed for key '{key}'", e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._client.delete(key)
+        except Exception as e:
+            raise CacheBackendError(f"Redis delete failed for key '{key}'", e)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        try:
+            keys = [key async for key in self._client.scan_iter(match=f"{prefix}*")]
+            if keys:
+                await self._client.delete(*keys)
+        except Exception as e:
+            raise CacheBackendError(f"Redis delete failed for prefix '{prefix}'", e)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class SQLiteCacheBackend(CacheBackendInterface):
+    """L2 cache backend storing values in a local SQLite file, a stand-in for Redis in tests and development"""
+
+    def __init__(self, path: str, purge_interval: float = 60.0):
+        """
+        Initialize SQLite backend
+
+        Args:
+            path: Database file path, ":memory:" keeps values in memory
+            purge_interval: Minimum seconds between deletions of expired entries, run on writes
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS cache_entries_expires_at ON cache_entries (expires_at)")
+        self._connection.commit()
+        self._lock = asyncio.Lock()
+        self._purge_interval = purge_interval
+        self._purged_at = time.monotonic()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        row = await self._run(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?", (key, time.time()), fetch=True
+        )
+        return row[0] if row else None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._run(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl)
+        )
+        await self._purge_expired()
+
+    async def delete(self, key: str) -> None:
+        await self._run("DELETE FROM cache_entries WHERE key = ?", (key,))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        await self._run("DELETE FROM cache_entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    async def close(self) -> None:
+        self._connection.close()
+
+    async def _purge_expired(self) -> None:
+        """Delete expired entries, at most once per purge interval, since reads only skip them"""
+        if time.monotonic() - self._purged_at < self._purge_interval:
+            return
+
+        self._purged_at = time.monotonic()
+        await self._run("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+
+    async def _run(self, query: str, params: tuple, fetch: bool = False):
+        """Run a statement in a worker thread, serialized because the SQLite connection is shared"""
+        def execute():
+            cursor = self._connection.execute(query, params)
+            if fetch:
+                return cursor.fetchone()
+            self._connection.commit()
+            return None
+
+        async with self._lock:
+            try:
+                return await asyncio.to_thread(execute)
+            except sqlite3.Error as e:
+                raise CacheBackendError(f"SQLite cache query failed: {query}", e)
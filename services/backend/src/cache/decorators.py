@@ -0,0 +1,56 @@
+import functools
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+def cached(
+        prefix: str,
+        ttl: Optional[int] = None,
+        cache_attr: str = "_cache"
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Declare a cached async method, reading the cache from an attribute of the instance
+
+    The key is the prefix followed by the repr of every argument, so arguments must
+    have stable reprs (ids, strings, specifications exposing a cache key via repr).
+    Methods of instances without a cache run uncached.
+
+    Args:
+        prefix: Key prefix for this method within the cache namespace
+        ttl: Time to live in seconds, defaults to the cache TTL
+        cache_attr: Name of the instance attribute holding the CacheInterface
+
+    Returns:
+        Decorator wrapping the method with get_or_set
+    """
+    def decorator(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(method)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+            cache = getattr(self, cache_attr, None)
+            if cache is None:
+                return await method(self, *args, **kwargs)
+
+            key = build_cache_key(prefix, *args, **kwargs)
+            return await cache.get_or_set(key, lambda: method(self, *args, **kwargs), ttl)
+
+        return wrapper
+
+    return decorator
+
+
+def build_cache_key(prefix: str, *args: Any, **kwargs: Any) -> str:
+    """
+    Build a cache key from a prefix and call arguments
+
+    Args:
+        prefix: Key prefix
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Cache key string
+    """
+    parts = [prefix, *(repr(arg) for arg in args)]
+    parts.extend(f"{name}={value!r}" for name, value in sorted(kwargs.items()))
+    return ":".join(parts)
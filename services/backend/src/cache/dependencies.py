@@ -0,0 +1,77 @@
+from functools import lru_cache
+from typing import Dict, Optional
+
+from cache.backends import RedisCacheBackend, SQLiteCacheBackend
+from cache.interfaces import CacheBackendInterface, CacheInterface
+from cache.tiered import TieredCache
+from settings.config import config
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "cache")
+
+_caches: Dict[str, TieredCache] = {}
+
+
+@lru_cache()
+def _get_backend_instance() -> Optional[CacheBackendInterface]:
+    """
+    Get singleton L2 backend configured by CACHE_L2_BACKEND.
+
+    Returns:
+        Configured backend or None when L2 is disabled
+    """
+    if config.CACHE_L2_BACKEND == "redis":
+        logger.info(f"Using Redis L2 cache backend: {config.CACHE_REDIS_URL}")
+        return RedisCacheBackend(config.CACHE_REDIS_URL)
+
+    if config.CACHE_L2_BACKEND == "sqlite":
+        logger.info(f"Using SQLite L2 cache backend: {config.CACHE_SQLITE_PATH}")
+        return SQLiteCacheBackend(config.CACHE_SQLITE_PATH)
+
+    return None
+
+
+def get_cache(namespace: str, max_size: Optional[int] = None, ttl: Optional[int] = None) -> CacheInterface:
+    """
+    Get the process-wide cache for a namespace, creating it on first use.
+
+    Args:
+        namespace: Cache namespace, also the L2 key prefix
+        max_size: Maximum number of L1 entries, defaults to CACHE_L1_MAX_SIZE
+        ttl: Default time to live in seconds, defaults to CACHE_DEFAULT_TTL
+
+    Returns:
+        Namespaced tiered cache
+    """
+    if namespace not in _caches:
+        _caches[namespace] = TieredCache(
+            namespace=namespace,
+            max_size=max_size or config.CACHE_L1_MAX_SIZE,
+            default_ttl=ttl or config.CACHE_DEFAULT_TTL,
+            backend=_get_backend_instance()
+        )
+    return _caches[namespace]
+
+
+def get_all_caches() -> Dict[str, CacheInterface]:
+    """
+    Get all caches created in this process.
+
+    Returns:
+        Mapping of namespace to cache
+    """
+    return dict(_caches)
+
+
+async def cleanup_cache_backend():
+    """
+    Cleanup function to close the L2 backend at application shutdown.
+    Call this in FastAPI lifespan or shutdown event.
+    """
+    try:
+        backend = _get_backend_instance()
+        if backend:
+            await backend.close()
+            logger.info("Cache backend cleaned up successfully")
+    except Exception as e:
+        logger.error(f"Error during cache backend cleanup: {e}")
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheStatsDTO:
+    """DTO with cache counters for a namespace"""
+    namespace: str
+    size: int
+    max_size: int
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    negative_loads: int = 0
+    stale_loads: int = 0
+    load_seconds: float = 0.0
+    l2_seconds: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from L1 or L2"""
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0
+
+    @property
+    def avg_load_ms(self) -> float:
+        """Mean loader latency of a miss in milliseconds"""
+        return self.load_seconds * 1000 / self.loads if self.loads else 0.0
+
+    @property
+    def avg_l2_ms(self) -> float:
+        """Mean L2 round trip latency in milliseconds"""
+        l2_lookups = self.l2_hits + self.misses
+        return self.l2_seconds * 1000 / l2_lookups if l2_lookups else 0.0
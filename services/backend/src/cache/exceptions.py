@@ -0,0 +1,19 @@
+"""Custom exceptions for cache operations."""
+
+
+class CacheException(Exception):
+    """Base exception for all cache-related errors."""
+
+    def __init__(self, message: str, original_error: Exception = None):
+        super().__init__(message)
+        self.original_error = original_error
+
+
+class CacheConfigurationError(CacheException):
+    """Raised when the cache is misconfigured or an optional backend dependency is missing."""
+    pass
+
+
+class CacheBackendError(CacheException):
+    """Raised when an L2 cache backend operation fails."""
+    pass
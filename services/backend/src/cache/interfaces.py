@@ -0,0 +1,150 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from cache.dto import CacheStatsDTO
+
+T = TypeVar('T')
+
+
+class CacheBackendInterface(ABC):
+    """Interface for shared (L2) cache backends storing serialized values"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get serialized value by key
+
+        Args:
+            key: Fully qualified cache key
+
+        Returns:
+            Serialized value or None if missing or expired
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Store serialized value with expiration
+
+        Args:
+            key: Fully qualified cache key
+            value: Serialized value
+            ttl: Time to live in seconds
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Delete value by key
+
+        Args:
+            key: Fully qualified cache key
+        """
+        pass
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete all values whose key starts with prefix
+
+        Args:
+            prefix: Key prefix, usually a namespace
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close backend connections and cleanup resources"""
+        pass
+
+
+class CacheInterface(ABC):
+    """Interface for namespaced async caches"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key within the namespace
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store value in cache
+
+        Args:
+            key: Cache key within the namespace
+            value: Value to cache
+            ttl: Time to live in seconds, defaults to the cache TTL
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Delete cached value
+
+        Args:
+            key: Cache key within the namespace
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Delete all values in the namespace"""
+        pass
+
+    @abstractmethod
+    async def get_or_set(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[T]],
+            ttl: Optional[int] = None,
+            negative_ttl: Optional[int] = None
+    ) -> T:
+        """
+        Get cached value or load, store and return it
+
+        Concurrent misses for the same key share a single loader call.
+        A None result is cached too, which keeps repeated lookups of missing
+        entities away from the loader.
+
+        Args:
+            key: Cache key within the namespace
+            loader: Async callable producing the value on a miss
+            ttl: Time to live in seconds, defaults to the cache TTL
+            negative_ttl: Time to live in seconds of a None result, defaults to ttl
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Invalidation callback: delete one key or, when key is None, the whole namespace
+
+        Args:
+            key: Cache key within the namespace or None
+        """
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> CacheStatsDTO:
+        """
+        Get cache counters
+
+        Returns:
+            Cache statistics for the namespace
+        """
+        pass
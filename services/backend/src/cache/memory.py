@@ -0,0 +1,78 @@
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+
+
+class LRUMemoryCache:
+    """Size-bounded in-process LRU store with per-entry expiration"""
+
+    MISSING = object()
+
+    def __init__(self, max_size: int):
+        """
+        Initialize memory store
+
+        Args:
+            max_size: Maximum number of entries kept before least recently used ones are evicted
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """
+        Get value and mark it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value (which may be None) or MISSING if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return self.MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return self.MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store value, evicting least recently used entries over the size limit
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+        """
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """
+        Delete value if present
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Delete all values"""
+        self._entries.clear()
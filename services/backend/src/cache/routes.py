@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+
+from apps.accounts.dependencies import require_admin
+from cache.dependencies import get_all_caches
+from cache.schemas import CacheStatsSchema, CacheStatsResponseSchema
+
+router = APIRouter(
+    prefix="/cache",
+    tags=["cache"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+@router.get(
+    "/stats",
+    response_model=CacheStatsResponseSchema,
+    summary="Get cache statistics",
+    description="Internal: hit ratio, size and loader latency of every cache in the worker serving the request. "
+                "Requires the access token of an admin."
+)
+async def get_cache_stats() -> CacheStatsResponseSchema:
+    """
+    Get statistics of all caches created in this worker
+
+    Returns:
+        Cache statistics ordered by namespace
+    """
+    caches = get_all_caches()
+    return CacheStatsResponseSchema(
+        caches=[
+            CacheStatsSchema(
+                **vars(stats),
+                hit_ratio=round(stats.hit_ratio, 4),
+                avg_load_ms=round(stats.avg_load_ms, 3),
+                avg_l2_ms=round(stats.avg_l2_ms, 3)
+            )
+            for stats in (caches[namespace].get_stats() for namespace in sorted(caches))
+        ]
+    )
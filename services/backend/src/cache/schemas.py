@@ -0,0 +1,26 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class CacheStatsSchema(BaseModel):
+    """Schema for counters and latencies of a cache namespace"""
+    namespace: str
+    size: int
+    max_size: int
+    l1_hits: int
+    l2_hits: int
+    misses: int
+    loads: int
+    negative_loads: int
+    stale_loads: int
+    coalesced: int
+    evictions: int
+    hit_ratio: float
+    avg_load_ms: float
+    avg_l2_ms: float
+
+
+class CacheStatsResponseSchema(BaseModel):
+    """API response schema for cache statistics of this worker"""
+    caches: List[CacheStatsSchema]
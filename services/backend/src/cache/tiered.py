@@ -0,0 +1,174 @@
+import asyncio
+import pickle
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from cache.dto import CacheStatsDTO
+from cache.exceptions import CacheBackendError
+from cache.interfaces import CacheBackendInterface, CacheInterface
+from cache.memory import LRUMemoryCache
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "cache")
+
+T = TypeVar('T')
+
+
+class TieredCache(CacheInterface):
+    """Namespaced cache with an in-process LRU (L1) in front of an optional shared backend (L2)"""
+
+    def __init__(
+            self,
+            namespace: str,
+            max_size: int,
+            default_ttl: int,
+            backend: Optional[CacheBackendInterface] = None
+    ):
+        """
+        Initialize tiered cache
+
+        Args:
+            namespace: Prefix separating this cache's keys from other caches
+            max_size: Maximum number of L1 entries
+            default_ttl: Default time to live in seconds
+            backend: Optional L2 backend shared between processes
+        """
+        self._namespace = namespace
+        self._default_ttl = default_ttl
+        self._memory = LRUMemoryCache(max_size)
+        self._backend = backend
+        # delete/clear drop loads started before them, which then return their result without caching it
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._stats = CacheStatsDTO(namespace=namespace, size=0, max_size=max_size)
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self._lookup(key)
+        return None if value is LRUMemoryCache.MISSING else value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = ttl if ttl is not None else self._default_ttl
+        self._memory.set(key, value, ttl)
+
+        if self._backend:
+            try:
+                await self._backend.set(self._qualify(key), pickle.dumps(value), ttl)
+            except CacheBackendError as e:
+                logger.warning(f"L2 cache set failed in '{self._namespace}': {e}")
+
+    async def delete(self, key: str) -> None:
+        self._in_flight.pop(key, None)
+        self._memory.delete(key)
+
+        if self._backend:
+            try:
+                await self._backend.delete(self._qualify(key))
+            except CacheBackendError as e:
+                logger.warning(f"L2 cache delete failed in '{self._namespace}': {e}")
+
+    async def clear(self) -> None:
+        self._in_flight.clear()
+        self._memory.clear()
+
+        if self._backend:
+            try:
+                await self._backend.delete_prefix(self._qualify(""))
+            except CacheBackendError as e:
+                logger.warning(f"L2 cache clear failed in '{self._namespace}': {e}")
+
+    async def get_or_set(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[T]],
+            ttl: Optional[int] = None,
+            negative_ttl: Optional[int] = None
+    ) -> T:
+        value = await self._lookup(key)
+        if value is not LRUMemoryCache.MISSING:
+            return value
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._stats.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            self._stats.loads += 1
+            started_at = time.perf_counter()
+            value = await loader()
+            self._stats.load_seconds += time.perf_counter() - started_at
+
+            if value is None:
+                self._stats.negative_loads += 1
+                if negative_ttl is not None:
+                    ttl = negative_ttl
+
+            if self._in_flight.get(key) is future:
+                await self.set(key, value, ttl)
+            else:
+                self._stats.stale_loads += 1
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def invalidate(self, key: Optional[str] = None) -> None:
+        if key is None:
+            await self.clear()
+        else:
+            await self.delete(key)
+
+    def get_stats(self) -> CacheStatsDTO:
+        self._stats.size = len(self._memory)
+        self._stats.evictions = self._memory.evictions
+        return CacheStatsDTO(**vars(self._stats))
+
+    async def _lookup(self, key: str) -> Any:
+        """
+        Look the key up in L1, then L2, promoting L2 hits into L1
+
+        Args:
+            key: Cache key within the namespace
+
+        Returns:
+            Cached value or LRUMemoryCache.MISSING
+        """
+        value = self._memory.get(key)
+        if value is not LRUMemoryCache.MISSING:
+            self._stats.l1_hits += 1
+            return value
+
+        if self._backend:
+            started_at = time.perf_counter()
+            try:
+                serialized = await self._backend.get(self._qualify(key))
+            except CacheBackendError as e:
+                logger.warning(f"L2 cache get failed in '{self._namespace}': {e}")
+                serialized = None
+            self._stats.l2_seconds += time.perf_counter() - started_at
+
+            if serialized is not None:
+                self._stats.l2_hits += 1
+                value = pickle.loads(serialized)
+                # L2 doesn't report the remaining TTL, so short-lived negative entries stay in L2 only
+                if value is not None:
+                    self._memory.set(key, value, self._default_ttl)
+                return value
+
+        self._stats.misses += 1
+        return LRUMemoryCache.MISSING
+
+    def _qualify(self, key: str) -> str:
+        """Prefix key with the namespace for the shared backend"""
+        return f"{self._namespace}:{key}"
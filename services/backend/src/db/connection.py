@@ -1,36 +1,116 @@
-import warnings
+from typing import List, Optional
 
-from psycopg_pool import AsyncConnectionPool
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
 
+from db.pool import MonitoredConnectionPool
 from settings.config import config
+from settings.logging_config import get_logger
 
-warnings.filterwarnings(
-    "ignore",
-    message="opening the async pool AsyncConnectionPool in the constructor is deprecated",
-)
+logger = get_logger(__name__, "db")
 
-_pool: AsyncConnectionPool | None = None
+_pool: MonitoredConnectionPool | None = None
+_replica_pool: MonitoredConnectionPool | None = None
 
 
-def build_dsn() -> str:
-    """Assemble DSN from environment‑driven AppConfig."""
-    return (
+def build_dsn(hosts: Optional[str] = None) -> str:
+    """
+    Assemble DSN from environment‑driven AppConfig.
+
+    Args:
+        hosts: Comma-separated host[:port] list, defaults to the primary. Connections
+            to several hosts are spread randomly among them.
+
+    Returns:
+        PostgreSQL connection URI
+    """
+    dsn = (
         f"postgresql://{config.POSTGRES_USER}:{config.POSTGRES_PASSWORD}"
-        f"@{config.POSTGRES_HOST}:{config.POSTGRES_DB_PORT}/{config.POSTGRES_DB}"
+        f"@{hosts or f'{config.POSTGRES_HOST}:{config.POSTGRES_DB_PORT}'}/{config.POSTGRES_DB}"
+    )
+    return f"{dsn}?load_balance_hosts=random" if hosts and "," in hosts else dsn
+
+
+async def _configure_connection(conn: AsyncConnection) -> None:
+    """Configure a new pool connection: number of prepared statements it keeps on the server"""
+    conn.prepared_max = config.DB_PREPARED_MAX
+
+
+async def _open_pool(name: str, conninfo: str) -> MonitoredConnectionPool:
+    """Open a pool sized by the DB_POOL_* settings and wait until its minimum connections are established"""
+    pool = MonitoredConnectionPool(
+        conninfo=conninfo,
+        min_size=config.DB_POOL_MIN_SIZE,
+        max_size=config.DB_POOL_MAX_SIZE,
+        max_idle=config.DB_POOL_MAX_IDLE,
+        max_lifetime=config.DB_POOL_MAX_LIFETIME,
+        timeout=config.DB_POOL_TIMEOUT,
+        name=name,
+        configure=_configure_connection,
+        open=False,
     )
+    try:
+        await pool.open(wait=True, timeout=config.DB_POOL_TIMEOUT)
+    except PoolTimeout:
+        # Stop the workers still trying to connect in the background
+        await pool.close()
+        raise
+    logger.info(f"Connection pool '{name}' opened with {pool.get_stats()['pool_size']} connections")
+    return pool
 
 
 async def get_connection_pool() -> AsyncConnectionPool:
-    """Get or create an asynchronous PostgreSQL connection pool."""
+    """
+    Get or create the asynchronous PostgreSQL connection pool of the primary.
+
+    A new pool is opened and warmed: the call returns once DB_POOL_MIN_SIZE
+    connections are established, or raises PoolTimeout after DB_POOL_TIMEOUT seconds.
+
+    Returns:
+        Open connection pool sized by the DB_POOL_* settings
+    """
     global _pool
 
     if _pool is None:
-        _pool = AsyncConnectionPool(
-            conninfo=build_dsn(),
-            min_size=1,
-            max_size=10,
-            timeout=60,
-        )
-        await _pool.open()
-        await _pool.wait()
+        _pool = await _open_pool("primary", build_dsn())
     return _pool
+
+
+async def get_replica_pool() -> Optional[AsyncConnectionPool]:
+    """
+    Get or create the connection pool of the read replicas in POSTGRES_REPLICA_HOSTS.
+
+    Replicas that cannot be reached within DB_POOL_TIMEOUT seconds are logged and
+    left out, so reads keep going to the primary.
+
+    Returns:
+        Open connection pool, or None if no replica is configured or reachable
+    """
+    global _replica_pool
+
+    if _replica_pool is None and config.POSTGRES_REPLICA_HOSTS:
+        try:
+            _replica_pool = await _open_pool("replica", build_dsn(config.POSTGRES_REPLICA_HOSTS))
+        except PoolTimeout as e:
+            logger.error(f"Read replicas {config.POSTGRES_REPLICA_HOSTS} unreachable, reading from primary: {e}")
+    return _replica_pool
+
+
+def get_connection_pools() -> List[MonitoredConnectionPool]:
+    """
+    Get the connection pools opened in this process.
+
+    Returns:
+        Primary pool followed by the replica pool, if opened
+    """
+    return [pool for pool in (_pool, _replica_pool) if pool is not None]
+
+
+async def close_connection_pool() -> None:
+    """Close the primary and replica pools if they were opened, waiting for lent connections to return."""
+    global _pool, _replica_pool
+
+    for pool in get_connection_pools():
+        await pool.close()
+        logger.info(f"Connection pool '{pool.name}' closed")
+    _pool = _replica_pool = None
@@ -1,20 +1,30 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import (
     Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     List,
     Optional,
     TypeVar,
     Type,
     Union,
-    Dict
+    Dict,
+    Sequence,
+    Tuple
 )
+import re
+import time
 import traceback
 
 from psycopg.rows import dict_row, class_row
-from psycopg import IsolationLevel
+from psycopg import AsyncConnection, AsyncCursor, AsyncTransaction, IsolationLevel, OperationalError
 
 from db.connection import AsyncConnectionPool
+from db.dto import BatchQueryDTO
 from db.interfaces import DAOInterface
-from db.transaction_context import _current_transaction
 from settings.logging_config import get_logger
 
 logger = get_logger(__name__, "db")
@@ -22,35 +32,96 @@ logger = get_logger(__name__, "db")
 T = TypeVar('T')
 
 
-class PostgreSQLDAO(DAOInterface):
-    """Data Access Object for PostgreSQL database operations with transaction support"""
+@dataclass
+class TransactionState:
+    """Pool connection and open transaction of one task"""
+    connection_context: AsyncContextManager[AsyncConnection]
+    connection: AsyncConnection
+    transaction: Optional[AsyncTransaction] = None
+    isolation_level: Optional[IsolationLevel] = None
+
 
-    def __init__(self, connection_pool: AsyncConnectionPool):
+class PostgreSQLDAO(DAOInterface):
+    """
+    Data Access Object for PostgreSQL database operations with transaction support
+
+    One instance is shared by every request. Transaction state lives in a context variable,
+    so each asyncio task (request) sees only its own connection and transaction, and any
+    number of transactions run concurrently on the shared instance, bounded by the pool size.
+
+    With a read pool, SELECT queries outside a transaction go to the replicas and everything
+    else to the primary. Transactions always run on the primary. After a task writes, or after
+    mark_primary_reads (called on cache invalidation), reads stay on the primary for
+    sticky_seconds, so they see the write even while the replicas lag behind.
+    """
+
+    STREAM_CURSOR_NAME = "dao_stream"
+    CONSISTENT_READ_QUERY = "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"
+
+    # Statements that are safe to run on a hot standby
+    READ_QUERY_PATTERN = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+    WRITE_QUERY_PATTERN = re.compile(
+        r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+(NO\s+KEY\s+)?UPDATE|FOR\s+(KEY\s+)?SHARE|pg_notify|nextval|setval)\b",
+        re.IGNORECASE
+    )
+
+    def __init__(
+            self,
+            connection_pool: AsyncConnectionPool,
+            read_pool: Optional[AsyncConnectionPool] = None,
+            sticky_seconds: float = 0.0
+    ):
+        """
+        Initialize DAO
+
+        Args:
+            connection_pool: Pool of the primary, used for writes and transactions
+            read_pool: Optional pool of read replicas, used for reads outside transactions
+            sticky_seconds: Seconds reads stay on the primary after a write
+        """
         self._connection_pool = connection_pool
-        self._current_connection = None
-        self._current_transaction = None
-        self._connection_context = None
+        self._read_pool = read_pool
+        self._sticky_seconds = sticky_seconds
+        self._state: ContextVar[Optional[TransactionState]] = ContextVar(
+            f"dao_transaction_{id(self)}", default=None
+        )
+        self._task_primary_reads_until: ContextVar[float] = ContextVar(
+            f"dao_primary_reads_until_{id(self)}", default=0.0
+        )
+        self._primary_reads_until = 0.0
+
+    @property
+    def current_connection(self) -> Optional[AsyncConnection]:
+        """Connection of the current task's transaction, None outside a transaction"""
+        state = self._state.get()
+        return state.connection if state is not None else None
 
     async def begin_transaction(self, isolation_level: Optional[IsolationLevel] = None):
-        """Begin database transaction"""
+        """Begin database transaction on a pool connection owned by the current task"""
+        state = self._state.get()
+
         try:
             logger.debug("Beginning database transaction...")
 
-            if self._current_connection is None:
+            if state is None:
                 logger.debug("Getting connection from pool...")
-                self._connection_context = self._connection_pool.connection()
-                self._current_connection = await self._connection_context.__aenter__()
+                connection_context = self._connection_pool.connection()
+                connection = await connection_context.__aenter__()
+                state = TransactionState(connection_context, connection)
+                self._state.set(state)
 
                 if isolation_level is not None:
                     logger.debug(f"Setting isolation level to: {isolation_level.name}")
-                    self._current_connection.isolation_level = isolation_level
+                    await connection.set_isolation_level(isolation_level)
+                    state.isolation_level = isolation_level
 
                 logger.debug("Connection obtained from pool")
 
-            if self._current_transaction is None:
+            if state.transaction is None:
                 logger.debug("Starting transaction on connection...")
-                self._current_transaction = self._current_connection.transaction()
-                await self._current_transaction.__aenter__()
+                transaction = state.connection.transaction()
+                await transaction.__aenter__()
+                state.transaction = transaction
                 logger.info("Database transaction started successfully")
 
         except Exception as e:
@@ -60,14 +131,17 @@ class PostgreSQLDAO(DAOInterface):
             raise
 
     async def commit_transaction(self):
-        """Commit database transaction"""
+        """Commit database transaction of the current task"""
+        state = self._state.get()
+
         try:
             logger.debug("Committing database transaction...")
 
-            if self._current_transaction:
-                await self._current_transaction.__aexit__(None, None, None)
-                self._current_transaction = None
+            if state is not None and state.transaction is not None:
+                transaction, state.transaction = state.transaction, None
+                await transaction.__aexit__(None, None, None)
                 logger.info("Database transaction committed successfully")
+                self._mark_task_write()
 
             await self._cleanup_connection()
 
@@ -78,13 +152,15 @@ class PostgreSQLDAO(DAOInterface):
             raise
 
     async def rollback_transaction(self):
-        """Rollback database transaction"""
+        """Rollback database transaction of the current task"""
+        state = self._state.get()
+
         try:
             logger.debug("Rolling back database transaction...")
 
-            if self._current_transaction:
-                await self._current_transaction.__aexit__(Exception, Exception("Manual rollback"), None)
-                self._current_transaction = None
+            if state is not None and state.transaction is not None:
+                transaction, state.transaction = state.transaction, None
+                await transaction.__aexit__(Exception, Exception("Manual rollback"), None)
                 logger.info("Database transaction rolled back successfully")
 
             await self._cleanup_connection()
@@ -95,20 +171,60 @@ class PostgreSQLDAO(DAOInterface):
             await self._cleanup_connection()
             raise
 
+    def mark_primary_reads(self, key: Optional[str] = None) -> None:
+        """
+        Send reads of every task to the primary for sticky_seconds
+
+        Registered as invalidation callback: caches reloaded after another process's
+        write must not be filled from a replica that has not replayed it yet.
+
+        Args:
+            key: Invalidated key, unused
+        """
+        if self._read_pool is not None:
+            self._primary_reads_until = time.monotonic() + self._sticky_seconds
+
+    def _mark_task_write(self) -> None:
+        """Send reads of the current task to the primary for sticky_seconds (read-your-writes)"""
+        if self._read_pool is not None:
+            self._task_primary_reads_until.set(time.monotonic() + self._sticky_seconds)
+
+    def _get_read_pool(self) -> AsyncConnectionPool:
+        """Pool serving reads outside a transaction: the replicas unless a recent write pins the primary"""
+        if self._read_pool is None:
+            return self._connection_pool
+
+        now = time.monotonic()
+        if now < self._primary_reads_until or now < self._task_primary_reads_until.get():
+            return self._connection_pool
+        return self._read_pool
+
+    @classmethod
+    def _is_read_query(cls, query: str) -> bool:
+        """Whether a query only reads, so a replica can run it"""
+        return bool(cls.READ_QUERY_PATTERN.match(query)) and not cls.WRITE_QUERY_PATTERN.search(query)
+
     async def _cleanup_connection(self):
-        """Clean up connection and return to pool"""
-        try:
-            if self._connection_context and self._current_connection:
-                await self._connection_context.__aexit__(None, None, None)
-                logger.debug("Connection returned to pool")
+        """Clean up the current task's connection and return it to pool"""
+        state = self._state.get()
+        if state is None:
+            return
 
-            self._current_connection = None
-            self._connection_context = None
+        self._state.set(None)
 
+        try:
+            if state.isolation_level is not None and state.transaction is None:
+                # Pool connections are reused by other tasks, restore the server default
+                await state.connection.set_isolation_level(None)
+        except Exception as e:
+            logger.warning(f"Failed to reset isolation level, discarding connection: {e}")
+            await state.connection.close()
+
+        try:
+            await state.connection_context.__aexit__(None, None, None)
+            logger.debug("Connection returned to pool")
         except Exception as e:
             logger.warning(f"Error during connection cleanup: {e}")
-            self._current_connection = None
-            self._connection_context = None
 
     async def execute(
             self,
@@ -117,44 +233,140 @@ class PostgreSQLDAO(DAOInterface):
             fetch: bool = True,
             fetch_one: bool = False,
             as_dict: bool = False,
-            model_class: Optional[Type[T]] = None
+            model_class: Optional[Type[T]] = None,
+            prepare: Optional[bool] = None
     ) -> Union[List[Any], Dict[str, Any], T, List[T], None]:
         """Execute a query and optionally fetch results"""
         params = params or []
-
-        row_factory = None
-        if as_dict:
-            row_factory = dict_row
-        elif model_class:
-            row_factory = class_row(model_class)
-
-        current_tx = _current_transaction.get()
-        if current_tx and current_tx._is_active:
+        row_factory = self._row_factory(as_dict, model_class)
+
+        return await self._run(
+            lambda conn: self._execute_on(conn, query, params, fetch, fetch_one, row_factory, prepare),
+            read_only=self._is_read_query(query)
+        )
+
+    async def execute_batch(self, queries: Sequence[BatchQueryDTO], consistent_read: bool = False) -> List[Any]:
+        """Execute independent queries in pipeline mode on one connection, with a single sync round trip"""
+        if not queries:
+            return []
+
+        read_only = all(self._is_read_query(batch_query.query) for batch_query in queries)
+        if consistent_read and not read_only:
+            raise ValueError("Consistent read batches may only contain read queries")
+
+        state = self._state.get()
+        if consistent_read and (state is None or state.transaction is None):
+            # First statement of the implicit transaction, pipelined with the queries
+            queries = [BatchQueryDTO(self.CONSISTENT_READ_QUERY, fetch=False), *queries]
+            results = await self._run(lambda conn: self._execute_batch_on(conn, queries), read_only=True)
+            return results[1:]
+
+        return await self._run(lambda conn: self._execute_batch_on(conn, queries), read_only=read_only)
+
+    async def _run(self, operation: Callable[[AsyncConnection], Awaitable[T]], read_only: bool) -> T:
+        """Run an operation on the current task's transaction connection, a replica or the primary"""
+        state = self._state.get()
+        if state is not None and state.transaction is not None:
             logger.debug("Executing query within transaction context")
-            conn = current_tx.get_connection()
-            if conn is None:
-                raise RuntimeError("Transaction context is active but connection is None")
+            return await operation(state.connection)
 
-            async with conn.cursor(row_factory=row_factory) as cursor:
-                await cursor.execute(query, params)
+        if not read_only:
+            logger.debug("Executing write query without transaction context on primary")
+            self._mark_task_write()
+            async with self._connection_pool.connection() as conn:
+                return await operation(conn)
+
+        pool = self._get_read_pool()
+        if pool is not self._connection_pool:
+            logger.debug("Executing read query without transaction context on replica")
+            try:
+                async with pool.connection() as conn:
+                    return await operation(conn)
+            except OperationalError as e:
+                # Replica down, or the query was cancelled by a conflict with recovery
+                logger.warning(f"Replica read failed, retrying on primary: {e}")
+
+        logger.debug("Executing read query without transaction context on primary")
+        async with self._connection_pool.connection() as conn:
+            return await operation(conn)
+
+    @staticmethod
+    def _row_factory(as_dict: bool, model_class: Optional[Type[Any]]) -> Optional[Any]:
+        """Row factory producing dictionaries, model instances or tuples"""
+        if as_dict:
+            return dict_row
+        if model_class:
+            return class_row(model_class)
+        return None
+
+    @staticmethod
+    async def _execute_on(
+            conn: AsyncConnection,
+            query: str,
+            params: List[Any],
+            fetch: bool,
+            fetch_one: bool,
+            row_factory: Optional[Any],
+            prepare: Optional[bool] = None
+    ) -> Union[List[Any], Dict[str, Any], T, List[T], None]:
+        """Execute a query on a connection, prepared as requested, and fetch results as requested"""
+        async with conn.cursor(row_factory=row_factory) as cursor:
+            await cursor.execute(query, params, prepare=prepare)
+            return await PostgreSQLDAO._fetch(cursor, fetch, fetch_one)
+
+    @staticmethod
+    async def _execute_batch_on(conn: AsyncConnection, queries: Sequence[BatchQueryDTO]) -> List[Any]:
+        """
+        Pipeline queries on a connection and fetch their results
+
+        Outside a transaction the connection opens an implicit one before the first
+        query, so a failing query rolls back the whole batch when the connection returns.
+        """
+        cursors = []
+        try:
+            async with conn.pipeline():
+                for batch_query in queries:
+                    cursor = conn.cursor(row_factory=PostgreSQLDAO._row_factory(
+                        batch_query.as_dict, batch_query.model_class
+                    ))
+                    cursors.append(cursor)
+                    await cursor.execute(batch_query.query, batch_query.params or [])
+            # Leaving the pipeline syncs once and receives every result
+
+            return [
+                await PostgreSQLDAO._fetch(cursor, batch_query.fetch, batch_query.fetch_one)
+                for cursor, batch_query in zip(cursors, queries)
+            ]
+        finally:
+            for cursor in cursors:
+                await cursor.close()
+
+    @staticmethod
+    async def _fetch(cursor: AsyncCursor, fetch: bool, fetch_one: bool) -> Union[List[Any], Any, None]:
+        """Fetch the result of an executed cursor as requested"""
+        if not fetch or cursor.description is None:
+            return None
+
+        if fetch_one:
+            return await cursor.fetchone()
+        else:
+            return await cursor.fetchall()
 
-                if not fetch or cursor.description is None:
-                    return None
+    async def stream(
+            self,
+            query: str,
+            params: Optional[List[Any]] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[Tuple]:
+        """Execute a query through a named server-side cursor and yield rows batch by batch"""
+        params = params or []
 
-                if fetch_one:
-                    return await cursor.fetchone()
-                else:
-                    return await cursor.fetchall()
-        else:
-            logger.debug("Executing query without transaction context")
-            async with self._connection_pool.connection() as conn:
-                async with conn.cursor(row_factory=row_factory) as cursor:
+        async with self._get_read_pool().connection() as conn:
+            # Server-side cursors only live inside a transaction
+            async with conn.transaction():
+                async with conn.cursor(name=self.STREAM_CURSOR_NAME) as cursor:
+                    cursor.itersize = batch_size
                     await cursor.execute(query, params)
 
-                    if not fetch or cursor.description is None:
-                        return None
-
-                    if fetch_one:
-                        return await cursor.fetchone()
-                    else:
-                        return await cursor.fetchall()
+                    async for row in cursor:
+                        yield row
@@ -2,10 +2,12 @@ from typing import Optional
 
 from fastapi import Depends
 
-from db.connection import get_connection_pool, AsyncConnectionPool
+from db.connection import get_connection_pool, get_replica_pool, AsyncConnectionPool
 from db.dao import PostgreSQLDAO
 from db.interfaces import DAOInterface, SQLQueryBuilderInterface
+from db.invalidation import get_invalidation_bus, InvalidationTopic
 from db.query_builder import SQLQueryBuilder
+from settings.config import config
 
 _dao_instance: Optional[DAOInterface] = None
 
@@ -27,8 +29,12 @@ async def get_database_dao(
     Dependency that provides a SINGLE database DAO instance.
     All repositories will share the same DAO for transaction consistency.
 
+    Reads outside transactions go to the replica pool when POSTGRES_REPLICA_HOSTS is set.
+    Every invalidation message keeps reads on the primary for DB_REPLICA_STICKY_SECONDS,
+    so caches dropped after a write are not refilled from a lagging replica.
+
     Args:
-        connection_pool: PostgreSQL connection pool
+        connection_pool: PostgreSQL connection pool of the primary
 
     Returns:
         Shared Data Access Object for database operations
@@ -36,7 +42,12 @@ async def get_database_dao(
     global _dao_instance
 
     if _dao_instance is None:
-        _dao_instance = PostgreSQLDAO(connection_pool)
+        dao = PostgreSQLDAO(connection_pool, await get_replica_pool(), config.DB_REPLICA_STICKY_SECONDS)
+        bus = get_invalidation_bus()
+        for topic in InvalidationTopic:
+            if topic != InvalidationTopic.ALL:
+                bus.register(topic, dao.mark_primary_reads)
+        _dao_instance = dao
 
     return _dao_instance
 
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple, Type
+
+
+@dataclass
+class PoolStatsDTO:
+    """DTO with gauges, counters and connection wait times of a connection pool"""
+    name: str
+    min_size: int
+    max_size: int
+    size: int
+    available: int
+    waiting: int
+    requests: int = 0
+    requests_queued: int = 0
+    requests_errors: int = 0
+    requests_wait_ms: int = 0
+    connections: int = 0
+    connections_errors: int = 0
+    wait_buckets: List[Tuple[float, int]] = field(default_factory=list)
+
+    @property
+    def in_use(self) -> int:
+        """Connections currently lent to clients"""
+        return self.size - self.available
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Mean wait for a connection in milliseconds, over all requests"""
+        return self.requests_wait_ms / self.requests if self.requests else 0.0
+
+
+@dataclass
+class BatchQueryDTO:
+    """DTO with a query of a pipelined batch and the fetch options of DAOInterface.execute"""
+    query: str
+    params: Optional[List[Any]] = None
+    fetch: bool = True
+    fetch_one: bool = False
+    as_dict: bool = False
+    model_class: Optional[Type[Any]] = None
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, TypeVar, Type, Union, Dict, Self, Tuple
+from typing import (
+    Any, List, Optional, TypeVar, Type, Union, Dict, Self, Tuple, Callable, AsyncIterator, Sequence
+)
 
 from psycopg import IsolationLevel
 
+from db.dto import BatchQueryDTO
+
 T = TypeVar('T')
 
 
@@ -17,7 +21,8 @@ class DAOInterface(ABC):
             fetch: bool = True,
             fetch_one: bool = False,
             as_dict: bool = False,
-            model_class: Optional[Type[T]] = None
+            model_class: Optional[Type[T]] = None,
+            prepare: Optional[bool] = None
     ) -> Union[List[Any], Dict[str, Any], T, List[T], None]:
         """
         Execute a query and optionally fetch results
@@ -29,25 +34,77 @@ class DAOInterface(ABC):
             fetch_one: If True, fetch only one row
             as_dict: If True, return results as dictionaries
             model_class: Optional class type to map results
+            prepare: True to run the query as a server-side prepared statement from its first
+                execution, False never to, None to prepare it once it has been executed a few times
 
         Returns:
             Query results based on the options specified
         """
         pass
 
+    @abstractmethod
+    async def execute_batch(self, queries: Sequence[BatchQueryDTO], consistent_read: bool = False) -> List[Any]:
+        """
+        Execute independent queries in one round trip and fetch all results
+
+        The queries are pipelined on a single connection and run in one transaction:
+        if one fails, the batch is rolled back and the error is raised. Under the default
+        READ COMMITTED isolation every query reads its own snapshot, so a write committed
+        between two queries can be seen by one and not the other.
+
+        Args:
+            queries: Queries with their fetch options, none may depend on another's result
+            consistent_read: Run a read-only batch in a REPEATABLE READ READ ONLY transaction,
+                so every query reads the same snapshot; inside a transaction of the caller
+                the batch reads under that transaction's isolation level
+
+        Returns:
+            Result of every query, as execute would return it, in query order
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+            self,
+            query: str,
+            params: Optional[List[Any]] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[Tuple]:
+        """
+        Execute a query through a server-side cursor and iterate over its rows
+
+        Memory use is bounded by batch_size whatever the size of the result.
+        The connection stays checked out until iteration ends.
+
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            batch_size: Number of rows fetched per round trip
+
+        Returns:
+            Async iterator over result rows
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def current_connection(self) -> Optional[Any]:
+        """Connection of the current task's transaction, None outside a transaction"""
+        pass
+
     @abstractmethod
     async def begin_transaction(self, isolation_level: Optional[IsolationLevel] = None):
-        """Begin database transaction"""
+        """Begin database transaction owned by the current task"""
         pass
 
     @abstractmethod
     async def commit_transaction(self):
-        """Commit database transaction"""
+        """Commit database transaction of the current task"""
         pass
 
     @abstractmethod
     async def rollback_transaction(self):
-        """Rollback database transaction"""
+        """Rollback database transaction of the current task"""
         pass
 
 
@@ -59,6 +116,11 @@ class SQLQueryBuilderInterface(ABC):
         """Add fields to SELECT clause"""
         pass
 
+    @abstractmethod
+    def select_expression(self, expression: str, *params) -> Self:
+        """Add parametrized expression to SELECT clause"""
+        pass
+
     @abstractmethod
     def from_table(self, table_name: str) -> Self:
         """Set FROM table with optional alias"""
@@ -69,6 +131,11 @@ class SQLQueryBuilderInterface(ABC):
         """Add condition to WHERE clause with params"""
         pass
 
+    @abstractmethod
+    def group_by(self, clause: str) -> Self:
+        """Set GROUP BY clause"""
+        pass
+
     @abstractmethod
     def order_by(self, clause: str, *params) -> Self:
         """Add clause to ORDER BY section with params"""
@@ -90,8 +157,13 @@ class SQLQueryBuilderInterface(ABC):
         pass
 
     @abstractmethod
-    def build_count(self) -> Tuple[str, List[Any]]:
-        """Build COUNT query with the same conditions"""
+    def build_count(self, limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Build COUNT query with the same conditions, optionally counting at most limit rows"""
+        pass
+
+    @abstractmethod
+    def build_matching_rows(self) -> Tuple[str, List[Any]]:
+        """Build query selecting a constant for every row matching the conditions"""
         pass
 
     @abstractmethod
@@ -113,3 +185,39 @@ class SQLQueryBuilderInterface(ABC):
     def get_params(self) -> List[Any]:
         """Get current parameters"""
         pass
+
+
+class InvalidationBusInterface(ABC):
+    """Interface for cross-process cache invalidation bus"""
+
+    @abstractmethod
+    def register(self, topic: str, callback: Callable[[Optional[str]], Any]) -> None:
+        """
+        Register cache invalidation callback for a topic
+
+        Args:
+            topic: Invalidation topic the callback listens to
+            callback: Sync or async callable receiving the optional invalidated key
+        """
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start listening for invalidation messages"""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop listening and close the listener connection"""
+        pass
+
+    @abstractmethod
+    async def dispatch(self, topic: str, key: Optional[str] = None) -> None:
+        """
+        Run callbacks registered for a topic in the current process
+
+        Args:
+            topic: Invalidation topic
+            key: Optional invalidated key, None means the whole topic
+        """
+        pass
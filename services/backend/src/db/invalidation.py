@@ -0,0 +1,208 @@
+import asyncio
+import inspect
+import json
+from collections import defaultdict
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psycopg
+from psycopg import sql
+
+from db.connection import build_dsn
+from db.interfaces import InvalidationBusInterface
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "db")
+
+_bus: Optional['PostgresInvalidationBus'] = None
+
+# Channel of the product triggers of migration 006, used until migration 010 adds the settings row
+DEFAULT_CHANNEL = "cache_invalidation"
+SETTINGS_TABLE = "cache_invalidation_settings"
+CHANNEL_QUERY = f"SELECT channel FROM {SETTINGS_TABLE} WHERE id = 1"
+
+
+class InvalidationTopic(str, Enum):
+    """Cache invalidation topics, PRODUCT is keyed by "id:<product_id>" or "slug:<slug>" of a single product"""
+    ALL = "all"
+    CATEGORIES = "categories"
+    PRODUCTS = "products"
+    PRODUCT = "product"
+    FACETS = "facets"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class PostgresInvalidationBus(InvalidationBusInterface):
+    """Cache invalidation bus listening on the configured Postgres NOTIFY channel from a dedicated connection"""
+
+    RECONNECT_DELAY_SECONDS = 1.0
+    MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+    def __init__(self, dsn: str):
+        """
+        Initialize invalidation bus
+
+        Args:
+            dsn: PostgreSQL connection string for the listener connection
+        """
+        self._dsn = dsn
+        self._channel: Optional[str] = None
+        self._callbacks: Dict[str, List[Callable[[Optional[str]], Any]]] = defaultdict(list)
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, topic: str, callback: Callable[[Optional[str]], Any]) -> None:
+        """
+        Register cache invalidation callback for a topic, registering the same callback twice is a no-op
+
+        Args:
+            topic: Invalidation topic the callback listens to
+            callback: Sync or async callable receiving the optional invalidated key
+        """
+        callbacks = self._callbacks[str(topic)]
+        if callback not in callbacks:
+            callbacks.append(callback)
+
+    async def start(self) -> None:
+        """Start the background listener task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+            logger.info("Invalidation bus started")
+
+    async def stop(self) -> None:
+        """Cancel the background listener task, which closes the listener connection"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+        logger.info("Invalidation bus stopped")
+
+    async def dispatch(self, topic: str, key: Optional[str] = None) -> None:
+        """
+        Run callbacks registered for a topic, or all callbacks for the ALL topic
+
+        Args:
+            topic: Invalidation topic
+            key: Optional invalidated key, None means the whole topic
+        """
+        if topic == InvalidationTopic.ALL:
+            callbacks = [callback for topic_callbacks in self._callbacks.values() for callback in topic_callbacks]
+        else:
+            callbacks = list(self._callbacks.get(topic, []))
+
+        logger.info(f"Invalidating topic '{topic}' key '{key}': {len(callbacks)} callbacks")
+
+        for callback in callbacks:
+            try:
+                result = callback(key)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Invalidation callback {callback!r} failed for topic '{topic}': {e}")
+
+    async def _listen(self) -> None:
+        """Listen for notifications forever, reconnecting with backoff on connection errors"""
+        delay = self.RECONNECT_DELAY_SECONDS
+        reconnecting = False
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(self._dsn, autocommit=True) as connection:
+                    self._channel = await get_invalidation_channel(connection)
+                    await connection.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+                    logger.info(f"Listening for invalidations on channel '{self._channel}'")
+
+                    if reconnecting:
+                        await self.dispatch(InvalidationTopic.ALL)
+
+                    delay = self.RECONNECT_DELAY_SECONDS
+                    reconnecting = False
+
+                    async for notification in connection.notifies():
+                        topic, key = self._parse_payload(notification.payload)
+                        await self.dispatch(topic, key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Invalidation listener failed, reconnecting in {delay:.0f}s: {e}")
+                reconnecting = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+
+    @staticmethod
+    def _parse_payload(payload: str) -> Tuple[str, Optional[str]]:
+        """
+        Parse notification payload into topic and key
+
+        Args:
+            payload: JSON object with topic and optional key, or a bare topic name
+
+        Returns:
+            Tuple of (topic, key)
+        """
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return payload, None
+
+        if not isinstance(message, dict):
+            return str(message), None
+
+        key = message.get("key")
+        return str(message.get("topic", InvalidationTopic.ALL)), str(key) if key is not None else None
+
+
+def get_invalidation_bus() -> PostgresInvalidationBus:
+    """Get or create the process-wide invalidation bus."""
+    global _bus
+
+    if _bus is None:
+        _bus = PostgresInvalidationBus(build_dsn())
+    return _bus
+
+
+async def get_invalidation_channel(connection: psycopg.AsyncConnection) -> str:
+    """
+    Read the NOTIFY channel from the invalidation settings row
+
+    Databases without the settings table (built from init.sql only, or with migration 010
+    rolled back) use the default channel of the migration 006 triggers.
+
+    Args:
+        connection: Psycopg connection
+
+    Returns:
+        Channel name
+    """
+    cursor = await connection.execute("SELECT to_regclass(%s)", [SETTINGS_TABLE])
+    row = await cursor.fetchone()
+    if row is None or row[0] is None:
+        return DEFAULT_CHANNEL
+
+    cursor = await connection.execute(CHANNEL_QUERY)
+    row = await cursor.fetchone()
+    return row[0] if row is not None else DEFAULT_CHANNEL
+
+
+async def notify_invalidation(connection: psycopg.AsyncConnection, topic: str, key: Optional[Any] = None) -> None:
+    """
+    Publish cache invalidation message to every process listening on the invalidation channel
+
+    The message is delivered when the connection's transaction commits.
+
+    Args:
+        connection: Psycopg connection
+        topic: Invalidation topic
+        key: Optional invalidated key, None invalidates the whole topic
+    """
+    payload = json.dumps({"topic": str(topic), "key": key})
+    channel = await get_invalidation_channel(connection)
+    logger.info(f"Invalidation notify on '{channel}': {payload}")
+    await connection.execute("SELECT pg_notify(%s, %s)", [channel, payload])
@@ -0,0 +1,49 @@
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from db.invalidation import notify_invalidation, InvalidationTopic
+from settings.logging_config import get_logger
+
+logger = get_logger(__name__, "db")
+
+CATEGORY_FACETS_VIEW = "catalog_category_facets"
+
+
+async def refresh_materialized_view(
+        pool: AsyncConnectionPool,
+        view: str,
+        topic: InvalidationTopic = InvalidationTopic.FACETS
+) -> bool:
+    """
+    Refresh a materialized view without blocking its readers and invalidate caches built from it
+
+    REFRESH ... CONCURRENTLY cannot run inside a transaction block, so the refresh runs
+    on its own pool connection in autocommit mode, restored before the connection returns.
+
+    Args:
+        pool: Connection pool
+        view: Name of the materialized view, it needs a unique index
+        topic: Invalidation topic published after the refresh
+
+    Returns:
+        True if the view was refreshed, False if it does not exist (migration not applied yet)
+    """
+    async with pool.connection() as conn:
+        await conn.set_autocommit(True)
+
+        try:
+            result = await conn.execute("SELECT to_regclass(%s)", [view])
+            row = await result.fetchone()
+            if row is None or row[0] is None:
+                logger.info(f"Materialized view '{view}' does not exist yet. Skipping refresh.")
+                return False
+
+            logger.info(f"Refreshing materialized view '{view}'...")
+            await conn.execute(
+                sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}").format(sql.Identifier(view))
+            )
+            await notify_invalidation(conn, topic)
+            logger.info(f"Materialized view '{view}' refreshed")
+            return True
+        finally:
+            await conn.set_autocommit(False)
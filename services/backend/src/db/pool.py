@@ -0,0 +1,97 @@
+import bisect
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
+
+from db.dto import PoolStatsDTO
+
+# Upper bounds of the connection wait time buckets in milliseconds
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class WaitTimeHistogram:
+    """Histogram of connection wait times over fixed buckets"""
+
+    def __init__(self, bounds_ms: Sequence[float] = WAIT_BUCKETS_MS):
+        """
+        Initialize histogram
+
+        Args:
+            bounds_ms: Ascending upper bounds of the buckets in milliseconds, an overflow bucket is added
+        """
+        self._bounds_ms = tuple(bounds_ms)
+        self._counts = [0] * (len(self._bounds_ms) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """
+        Count a wait in its bucket
+
+        Args:
+            seconds: Wait time in seconds
+        """
+        self._counts[bisect.bisect_left(self._bounds_ms, seconds * 1000)] += 1
+
+    def get_buckets(self) -> List[Tuple[Optional[float], int]]:
+        """
+        Get cumulative bucket counts
+
+        Returns:
+            (upper bound in milliseconds, waits up to that bound) per bucket, the overflow bucket bound is None
+        """
+        buckets = []
+        total = 0
+        for bound, count in zip((*self._bounds_ms, None), self._counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class MonitoredConnectionPool(AsyncConnectionPool):
+    """Connection pool recording how long every client waits for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_histogram = WaitTimeHistogram()
+
+    async def getconn(self, timeout: Optional[float] = None) -> AsyncConnection:
+        """
+        Get a connection from the pool, timing the wait including requests that time out
+
+        Args:
+            timeout: Seconds to wait for a connection, defaults to the pool timeout
+
+        Returns:
+            Connection lent by the pool
+        """
+        started = time.perf_counter()
+        try:
+            return await super().getconn(timeout=timeout)
+        finally:
+            self._wait_histogram.observe(time.perf_counter() - started)
+
+    def get_pool_stats(self) -> PoolStatsDTO:
+        """
+        Get current gauges, counters and wait time histogram of the pool
+
+        Returns:
+            PoolStatsDTO
+        """
+        # Counters are omitted from psycopg's stats until they are first incremented
+        stats = self.get_stats()
+        return PoolStatsDTO(
+            name=self.name,
+            min_size=stats["pool_min"],
+            max_size=stats["pool_max"],
+            size=stats["pool_size"],
+            available=stats["pool_available"],
+            waiting=stats["requests_waiting"],
+            requests=stats.get("requests_num", 0),
+            requests_queued=stats.get("requests_queued", 0),
+            requests_errors=stats.get("requests_errors", 0),
+            requests_wait_ms=stats.get("requests_wait_ms", 0),
+            connections=stats.get("connections_num", 0),
+            connections_errors=stats.get("connections_errors", 0),
+            wait_buckets=self._wait_histogram.get_buckets()
+        )
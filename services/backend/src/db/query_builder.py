@@ -1,4 +1,4 @@
-from typing import Self, Tuple, List, Any
+from typing import Self, Tuple, List, Any, Optional
 
 from db.interfaces import SQLQueryBuilderInterface
 
@@ -11,8 +11,10 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
         self._base_table = base_table
         self._from_table = None
         self._select_fields = []
+        self._select_params = []
         self._join_clauses = []
         self._where_conditions = []
+        self._group_by_clause = None
         self._order_by_clauses = []
         self._params = []
         self._offset_value = None
@@ -23,6 +25,15 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
         self._select_fields.extend(fields)
         return self
 
+    def select_expression(self, expression: str, *params) -> Self:
+        """Add parametrized expression to SELECT clause"""
+        self._select_fields.append(expression)
+
+        if params:
+            self._select_params.extend(params)
+
+        return self
+
     def from_table(self, table_name: str) -> Self:
         """Set FROM table with optional alias"""
         self._from_table = table_name
@@ -38,6 +49,11 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
 
         return self
 
+    def group_by(self, clause: str) -> Self:
+        """Set GROUP BY clause"""
+        self._group_by_clause = clause
+        return self
+
     def order_by(self, clause: str, *params) -> Self:
         """Add clause to ORDER BY section with params"""
         if clause and clause.strip():
@@ -69,10 +85,13 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
         if self._where_conditions:
             query += f" WHERE {' AND '.join(self._where_conditions)}"
 
+        if self._group_by_clause:
+            query += f" GROUP BY {self._group_by_clause}"
+
         if self._order_by_clauses:
             query += f" ORDER BY {', '.join(self._order_by_clauses)}"
 
-        params = self._params.copy()
+        params = self._select_params + self._params
 
         if self._limit_value is not None:
             query += f" LIMIT %s"
@@ -84,9 +103,23 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
 
         return query, params
 
-    def build_count(self) -> Tuple[str, List[Any]]:
-        """Build COUNT query with the same conditions"""
-        query = f"SELECT COUNT(*) FROM {self._base_table}"
+    def build_count(self, limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Build COUNT query with the same conditions, optionally counting at most limit rows"""
+        params = self._params.copy()
+
+        if limit is None:
+            return f"SELECT COUNT(*) {self._build_from_where()}", params
+
+        params.append(limit)
+        return f"SELECT COUNT(*) FROM (SELECT 1 {self._build_from_where()} LIMIT %s) AS limited_rows", params
+
+    def build_matching_rows(self) -> Tuple[str, List[Any]]:
+        """Build query selecting a constant for every row matching the conditions"""
+        return f"SELECT 1 {self._build_from_where()}", self._params.copy()
+
+    def _build_from_where(self) -> str:
+        """Build FROM, JOIN and WHERE part over the base table"""
+        query = f"FROM {self._base_table}"
 
         if self._join_clauses:
             query += f" {' '.join(self._join_clauses)}"
@@ -94,7 +127,7 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
         if self._where_conditions:
             query += f" WHERE {' AND '.join(self._where_conditions)}"
 
-        return query, self._params.copy()
+        return query
 
     def get_where_conditions(self) -> List[str]:
         """Get current WHERE conditions"""
@@ -106,9 +139,12 @@ class SQLQueryBuilder(SQLQueryBuilderInterface):
 
     def reset(self) -> Self:
         """Reset the builder state to initial values"""
+        self._from_table = None
         self._select_fields = []
+        self._select_params = []
         self._where_conditions = []
         self._join_clauses = []
+        self._group_by_clause = None
         self._order_by_clauses = []
         self._params = []
         self._offset_value = None
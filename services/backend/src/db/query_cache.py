@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, List, Mapping, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class ParamSlot:
+    """Placeholder for a query parameter: the index-th value of a named parameter source"""
+    source: str
+    index: int = 0
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """SQL text of a query shape and the slot filling each of its placeholders, in order"""
+    sql: str
+    param_slots: Tuple[ParamSlot, ...]
+
+    @classmethod
+    def from_built(cls, query: str, params: Sequence[Any]) -> 'CompiledQuery':
+        """
+        Create compiled query from a query built with ParamSlot objects as parameters
+
+        Args:
+            query: Built SQL text
+            params: Built parameters, every one a ParamSlot
+
+        Returns:
+            CompiledQuery
+
+        Raises:
+            ValueError: If a parameter is a value instead of a slot, it would be frozen into the shape
+        """
+        for param in params:
+            if not isinstance(param, ParamSlot):
+                raise ValueError(f"Compiled query parameter {param!r} is not a ParamSlot")
+        return cls(query, tuple(params))
+
+    def bind(self, sources: Mapping[str, Sequence[Any]]) -> List[Any]:
+        """
+        Fill the slots with the values of a request
+
+        Args:
+            sources: Parameter values per source name
+
+        Returns:
+            Parameters in placeholder order
+        """
+        return [sources[slot.source][slot.index] for slot in self.param_slots]
+
+
+class QueryShapeCache:
+    """
+    LRU cache of compiled queries per query shape, shared by every request of the process
+
+    A shape is a hashable key covering everything that changes the SQL text of a query
+    but none of its parameter values, so each shape is compiled once and its text stays
+    identical between requests, which lets the server reuse its prepared statement.
+    """
+
+    def __init__(self, max_size: int = 512):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum number of cached shapes, 0 compiles every query
+        """
+        self._max_size = max_size
+        self._queries: OrderedDict[Hashable, CompiledQuery] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def get_or_compile(self, shape: Hashable, compile_query: Callable[[], CompiledQuery]) -> CompiledQuery:
+        """
+        Get the compiled query of a shape, compiling it on first use
+
+        Args:
+            shape: Query shape
+            compile_query: Callable compiling the shape
+
+        Returns:
+            Compiled query
+        """
+        compiled = self._queries.get(shape)
+        if compiled is not None:
+            self._queries.move_to_end(shape)
+            self.hits += 1
+            return compiled
+
+        self.misses += 1
+        compiled = compile_query()
+
+        if self._max_size > 0:
+            self._queries[shape] = compiled
+            if len(self._queries) > self._max_size:
+                self._queries.popitem(last=False)
+
+        return compiled
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+
+from apps.accounts.dependencies import require_admin
+from db.connection import get_connection_pools
+from db.schemas import PoolStatsResponseSchema, PoolStatsSchema, WaitBucketSchema
+
+router = APIRouter(
+    prefix="/db",
+    tags=["db"],
+    dependencies=[Depends(require_admin)]
+)
+
+
+@router.get(
+    "/pool/stats",
+    response_model=PoolStatsResponseSchema,
+    summary="Get connection pool statistics",
+    description="Internal: size, connections in use, waiting requests and connection wait time histogram "
+                "of the primary and replica database pools in the worker serving the request. "
+                "Requires the access token of an admin."
+)
+async def get_pool_stats() -> PoolStatsResponseSchema:
+    """
+    Get statistics of the database connection pools opened in this worker
+
+    Returns:
+        Gauges, counters and cumulative wait time buckets of every pool, primary first
+    """
+    return PoolStatsResponseSchema(
+        pools=[
+            PoolStatsSchema(
+                **{key: value for key, value in vars(stats).items() if key != "wait_buckets"},
+                in_use=stats.in_use,
+                avg_wait_ms=round(stats.avg_wait_ms, 3),
+                wait_histogram=[WaitBucketSchema(le_ms=bound, count=count) for bound, count in stats.wait_buckets]
+            )
+            for stats in (pool.get_pool_stats() for pool in get_connection_pools())
+        ]
+    )
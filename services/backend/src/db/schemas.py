@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class WaitBucketSchema(BaseModel):
+    """Schema for a cumulative bucket of the connection wait time histogram"""
+    le_ms: Optional[float]
+    count: int
+
+
+class PoolStatsSchema(BaseModel):
+    """Schema for gauges, counters and wait times of a connection pool"""
+    name: str
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    available: int
+    waiting: int
+    requests: int
+    requests_queued: int
+    requests_errors: int
+    requests_wait_ms: int
+    avg_wait_ms: float
+    connections: int
+    connections_errors: int
+    wait_histogram: List[WaitBucketSchema]
+
+
+class PoolStatsResponseSchema(BaseModel):
+    """API response schema for connection pool statistics of this worker"""
+    pools: List[PoolStatsSchema]
@@ -20,8 +20,8 @@ class TransactionContext:
         self._dao = dao
         self._isolation_level = isolation_level
         self._connection = None
-        self._transaction = None
         self._is_active = False
+        self._token = None
 
     async def __aenter__(self):
         """Start transaction context"""
@@ -30,11 +30,10 @@ class TransactionContext:
 
             await self._dao.begin_transaction(self._isolation_level)
 
-            self._connection = self._dao._current_connection
-            self._transaction = self._dao._current_transaction
+            self._connection = self._dao.current_connection
             self._is_active = True
 
-            _current_transaction.set(self)
+            self._token = _current_transaction.set(self)
 
             if self._isolation_level:
                 logger.info(
@@ -63,7 +62,9 @@ class TransactionContext:
             logger.error(f"Cleanup traceback: {traceback.format_exc()}")
         finally:
             self._is_active = False
-            _current_transaction.set(None)
+            if self._token is not None:
+                _current_transaction.reset(self._token)
+                self._token = None
             logger.debug("Transaction context cleaned up")
 
     def get_connection(self):
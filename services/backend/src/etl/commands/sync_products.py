@@ -9,6 +9,8 @@ from elasticsearch import AsyncElasticsearch
 from psycopg_pool import AsyncConnectionPool
 
 from db.connection import get_connection_pool
+from db.invalidation import notify_invalidation, InvalidationTopic
+from db.materialized_views import refresh_materialized_view, CATEGORY_FACETS_VIEW
 from etl.sync.extractors import PostgreSQLProductExtractor
 from etl.sync.loaders import ElasticsearchProductLoader
 from etl.sync.migrator import ProductDataMigrator
@@ -104,6 +106,10 @@ async def _run_sync(batch_size: int, force: bool, dry_run: bool) -> None:
 
             click.echo(f"\nStarting migration...")
             await migrator.migrate_products(batch_size)
+            await notify_invalidation(connection, InvalidationTopic.PRODUCTS)
+
+            click.echo("\nRefreshing category facets...")
+            await refresh_materialized_view(pg_pool, CATEGORY_FACETS_VIEW)
 
             click.echo("Product synchronization completed successfully!")
 
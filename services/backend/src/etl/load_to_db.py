@@ -2,6 +2,8 @@ from async_lru import alru_cache
 from psycopg_pool import AsyncConnectionPool
 from tqdm.asyncio import tqdm_asyncio
 
+from db.invalidation import notify_invalidation, InvalidationTopic
+from db.materialized_views import refresh_materialized_view, CATEGORY_FACETS_VIEW
 from settings.logging_config import get_logger
 from etl.models.dto import ETLResultDTO
 
@@ -27,6 +29,10 @@ class DatabaseSeeder:
             await self._seed_seasons(conn)
             await self._seed_usage_types(conn)
             await self._seed_products(conn)
+            await self._sync_product_category_keys(conn)
+        await refresh_materialized_view(self._pool, CATEGORY_FACETS_VIEW)
+        async with self._pool.connection() as conn:
+            await notify_invalidation(conn, InvalidationTopic.ALL)
         logger.info("Database seeding completed successfully.")
 
     async def is_database_empty(self):
@@ -117,6 +123,31 @@ class DatabaseSeeder:
                 args.extend(row)
             await conn.execute(sql, args)
 
+    async def _sync_product_category_keys(self, conn):
+        """Fill denormalized master/sub category ids on products if the schema has them."""
+        query = """
+                SELECT COUNT(*) FROM information_schema.columns
+                WHERE table_name = %s AND column_name IN ('master_category_id', 'sub_category_id');
+                """
+        row = await conn.execute(query, (f"{self.APP_NAME}_products",))
+        result = await row.fetchone()
+        if result[0] < 2:
+            logger.info("Product category keys are not in the schema yet. Skipping sync.")
+            return
+
+        sql = f"""
+              UPDATE {self.APP_NAME}_products p
+              SET master_category_id = sc.master_category_id,
+                  sub_category_id = sc.sub_category_id
+              FROM {self.APP_NAME}_article_type at
+              JOIN {self.APP_NAME}_sub_category sc ON at.sub_category_id = sc.sub_category_id
+              WHERE p.article_type_id = at.article_type_id
+                AND (p.master_category_id IS DISTINCT FROM sc.master_category_id
+                     OR p.sub_category_id IS DISTINCT FROM sc.sub_category_id);
+              """
+        result = await conn.execute(sql)
+        logger.info(f"Synced category keys for {result.rowcount} products.")
+
     @alru_cache(maxsize=128)
     async def _get_master_category_id(self, conn, name: str) -> int:
         query = f"SELECT master_category_id FROM {self.APP_NAME}_master_category WHERE name=%s;"
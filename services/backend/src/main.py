@@ -7,9 +7,16 @@ from fastapi.exceptions import RequestValidationError
 
 from settings.config import config
 from settings.logging_config import get_logger
+from apps.catalog.dependencies import get_catalog_snapshot_manager
 from apps.catalog.routes import router as catalog_router
 from apps.accounts.routes.accounts import router as accounts_router
 from apps.accounts.routes.social_auth import router as auth_router
+from cache.routes import router as cache_router
+from cache.dependencies import cleanup_cache_backend
+from db.connection import get_connection_pool, close_connection_pool
+from db.dependencies import get_database_dao
+from db.invalidation import get_invalidation_bus
+from db.routes import router as db_router
 from search.dependencies import cleanup_autocomplete_client
 
 logger = get_logger(__name__, "main")
@@ -22,10 +29,26 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Application startup: initializing resources...")
+    pool = await get_connection_pool()
+    if config.CACHE_INVALIDATION_ENABLED:
+        await get_invalidation_bus().start()
+    snapshot_manager = await get_catalog_snapshot_manager(
+        await get_database_dao(pool), get_invalidation_bus()
+    )
+    if snapshot_manager:
+        try:
+            await snapshot_manager.load()
+        except Exception as e:
+            logger.error(f"Catalog snapshot preload failed, counts use SQL until it loads: {e}")
     yield
     # Shutdown
     logger.info("Application shutdown: cleaning up resources...")
+    await get_invalidation_bus().stop()
+    if snapshot_manager:
+        await snapshot_manager.close()
     await cleanup_autocomplete_client()
+    await cleanup_cache_backend()
+    await close_connection_pool()
     logger.info("Application shutdown complete")
 
 
@@ -63,3 +86,5 @@ API_VERSION_PREFIX = "/api/v1"
 app.include_router(catalog_router, prefix=f"{API_VERSION_PREFIX}")
 app.include_router(accounts_router, prefix=f"{API_VERSION_PREFIX}")
 app.include_router(auth_router, prefix=f"{API_VERSION_PREFIX}")
+app.include_router(cache_router, prefix=f"{API_VERSION_PREFIX}")
+app.include_router(db_router, prefix=f"{API_VERSION_PREFIX}")
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 from urllib.parse import urljoin
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,6 +19,16 @@ class AppConfig(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_HOST: str
+    POSTGRES_REPLICA_HOSTS: str = ""
+
+    # Connection pool settings
+    DB_POOL_MIN_SIZE: int = 4
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_MAX_IDLE: float = 600.0
+    DB_POOL_MAX_LIFETIME: float = 3600.0
+    DB_POOL_TIMEOUT: float = 60.0
+    DB_REPLICA_STICKY_SECONDS: float = 2.0
+    DB_PREPARED_MAX: int = 256
 
     # pgAdmin settings
     PGADMIN_DEFAULT_EMAIL: str
@@ -64,6 +75,30 @@ class AppConfig(BaseSettings):
     # Token settings
     ACTIVATION_TOKEN_VALID_DAYS: int = 7
 
+    # Catalog listing settings
+    CATALOG_COUNT_STRATEGY: Literal["exact", "capped", "estimated"] = "exact"
+    CATALOG_COUNT_LIMIT: int = 10000
+    CATALOG_HTTP_MAX_AGE: int = 60
+    CATALOG_VERSION_TTL: int = 5
+    CATALOG_PRODUCT_CACHE_SIZE: int = 10000
+    CATALOG_PRODUCT_CACHE_TTL: int = 600
+    CATALOG_PRODUCT_NOT_FOUND_TTL: int = 60
+    CATALOG_BATCH_MAX_SIZE: int = 100
+    CATALOG_EXPORT_BATCH_SIZE: int = 2000
+    CATALOG_SNAPSHOT_ENABLED: bool = True
+    CATALOG_SNAPSHOT_RELOAD_DELAY: float = 1.0
+    CATALOG_QUERY_SHAPE_CACHE_SIZE: int = 512
+
+    # Cache invalidation settings
+    CACHE_INVALIDATION_ENABLED: bool = True
+
+    # Cache settings
+    CACHE_L1_MAX_SIZE: int = 1024
+    CACHE_DEFAULT_TTL: int = 3600
+    CACHE_L2_BACKEND: Literal["none", "redis", "sqlite"] = "none"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_SQLITE_PATH: str = ":memory:"
+
     model_config = SettingsConfigDict(
         env_file=str(BASE_DIR / ".env"),
         env_file_encoding="utf-8"
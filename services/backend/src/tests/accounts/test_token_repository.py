@@ -0,0 +1,18 @@
+import asyncio
+
+from apps.accounts.repositories.token import TokenRepository
+from db.query_builder import SQLQueryBuilder
+from tests.fakes import RecordingDAO
+
+
+def test_expired_tokens_of_every_table_are_deleted_in_one_batch():
+    dao = RecordingDAO([(2,)])
+    repository = TokenRepository(dao, SQLQueryBuilder("accounts_activation_tokens"))
+
+    assert asyncio.run(repository.delete_expired_tokens()) == 6
+
+    [batch] = dao.batches
+    assert [query.split("DELETE FROM ")[1].split()[0] for query, _ in batch] == [
+        "accounts_activation_tokens", "accounts_password_reset_tokens", "accounts_refresh_tokens"
+    ]
+    assert dao.queries == []
@@ -0,0 +1,28 @@
+import asyncio
+from datetime import datetime
+
+from apps.accounts.repositories.user import UserRepository
+from db.query_builder import SQLQueryBuilder
+from tests.fakes import RecordingDAO
+
+USER_ROW = (7, "user@example.com", True, datetime(2026, 1, 1), datetime(2026, 1, 2), 1, "user", "$argon2id$hash")
+
+
+def test_user_and_hashed_password_come_from_one_select():
+    dao = RecordingDAO([USER_ROW])
+    repository = UserRepository(dao, SQLQueryBuilder("accounts_users"))
+
+    user, hashed_password = asyncio.run(repository.get_user_and_hashed_password_by_email("user@example.com"))
+
+    [(query, params, _)] = dao.queries
+    assert dao.batches == []
+    assert "u.hashed_password" in query and "u.email = %s" in query
+    assert params == ["user@example.com"]
+    assert (user.id, user.email, user.group_name) == (7, "user@example.com", "user")
+    assert hashed_password == "$argon2id$hash"
+
+
+def test_unknown_email_has_neither_user_nor_password():
+    repository = UserRepository(RecordingDAO(), SQLQueryBuilder("accounts_users"))
+
+    assert asyncio.run(repository.get_user_and_hashed_password_by_email("nobody@example.com")) == (None, None)
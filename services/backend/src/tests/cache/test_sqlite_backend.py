@@ -0,0 +1,40 @@
+import asyncio
+
+from cache.backends import SQLiteCacheBackend
+
+
+def _count_rows(backend: SQLiteCacheBackend) -> int:
+    return backend._connection.execute("SELECT count(*) FROM cache_entries").fetchone()[0]
+
+
+def test_expired_entries_are_not_returned():
+    backend = SQLiteCacheBackend(":memory:")
+
+    async def scenario():
+        await backend.set("fresh", b"1", ttl=60)
+        await backend.set("stale", b"2", ttl=-1)
+        return await backend.get("fresh"), await backend.get("stale")
+
+    assert asyncio.run(scenario()) == (b"1", None)
+
+
+def test_writes_purge_expired_entries():
+    backend = SQLiteCacheBackend(":memory:", purge_interval=0)
+
+    async def scenario():
+        await backend.set("stale", b"1", ttl=-1)
+        await backend.set("fresh", b"2", ttl=60)
+
+    asyncio.run(scenario())
+    assert _count_rows(backend) == 1
+
+
+def test_expired_entries_are_kept_until_the_interval_elapses():
+    backend = SQLiteCacheBackend(":memory:", purge_interval=3600)
+
+    async def scenario():
+        await backend.set("stale", b"1", ttl=-1)
+        await backend.set("fresh", b"2", ttl=60)
+
+    asyncio.run(scenario())
+    assert _count_rows(backend) == 2
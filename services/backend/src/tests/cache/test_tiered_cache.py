@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from cache.backends import SQLiteCacheBackend
+from cache.tiered import TieredCache
+
+
+def _cache() -> TieredCache:
+    return TieredCache("products", max_size=10, default_ttl=60, backend=SQLiteCacheBackend(":memory:"))
+
+
+@pytest.mark.parametrize("invalidated_key", ["id:7", None])
+def test_invalidation_during_a_load_keeps_its_result_out_of_the_cache(invalidated_key):
+    cache = _cache()
+    versions = iter(["old", "new"])
+
+    async def scenario():
+        loading, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_loader():
+            loading.set()
+            await release.wait()
+            return next(versions)
+
+        load = asyncio.create_task(cache.get_or_set("id:7", slow_loader))
+        await loading.wait()
+        await cache.invalidate(invalidated_key)
+        release.set()
+
+        stale = await load
+        cached = await cache.get("id:7")
+        reloaded = await cache.get_or_set("id:7", slow_loader)
+        return stale, cached, reloaded
+
+    assert asyncio.run(scenario()) == ("old", None, "new")
+    assert cache.get_stats().stale_loads == 1
+
+
+def test_load_after_invalidation_does_not_join_the_stale_load():
+    cache = _cache()
+
+    async def scenario():
+        loading, release = asyncio.Event(), asyncio.Event()
+
+        async def stale_loader():
+            loading.set()
+            await release.wait()
+            return "old"
+
+        async def fresh_loader():
+            return "new"
+
+        stale = asyncio.create_task(cache.get_or_set("id:7", stale_loader))
+        await loading.wait()
+        await cache.invalidate("id:7")
+        fresh = await asyncio.wait_for(cache.get_or_set("id:7", fresh_loader), timeout=1)
+        release.set()
+        return await stale, fresh, await cache.get("id:7")
+
+    assert asyncio.run(scenario()) == ("old", "new", "new")
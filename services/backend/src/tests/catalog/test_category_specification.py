@@ -0,0 +1,18 @@
+import pytest
+
+from apps.catalog.factories import create_category_specification
+
+
+@pytest.mark.parametrize("ids, sql, params", [
+    ((1,), "WHERE catalog_products.master_category_id = %s", [1]),
+    ((1, 2), "WHERE catalog_products.sub_category_id = %s", [2]),
+    ((1, 2, 3), "WHERE catalog_products.article_type_id = %s", [3]),
+])
+def test_resolved_category_filters_on_its_most_specific_key(ids, sql, params):
+    assert create_category_specification(*ids, article_type_ids=[3, 4]).to_sql() == (sql, params)
+
+
+def test_unresolved_category_filters_on_every_given_key():
+    assert create_category_specification(1, 2).to_sql() == (
+        "WHERE catalog_products.master_category_id = %s AND catalog_products.sub_category_id = %s", [1, 2]
+    )
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from apps.catalog.dto.catalog import CursorDTO
+from apps.catalog.factories import (
+    create_category_specification,
+    create_ordering_specification,
+    create_pagination_specification,
+    create_product_filter_specification,
+    create_search_specification
+)
+from apps.catalog.repositories.product import ProductRepository
+from apps.catalog.specifications.exceptions import InvalidCursorError
+from apps.catalog.specifications.pagination import decode_cursor, encode_cursor
+from db.query_builder import SQLQueryBuilder
+from tests.fakes import RecordingDAO
+
+PER_PAGE = 2
+
+# product_id, gender, year, product_display_name, image_url, slug, id, search_rank
+ROWS = [(1000 + id, "Men", 2012, f"Product {id}", "", f"product-{id}", id, 0.5) for id in (9, 8, 7)]
+
+
+def get_page(cursor=None, ordering="-year", **specs):
+    repository = ProductRepository(RecordingDAO(ROWS), SQLQueryBuilder("catalog_products"))
+    category_spec = specs.pop("category_spec", None)
+    pagination_spec = create_pagination_specification(1, PER_PAGE, cursor)
+    ordering_spec = create_ordering_specification(ordering)
+
+    if category_spec:
+        return asyncio.run(repository.get_products_with_specifications_by_categories(
+            category_spec, pagination_spec, ordering_spec, **specs
+        ))
+    return asyncio.run(repository.get_products_with_specifications(pagination_spec, ordering_spec, **specs))
+
+
+@pytest.mark.parametrize("issued, requested", [
+    (dict(search_spec=create_search_specification("shirt")), dict(search_spec=create_search_specification("jeans"))),
+    (dict(search_spec=create_search_specification("shirt")), dict()),
+    (
+        dict(filter_spec=create_product_filter_specification(gender="men")),
+        dict(filter_spec=create_product_filter_specification(gender="women"))
+    ),
+    (
+        dict(filter_spec=create_product_filter_specification(min_year=2010)),
+        dict(filter_spec=create_product_filter_specification(min_year=2015))
+    ),
+    (dict(category_spec=create_category_specification(1, article_type_ids=[3, 4])), dict()),
+    (
+        dict(category_spec=create_category_specification(1, article_type_ids=[3, 4])),
+        dict(category_spec=create_category_specification(1, 2, article_type_ids=[3]))
+    ),
+])
+def test_cursor_is_rejected_for_other_search_filters_or_category(issued, requested):
+    cursor = get_page(**issued).next_cursor
+
+    with pytest.raises(InvalidCursorError, match="does not match"):
+        get_page(cursor, **requested)
+
+
+def test_cursor_continues_the_listing_it_was_issued_for():
+    specs = dict(
+        search_spec=create_search_specification("shirt"),
+        filter_spec=create_product_filter_specification(gender="men", min_year=2010)
+    )
+    cursor = get_page(**specs).next_cursor
+
+    assert decode_cursor(cursor).values == [0.5, 2012, 8]
+    assert [product.product_id for product in get_page(cursor, **specs).products] == [1009, 1008]
+
+
+def test_cursor_is_rejected_for_another_ordering():
+    cursor = get_page(ordering="-year").next_cursor
+
+    with pytest.raises(InvalidCursorError, match="ordering"):
+        get_page(cursor, ordering="year")
+
+
+def test_cursor_without_scope_is_rejected():
+    cursor = encode_cursor(CursorDTO(ordering=["-year", "-id"], values=[2012, 8]))
+
+    with pytest.raises(InvalidCursorError):
+        get_page(cursor)
+
+
+def test_cursor_round_trips_null_values_and_scope():
+    cursor = CursorDTO(ordering=["year", "-id"], values=[None, 8], scope="0123456789abcdef")
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+@pytest.mark.parametrize("payload", [
+    CursorDTO(ordering=["-id"], values=["8"]),
+    CursorDTO(ordering=["-year", "-id"], values=[2012]),
+    CursorDTO(ordering=["-id"], values=[True]),
+])
+def test_malformed_cursor_is_rejected(payload):
+    with pytest.raises(InvalidCursorError, match="Invalid pagination cursor"):
+        decode_cursor(encode_cursor(payload))
+
+
+class OrderedSet(set):
+    """Set iterating in insertion order, standing in for another PYTHONHASHSEED's iteration order"""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self._order = list(items)
+
+    def __iter__(self):
+        return iter(self._order)
+
+
+def test_cursor_scope_does_not_depend_on_gender_iteration_order():
+    repository = ProductRepository(RecordingDAO(ROWS), SQLQueryBuilder("catalog_products"))
+    scopes = []
+    for genders in (["Men", "Women", "Unisex"], ["Unisex", "Women", "Men"]):
+        filter_spec = create_product_filter_specification(gender="men,women,unisex")
+        filter_spec._genders = OrderedSet(genders)
+        fragments = repository._get_spec_fragments(filter_spec, None, None)
+        scopes.append(repository._get_cursor_scope(fragments))
+
+    assert scopes[0] == scopes[1]
@@ -0,0 +1,101 @@
+import asyncio
+
+from apps.catalog.factories import (
+    create_category_specification,
+    create_product_filter_specification,
+    create_search_specification
+)
+from apps.catalog.repositories.product import ProductRepository
+from db.query_builder import SQLQueryBuilder
+from db.query_cache import QueryShapeCache
+from tests.fakes import RecordingDAO
+
+
+def _facets(repository: ProductRepository, **specs):
+    asyncio.run(repository._get_facets(**specs))
+    return repository._dao.queries[-1]
+
+
+def test_facet_queries_are_compiled_once_per_shape_and_prepared():
+    query_cache = QueryShapeCache()
+    repository = ProductRepository(RecordingDAO(), SQLQueryBuilder("catalog_products"), query_cache=query_cache)
+
+    first_query, first_params, options = _facets(
+        repository,
+        search_spec=create_search_specification("shirt"),
+        filter_spec=create_product_filter_specification(min_year=2012, gender="men")
+    )
+    second_query, second_params, _ = _facets(
+        repository,
+        search_spec=create_search_specification("jeans"),
+        filter_spec=create_product_filter_specification(min_year=2015, gender="women")
+    )
+
+    assert len(query_cache) == 1
+    assert options == {"prepare": True}
+    assert second_query == first_query
+    assert first_params[-1] == "shirt" and second_params[-1] == "jeans"
+    assert first_params[:2] == [2012, "Men"] and second_params[:2] == [2015, "Women"]
+
+
+def test_facet_selections_count_under_the_other_facets_predicates():
+    repository = ProductRepository(RecordingDAO(), SQLQueryBuilder("catalog_products"))
+
+    query, params, _ = _facets(
+        repository,
+        category_spec=create_category_specification(1),
+        filter_spec=create_product_filter_specification(min_year=2012, gender="men")
+    )
+
+    # Whole selection, then the selection without gender and without year; colour, season and usage are unset
+    assert "COUNT(*) FILTER (WHERE year >= %s AND gender IN (%s)), COUNT(*) FILTER (WHERE year >= %s)," \
+           " COUNT(*) FILTER (WHERE gender IN (%s))" in query
+    assert "GROUP BY GROUPING SETS ((), (gender), (year), (base_colour.name), (season.name), (usage_type.name))" \
+           in query
+    assert params == [2012, "Men", 2012, "Men", 2012, "Men", 2012, "Men", 2012, "Men", 1]
+
+
+def test_different_filter_sets_compile_different_shapes():
+    query_cache = QueryShapeCache()
+    repository = ProductRepository(RecordingDAO(), SQLQueryBuilder("catalog_products"), query_cache=query_cache)
+
+    _facets(repository)
+    _facets(repository, filter_spec=create_product_filter_specification(min_year=2012))
+    _facets(repository, category_spec=create_category_specification(1, 2))
+
+    assert len(query_cache) == 3
+
+
+def test_category_facets_are_read_from_the_view_by_column_name():
+    # facet_grouping sets the bit of every facet a row is not grouped by: 31 is the total, 15 gender, 23 year
+    rows = [
+        {"facet_grouping": 31, "gender": None, "year": None, "colour": None, "season": None, "usage": None,
+         "product_count": 5},
+        {"facet_grouping": 15, "gender": "Men", "year": None, "colour": None, "season": None, "usage": None,
+         "product_count": 3},
+        {"facet_grouping": 15, "gender": "Women", "year": None, "colour": None, "season": None, "usage": None,
+         "product_count": 2},
+        {"facet_grouping": 23, "gender": None, "year": 2012, "colour": None, "season": None, "usage": None,
+         "product_count": 5},
+        {"facet_grouping": 27, "gender": None, "year": None, "colour": "Blue", "season": None, "usage": None,
+         "product_count": 4},
+    ]
+    query_cache = QueryShapeCache()
+    repository = ProductRepository(RecordingDAO(rows), SQLQueryBuilder("catalog_products"), query_cache=query_cache)
+
+    filters = asyncio.run(repository._get_category_facets(create_category_specification(1, 2)))
+    asyncio.run(repository._get_category_facets(create_category_specification(3, 4)))
+    (query, params, options), (second_query, second_params, _) = repository._dao.queries
+
+    assert query == (
+        "SELECT facet_grouping, gender, year, colour, season, usage, SUM(product_count) AS product_count"
+        " FROM catalog_category_facets WHERE master_category_id = %s AND sub_category_id = %s"
+        " GROUP BY facet_grouping, gender, year, colour, season, usage"
+    )
+    assert second_query == query and len(query_cache) == 1
+    assert params == [1, 2] and second_params == [3, 4]
+    assert options == {"as_dict": True, "prepare": True}
+    assert filters.total_items == 5
+    assert filters.gender.counts == {"Men": 3, "Women": 2}
+    assert filters.year.counts == {2012: 5}
+    assert filters.colour.counts == {"Blue": 4}
@@ -0,0 +1,91 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from apps.catalog.factories import create_ordering_specification, create_pagination_specification
+from apps.catalog.repositories.product import ProductRepository
+from db.query_builder import SQLQueryBuilder
+from tests.fakes import SQLiteDAO
+
+# Years with ties and NULLs (the ETL stores unknown years as NULL) spread over the id range
+YEARS = [2012, None, 2015, 2012, None, 2010, 2015, 2011, None, 2012, 2010, 2016, None, 2013, 2012, 2011, None]
+
+
+@pytest.fixture
+def repository():
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        "CREATE TABLE catalog_products (id INTEGER PRIMARY KEY, product_id INTEGER, gender TEXT, year INTEGER,"
+        " product_display_name TEXT, image_url TEXT, slug TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO catalog_products VALUES (?, ?, 'Men', ?, ?, '', ?)",
+        [(id, 1000 + id, year, f"Product {id}", f"product-{id}") for id, year in enumerate(YEARS, start=1)]
+    )
+    return ProductRepository(SQLiteDAO(connection), SQLQueryBuilder("catalog_products"))
+
+
+def expected_ids(ordering):
+    """Ids in the repository's ordering: NULL years last ascending and first descending, id tiebreaker"""
+    rows = list(enumerate(YEARS, start=1))
+    fields = ordering.split(",")
+    if "id" not in [field.lstrip("-") for field in fields]:
+        fields.append("-id")
+    for field in reversed(fields):
+        descending, name = field.startswith("-"), field.lstrip("-")
+        if name == "id":
+            rows.sort(key=lambda row: row[0], reverse=descending)
+        else:
+            # NULLs after every year ascending, reversed into first place descending
+            rows.sort(key=lambda row: (row[1] is None, row[1] or 0), reverse=descending)
+    return [id for id, _ in rows]
+
+
+async def page_through(repository, ordering, per_page):
+    ordering_spec = create_ordering_specification(ordering)
+    page = await repository.get_products_with_specifications(create_pagination_specification(1, per_page), ordering_spec)
+    ids = [product.product_id - 1000 for product in page.products]
+
+    while page.next_cursor:
+        pagination_spec = create_pagination_specification(1, per_page, page.next_cursor)
+        page = await repository.get_products_with_specifications(pagination_spec, ordering_spec)
+        ids.extend(product.product_id - 1000 for product in page.products)
+    return ids
+
+
+@pytest.mark.parametrize("ordering", ["-year", "year", "year,-id", "-year,id", "-id", "id", "id,year"])
+@pytest.mark.parametrize("per_page", [1, 2, 3, 5])
+def test_keyset_pages_reach_every_row_including_null_years(repository, ordering, per_page):
+    assert asyncio.run(page_through(repository, ordering, per_page)) == expected_ids(ordering)
+
+
+def test_null_years_are_returned_as_none(repository):
+    page = asyncio.run(repository.get_products_with_specifications(
+        create_pagination_specification(1, 5), create_ordering_specification("-year")
+    ))
+    assert [product.year for product in page.products] == [None] * 5
+
+
+def test_descending_keyset_after_set_year_uses_row_comparison(repository):
+    asyncio.run(page_through(repository, "-year", 4))
+    keyset_queries = [query for query, _ in repository._dao.queries if "OFFSET" not in query]
+
+    assert any("(year, id) < (%s, %s)" in query for query in keyset_queries)
+    assert any("year IS NOT NULL" in query for query in keyset_queries)
+    assert all("ORDER BY year DESC NULLS FIRST, id DESC" in query for query in keyset_queries)
+
+
+def test_keyset_queries_are_compiled_per_null_pattern(repository):
+    asyncio.run(page_through(repository, "year", 2))
+    keyset_queries = {query for query, _ in repository._dao.queries if "OFFSET" not in query}
+
+    # Ascending: a set year cursor also selects the NULL years, a NULL year cursor only ties on NULL
+    assert keyset_queries == {
+        "SELECT product_id, gender, year, product_display_name, image_url, slug, id FROM catalog_products"
+        " WHERE (((year > %s OR year IS NULL)) OR (year = %s AND id < %s))"
+        " ORDER BY year ASC NULLS LAST, id DESC LIMIT %s",
+        "SELECT product_id, gender, year, product_display_name, image_url, slug, id FROM catalog_products"
+        " WHERE ((year IS NULL AND id < %s))"
+        " ORDER BY year ASC NULLS LAST, id DESC LIMIT %s",
+    }
@@ -0,0 +1,115 @@
+import asyncio
+
+from apps.catalog.enums.facet import FacetEnum
+from apps.catalog.factories import (
+    create_category_specification,
+    create_product_filter_specification,
+    create_search_specification
+)
+from apps.catalog.repositories.product import ProductRepository
+from apps.catalog.snapshot import CatalogSnapshot, CatalogSnapshotManager
+from db.query_builder import SQLQueryBuilder
+from tests.fakes import RecordingDAO
+
+# gender, year, master_category_id, sub_category_id, article_type_id, base_colour_id, season_id, usage_type_id
+PRODUCTS = [
+    ("Men", 2012, 1, 10, 100, 1, 1, 1),
+    ("Men", 2013, 1, 10, 101, 2, 1, 1),
+    ("Women", 2012, 1, 11, 110, 1, 2, None),
+    ("Women", None, 2, 20, 200, 2, 2, 1),
+    ("Unisex", 2015, 2, 20, 200, None, None, None),
+]
+NAMES = {
+    FacetEnum.COLOUR: {1: "Black", 2: "White"},
+    FacetEnum.SEASON: {1: "Summer", 2: "Winter"},
+    FacetEnum.USAGE: {1: "Casual"},
+}
+
+
+class SnapshotDAO:
+    """DAO answering the snapshot batch with PRODUCTS and NAMES, counting loads"""
+
+    def __init__(self):
+        self.loads = 0
+        self.consistent_reads = 0
+
+    async def execute_batch(self, queries, consistent_read=False):
+        self.loads += 1
+        self.consistent_reads += consistent_read
+        await asyncio.sleep(0)
+        return [list(PRODUCTS), *(list(NAMES[facet].items()) for facet in FacetEnum.lookup_facets())]
+
+
+def test_counts_apply_category_and_filter_predicates():
+    snapshot = CatalogSnapshot.from_rows(PRODUCTS, NAMES)
+
+    assert snapshot.count() == 5
+    assert snapshot.count(category_spec=create_category_specification(1)) == 3
+    assert snapshot.count(create_product_filter_specification(min_year=2013)) == 2
+    assert snapshot.count(create_product_filter_specification(gender="men,women", colour="black")) == 2
+    assert snapshot.count(
+        create_product_filter_specification(max_year=2012), create_category_specification(1, 11)
+    ) == 1
+
+
+def test_facets_count_each_value_as_if_it_were_ticked():
+    snapshot = CatalogSnapshot.from_rows(PRODUCTS, NAMES)
+
+    facets = snapshot.get_facets(create_product_filter_specification(gender="men"), create_category_specification(1))
+
+    assert facets.total_items == 2
+    assert facets.gender.counts == {"Men": 2, "Women": 1}
+    assert facets.year.counts == {2012: 1, 2013: 1}
+    assert facets.colour.counts == {"Black": 1, "White": 1}
+    assert facets.usage.counts == {"Casual": 2}
+
+
+def test_facets_of_an_empty_category_are_none():
+    snapshot = CatalogSnapshot.from_rows(PRODUCTS, NAMES)
+
+    assert snapshot.get_facets(category_spec=create_category_specification(3)) is None
+
+
+def test_invalidations_during_the_reload_delay_share_one_load():
+    dao = SnapshotDAO()
+    manager = CatalogSnapshotManager(dao, reload_delay=0.05)
+
+    async def scenario():
+        for _ in range(10):
+            manager.invalidate("id:1")
+        assert manager.get_snapshot() is None
+        await asyncio.sleep(0.2)
+        return manager.get_snapshot()
+
+    snapshot = asyncio.run(scenario())
+    assert dao.loads == dao.consistent_reads == 1
+    assert len(snapshot) == 5
+
+
+def test_invalidation_during_a_load_triggers_one_more_load():
+    dao = SnapshotDAO()
+    manager = CatalogSnapshotManager(dao)
+
+    async def scenario():
+        manager.invalidate()
+        await asyncio.sleep(0)
+        manager.invalidate()
+        manager.invalidate()
+        await asyncio.sleep(0.05)
+        return manager.get_snapshot()
+
+    assert asyncio.run(scenario()) is not None
+    assert dao.loads == 2
+
+
+def test_repository_counts_from_the_snapshot_and_searches_in_sql():
+    manager = CatalogSnapshotManager(SnapshotDAO())
+    sql_dao = RecordingDAO([(7,)])
+    repository = ProductRepository(sql_dao, SQLQueryBuilder("catalog_products"), snapshot_manager=manager)
+    asyncio.run(manager.load())
+
+    assert asyncio.run(repository.get_products_count(create_product_filter_specification(gender="women"))) == 2
+    assert sql_dao.queries == []
+
+    asyncio.run(repository.get_products_count(search_spec=create_search_specification("shirt")))
+    assert len(sql_dao.queries) == 1
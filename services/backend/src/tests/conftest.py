@@ -0,0 +1,40 @@
+"""Test configuration: settings for the modules under test, no services are contacted."""
+
+import os
+import tempfile
+
+# Required settings without defaults, the real values come from .env in deployments
+for name, value in {
+    "POSTGRES_DB": "clothing_store",
+    "POSTGRES_DB_PORT": "5432",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_HOST": "localhost",
+    "PGADMIN_DEFAULT_EMAIL": "admin@example.com",
+    "PGADMIN_DEFAULT_PASSWORD": "admin",
+    "DATASET_DIR": tempfile.gettempdir(),
+    "LOG_DIR": tempfile.mkdtemp(prefix="clothing-store-tests-"),
+    "FRONTEND_CORS_ORIGINS": "http://localhost:5000",
+    "ELASTICSEARCH_HOST": "localhost",
+    "ELASTICSEARCH_PORT": "9200",
+    "ELASTICSEARCH_USER": "elastic",
+    "ELASTICSEARCH_PASSWORD": "elastic",
+    "ELASTICSEARCH_SCHEME": "http",
+    "ELASTICSEARCH_PRODUCTS_INDEX": "products",
+    "EMAIL_HOST": "localhost",
+    "EMAIL_PORT": "1025",
+    "EMAIL_HOST_USER": "",
+    "EMAIL_HOST_PASSWORD": "",
+    "EMAIL_USE_TLS": "False",
+    "EMAIL_USE_SSL": "False",
+    "JWT_SECRET_KEY_ACCESS": "access-secret",
+    "JWT_SECRET_KEY_REFRESH": "refresh-secret",
+    "JWT_SIGNING_ALGORITHM": "HS256",
+    "JWT_ACCESS_TOKEN_EXPIRE_MINUTES": "15",
+    "JWT_REFRESH_TOKEN_EXPIRE_MINUTES": "10080",
+    "GOOGLE_CLIENT_ID": "",
+    "GOOGLE_CLIENT_SECRET": "",
+    "FACEBOOK_CLIENT_ID": "",
+    "FACEBOOK_CLIENT_SECRET": "",
+}.items():
+    os.environ.setdefault(name, value)
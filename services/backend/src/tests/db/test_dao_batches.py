@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from db.dao import PostgreSQLDAO
+from db.dto import BatchQueryDTO
+from tests.fakes import FakePool
+
+
+def test_batches_run_in_one_pipeline_on_one_connection():
+    primary, replica = FakePool("primary"), FakePool("replica")
+    dao = PostgreSQLDAO(primary, replica)
+
+    results = asyncio.run(dao.execute_batch([
+        BatchQueryDTO("SELECT 1", fetch_one=True),
+        BatchQueryDTO("SELECT 2"),
+    ]))
+
+    assert results == [("replica",), [("replica",)]]
+    [connection] = replica.connections
+    assert connection.pipelines == 1
+    assert replica.queries == ["SELECT 1", "SELECT 2"]
+
+
+def test_batches_with_a_write_run_on_the_primary():
+    primary, replica = FakePool("primary"), FakePool("replica")
+    dao = PostgreSQLDAO(primary, replica)
+
+    asyncio.run(dao.execute_batch([
+        BatchQueryDTO("SELECT 1"),
+        BatchQueryDTO("DELETE FROM accounts_refresh_tokens", fetch=False),
+    ]))
+
+    assert primary.queries == ["SELECT 1", "DELETE FROM accounts_refresh_tokens"]
+    assert replica.queries == []
+
+
+def test_empty_batches_take_no_connection():
+    primary = FakePool("primary")
+
+    assert asyncio.run(PostgreSQLDAO(primary).execute_batch([])) == []
+    assert primary.connections == []
+
+
+def test_consistent_read_batches_read_one_snapshot():
+    primary, replica = FakePool("primary"), FakePool("replica")
+    dao = PostgreSQLDAO(primary, replica)
+
+    results = asyncio.run(dao.execute_batch([BatchQueryDTO("SELECT 1"), BatchQueryDTO("SELECT 2")], consistent_read=True))
+
+    assert results == [[("replica",)], [("replica",)]]
+    assert replica.queries == [PostgreSQLDAO.CONSISTENT_READ_QUERY, "SELECT 1", "SELECT 2"]
+
+
+def test_consistent_read_batches_reject_writes():
+    dao = PostgreSQLDAO(FakePool("primary"))
+
+    with pytest.raises(ValueError):
+        asyncio.run(dao.execute_batch([BatchQueryDTO("DELETE FROM accounts_refresh_tokens")], consistent_read=True))
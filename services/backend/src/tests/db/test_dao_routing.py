@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from db.dao import PostgreSQLDAO
+from tests.fakes import FakePool
+
+
+def _read(dao: PostgreSQLDAO) -> str:
+    """Run a read and get the name of the pool that answered it"""
+    return asyncio.run(dao.execute("SELECT 1", fetch_one=True))[0]
+
+
+@pytest.mark.parametrize("query, is_read", [
+    ("SELECT * FROM catalog_products", True),
+    ("  with t AS (SELECT 1) SELECT * FROM t", True),
+    ("SELECT * FROM catalog_products FOR UPDATE", False),
+    ("WITH moved AS (DELETE FROM a RETURNING *) SELECT * FROM moved", False),
+    ("SELECT pg_notify('cache_invalidation', 'x')", False),
+    ("UPDATE catalog_products SET year = 2012", False),
+])
+def test_only_plain_reads_may_run_on_a_replica(query, is_read):
+    assert PostgreSQLDAO._is_read_query(query) is is_read
+
+
+def test_reads_go_to_the_replica_and_writes_to_the_primary():
+    primary, replica = FakePool("primary"), FakePool("replica")
+    dao = PostgreSQLDAO(primary, replica)
+
+    assert _read(dao) == "replica"
+    asyncio.run(dao.execute("UPDATE catalog_products SET year = 2012", fetch=False))
+
+    assert primary.queries == ["UPDATE catalog_products SET year = 2012"]
+    assert replica.queries == ["SELECT 1"]
+
+
+def test_reads_use_the_primary_without_a_read_pool():
+    assert _read(PostgreSQLDAO(FakePool("primary"))) == "primary"
+
+
+def test_a_task_reads_its_own_writes_from_the_primary():
+    dao = PostgreSQLDAO(FakePool("primary"), FakePool("replica"), sticky_seconds=60)
+
+    async def write_then_read():
+        await dao.execute("DELETE FROM catalog_products", fetch=False)
+        return (await dao.execute("SELECT 1", fetch_one=True))[0]
+
+    async def scenario():
+        writer = await asyncio.create_task(write_then_read())
+        other = (await asyncio.create_task(dao.execute("SELECT 1", fetch_one=True)))[0]
+        return writer, other
+
+    assert asyncio.run(scenario()) == ("primary", "replica")
+
+
+def test_invalidations_pin_reads_of_every_task_to_the_primary():
+    dao = PostgreSQLDAO(FakePool("primary"), FakePool("replica"), sticky_seconds=60)
+
+    dao.mark_primary_reads()
+
+    assert _read(dao) == "primary"
+
+
+def test_reads_leave_the_primary_once_the_sticky_window_ends():
+    dao = PostgreSQLDAO(FakePool("primary"), FakePool("replica"), sticky_seconds=0)
+
+    dao.mark_primary_reads()
+
+    assert _read(dao) == "replica"
+
+
+def test_failed_replica_reads_are_retried_on_the_primary():
+    primary = FakePool("primary")
+    dao = PostgreSQLDAO(primary, FakePool("replica", failing=True))
+
+    assert _read(dao) == "primary"
+    assert primary.queries == ["SELECT 1"]
@@ -0,0 +1,51 @@
+import asyncio
+
+from db.dao import PostgreSQLDAO
+from tests.fakes import FakePool
+
+
+def test_transactions_run_every_query_on_their_primary_connection():
+    primary, replica = FakePool("primary"), FakePool("replica")
+    dao = PostgreSQLDAO(primary, replica, sticky_seconds=60)
+
+    async def scenario():
+        await dao.begin_transaction()
+        connection = dao.current_connection
+        row = await dao.execute("SELECT 1", fetch_one=True)
+        await dao.execute("UPDATE catalog_products SET year = 2012", fetch=False)
+        await dao.commit_transaction()
+        return connection, row, dao.current_connection
+
+    connection, row, after_commit = asyncio.run(scenario())
+
+    assert row == ("primary",)
+    assert replica.queries == []
+    assert connection.outcomes == ["commit"]
+    assert after_commit is None
+    assert primary.checked_out == 0
+
+
+def test_concurrent_tasks_get_their_own_transactions():
+    primary = FakePool("primary")
+    dao = PostgreSQLDAO(primary)
+
+    async def transaction(rollback: bool):
+        await dao.begin_transaction()
+        connection = dao.current_connection
+        await asyncio.sleep(0)
+        if rollback:
+            await dao.rollback_transaction()
+        else:
+            await dao.commit_transaction()
+        return connection
+
+    async def scenario():
+        return await asyncio.gather(transaction(rollback=False), transaction(rollback=True))
+
+    committed, rolled_back = asyncio.run(scenario())
+
+    assert committed is not rolled_back
+    assert committed.outcomes == ["commit"]
+    assert rolled_back.outcomes == ["rollback"]
+    assert primary.checked_out == 0
+
@@ -0,0 +1,54 @@
+import asyncio
+import json
+
+from db.invalidation import DEFAULT_CHANNEL, InvalidationTopic, PostgresInvalidationBus, notify_invalidation
+
+
+class FakeCursor:
+    def __init__(self, row):
+        self._row = row
+
+    async def fetchone(self):
+        return self._row
+
+
+class SettingsConnection:
+    """Connection answering the settings lookups, with or without the migration 010 table"""
+
+    def __init__(self, channel=None):
+        self._channel = channel
+        self.queries = []
+
+    async def execute(self, query, params=None):
+        self.queries.append((query, list(params or [])))
+        if query.startswith("SELECT to_regclass"):
+            return FakeCursor(("cache_invalidation_settings",) if self._channel else (None,))
+        if "FROM cache_invalidation_settings" in query:
+            return FakeCursor((self._channel,))
+        return FakeCursor(None)
+
+
+def test_notifications_use_the_channel_of_the_settings_row():
+    connection = SettingsConnection("catalog_changes")
+
+    asyncio.run(notify_invalidation(connection, InvalidationTopic.PRODUCT, "id:7"))
+
+    query, (channel, payload) = connection.queries[-1]
+    assert query == "SELECT pg_notify(%s, %s)"
+    assert channel == "catalog_changes"
+    assert json.loads(payload) == {"topic": "product", "key": "id:7"}
+
+
+def test_notifications_fall_back_to_the_default_channel_without_the_settings_table():
+    connection = SettingsConnection()
+
+    asyncio.run(notify_invalidation(connection, InvalidationTopic.ALL))
+
+    assert not any("FROM cache_invalidation_settings" in query for query, _ in connection.queries)
+    assert connection.queries[-1][1][0] == DEFAULT_CHANNEL
+
+
+def test_payloads_parse_into_topic_and_key():
+    assert PostgresInvalidationBus._parse_payload('{"topic": "product", "key": "slug:a"}') == ("product", "slug:a")
+    assert PostgresInvalidationBus._parse_payload('{"topic": "products", "key": null}') == ("products", None)
+    assert PostgresInvalidationBus._parse_payload("facets") == ("facets", None)
@@ -0,0 +1,135 @@
+"""Fake DAOs for repository tests and fake connection pools for DAO tests."""
+
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional, Tuple
+
+from psycopg import OperationalError
+
+
+class SQLiteDAO:
+    """DAO running the repository's SQL on an in-memory SQLite database, recording every query"""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        self.queries: List[Tuple[str, List[Any]]] = []
+
+    async def execute(
+            self,
+            query: str,
+            params: Optional[List[Any]] = None,
+            fetch: bool = True,
+            fetch_one: bool = False,
+            **kwargs: Any
+    ) -> Any:
+        self.queries.append((query, list(params or [])))
+        cursor = self._connection.execute(query.replace("%s", "?"), list(params or []))
+        if not fetch:
+            return None
+        return cursor.fetchone() if fetch_one else cursor.fetchall()
+
+    async def stream(self, query: str, params: Optional[List[Any]] = None, batch_size: int = 100) -> AsyncIterator:
+        for row in await self.execute(query, params):
+            yield row
+
+
+class RecordingDAO:
+    """DAO returning canned rows for every query, recording the queries, their execute options and batches"""
+
+    def __init__(self, rows: Optional[List[Tuple]] = None):
+        self._rows = rows or []
+        self.queries: List[Tuple[str, List[Any], dict]] = []
+        self.batches: List[List[Tuple[str, List[Any]]]] = []
+
+    async def execute(self, query: str, params: Optional[List[Any]] = None, fetch_one: bool = False, **kwargs: Any):
+        self.queries.append((query, list(params or []), kwargs))
+        if fetch_one:
+            return self._rows[0] if self._rows else None
+        return list(self._rows)
+
+    async def execute_batch(self, queries: List[Any], consistent_read: bool = False) -> List[Any]:
+        self.batches.append([(query.query, list(query.params or [])) for query in queries])
+        return [self._rows[0] if query.fetch_one and self._rows else list(self._rows) for query in queries]
+
+
+class FakeCursor:
+    """Cursor recording its queries on the connection, returning one row"""
+
+    def __init__(self, connection: 'FakeConnection'):
+        self._connection = connection
+        self.description = [("column",)]
+
+    async def __aenter__(self) -> 'FakeCursor':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+    async def execute(self, query: str, params: Optional[List[Any]] = None, prepare: Optional[bool] = None) -> None:
+        if self._connection.pool.failing:
+            raise OperationalError(f"{self._connection.pool.name} is down")
+        self._connection.pool.queries.append(query)
+
+    async def fetchall(self) -> List[Tuple]:
+        return [(self._connection.pool.name,)]
+
+    async def fetchone(self) -> Tuple:
+        return (self._connection.pool.name,)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeTransaction:
+    """Transaction recording how it ended on its connection"""
+
+    def __init__(self, connection: 'FakeConnection'):
+        self._connection = connection
+
+    async def __aenter__(self) -> 'FakeTransaction':
+        return self
+
+    async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self._connection.outcomes.append("rollback" if exc_type else "commit")
+
+
+class FakeConnection:
+    def __init__(self, pool: 'FakePool'):
+        self.pool = pool
+        self.outcomes: List[str] = []
+        self.pipelines = 0
+
+    def cursor(self, row_factory: Any = None) -> FakeCursor:
+        return FakeCursor(self)
+
+    def transaction(self) -> FakeTransaction:
+        return FakeTransaction(self)
+
+    @asynccontextmanager
+    async def pipeline(self):
+        self.pipelines += 1
+        yield
+
+    async def set_isolation_level(self, isolation_level: Any) -> None:
+        pass
+
+
+class FakePool:
+    """Pool handing out a new connection per checkout, recording queries and checkouts"""
+
+    def __init__(self, name: str, failing: bool = False):
+        self.name = name
+        self.failing = failing
+        self.queries: List[str] = []
+        self.connections: List[FakeConnection] = []
+        self.checked_out = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        connection = FakeConnection(self)
+        self.connections.append(connection)
+        self.checked_out += 1
+        try:
+            yield connection
+        finally:
+            self.checked_out -= 1
@@ -0,0 +1,17 @@
+#!/bin/bash
+set -e
+
+# Clone the primary on first start, -R writes primary_conninfo and standby.signal
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+  echo "Cloning primary ${PRIMARY_HOST}:${PRIMARY_PORT} into $PGDATA..."
+  export PGPASSWORD="$POSTGRES_PASSWORD"
+  until pg_basebackup -h "$PRIMARY_HOST" -p "$PRIMARY_PORT" -U "$POSTGRES_USER" -D "$PGDATA" -X stream -R -P; do
+    echo "Primary not ready, retrying in 2s..."
+    rm -rf "${PGDATA:?}"/*
+    sleep 2
+  done
+  chmod 0700 "$PGDATA"
+fi
+
+# Run as a hot standby streaming from the primary
+exec postgres -c hot_standby=on